@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class AssembledBatch:
+    """
+    Represents a model-ready batch of frames, with all images and targets packed into contiguous arrays.
+
+    Attributes:
+        images (np.ndarray): the images of the batch as a contiguous uint8 array of shape (N, C, H, W)
+        targets (np.ndarray): the targets as a float32 array of shape (N, max_boxes, 5) in the format
+            [cls, cx, cy, w, h], padded with -1 for frames with fewer boxes than max_boxes
+    """
+    images: np.ndarray
+    targets: np.ndarray
+
+    def __len__(self) -> int:
+        return self.images.shape[0]
+
+    def __repr__(self) -> str:
+        return f"AssembledBatch(images={self.images.shape}, targets={self.targets.shape})"
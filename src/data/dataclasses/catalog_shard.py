@@ -0,0 +1,53 @@
+import zlib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CatalogShard:
+    """
+    Represents one of several disjoint shards of the video catalog, assigning each video to a shard by a stable hash.
+
+    Attributes:
+        index (int): the index of the shard
+        count (int): the total number of shards
+    """
+    index: int = 0
+    count: int = 1
+
+    def __post_init__(self):
+        if self.count < 1:
+            raise ValueError("count must be greater than 0")
+
+        if not 0 <= self.index < self.count:
+            raise ValueError(f"index must be in range [0, {self.count}), got {self.index}")
+
+    def contains(self, key: str) -> bool:
+        """
+        Checks whether a video belongs to the shard.
+
+        Args:
+            key (str): the id of the video
+
+        Returns:
+            bool: True if the video belongs to the shard, False otherwise
+        """
+        return zlib.crc32(key.encode("utf-8")) % self.count == self.index
+
+    def split(self, index: int, count: int) -> "CatalogShard":
+        """
+        Splits the shard further into disjoint sub-shards.
+
+        Args:
+            index (int): the index of the sub-shard
+            count (int): the number of sub-shards
+
+        Returns:
+            CatalogShard: the sub-shard, containing only videos of this shard
+        """
+        if not 0 <= index < count:
+            raise ValueError(f"index must be in range [0, {count}), got {index}")
+
+        return CatalogShard(index=self.index + self.count * index, count=self.count * count)
+
+    def __repr__(self) -> str:
+        return f"CatalogShard({self.index}/{self.count})"
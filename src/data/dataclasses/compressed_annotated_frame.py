@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import List, Tuple
 
 from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.data.dataclasses.frame_codec import FrameCodec
 from src.data.dataclasses.source_metadata import SourceMetadata
 
 
@@ -17,6 +18,7 @@ class CompressedAnnotatedFrame:
         shape (Tuple[int, int, int]): the shape of the frame
         dtype (str): the data type of the frame
         annotations (List[AnnotatedBBox]): the annotations associated with the frame
+        codec (FrameCodec): the codec the frame data is encoded with, defaults to zlib
     """
     source: SourceMetadata
     index: int
@@ -24,6 +26,7 @@ class CompressedAnnotatedFrame:
     shape: Tuple[int, int, int]
     dtype: str
     annotations: List[AnnotatedBBox]
+    codec: FrameCodec = FrameCodec.ZLIB
 
     def __repr__(self) -> str:
         return f"CompressedAnnotatedFrame(source={self.source.source_id}, index={self.index}, num_annotations={len(self.annotations)})"
\ No newline at end of file
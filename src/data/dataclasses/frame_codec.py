@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class FrameCodec(Enum):
+    """Codecs for encoding frames sent over the network."""
+    RAW = "raw"
+    ZLIB = "zlib"
+    JPEG = "jpeg"
+    WEBP = "webp"
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import Optional, Dict, Tuple
+
+from src.data.dataclasses.frame_codec import FrameCodec
+
+# valid level ranges for codecs that accept a level
+LEVEL_RANGES: Dict[FrameCodec, Tuple[int, int]] = {
+    FrameCodec.ZLIB: (-1, 9),
+    FrameCodec.JPEG: (0, 100),
+    FrameCodec.WEBP: (1, 100)
+}
+
+
+@dataclass(frozen=True)
+class FrameEncoding:
+    """
+    Represents the encoding of frames negotiated for a stream.
+
+    Attributes:
+        codec (FrameCodec): the codec to encode frames with
+        level (Optional[int]): the compression level for zlib or the quality for JPEG and WebP, None for codec default
+    """
+    codec: FrameCodec = FrameCodec.ZLIB
+    level: Optional[int] = None
+
+    def __post_init__(self):
+        if self.level is None:
+            return
+
+        if self.codec not in LEVEL_RANGES:
+            raise ValueError(f"Codec {self.codec} does not accept a level")
+
+        low, high = LEVEL_RANGES[self.codec]
+        if not low <= self.level <= high:
+            raise ValueError(f"Level for codec {self.codec} must be in range [{low}, {high}], got {self.level}")
+
+    @property
+    def is_lossy(self) -> bool:
+        """Whether the encoding loses information."""
+        return self.codec in (FrameCodec.JPEG, FrameCodec.WEBP)
+
+    def __repr__(self) -> str:
+        return f"FrameEncoding(codec={self.codec.value}, level={self.level})"
@@ -0,0 +1,39 @@
+from typing import Optional, Union
+
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.assembled_batch import AssembledBatch
+from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.data.processing.batch_assembler import BatchAssembler
+
+
+class AssemblingStream(ClosableStream[AssembledBatch]):
+    """Stream assembling instances read from another stream into model-ready batches."""
+
+    def __init__(self, stream: ClosableStream[Union[AnnotatedFrame, CompressedAnnotatedFrame]], batch_size: int,
+                 assembler: BatchAssembler):
+        """
+        Initializes an AssemblingStream instance.
+
+        Args:
+            stream (ClosableStream[Union[AnnotatedFrame, CompressedAnnotatedFrame]]): stream to read instances from
+            batch_size (int): the number of instances per batch
+            assembler (BatchAssembler): assembler for packing instances into model-ready batches
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+
+        self._stream = stream
+        self._batch_size = batch_size
+        self._assembler = assembler
+
+    def read(self) -> Optional[AssembledBatch]:
+        instances = self._stream.read_many(self._batch_size)
+        if not instances:
+            return None
+
+        return self._assembler.process(instances)
+
+    def close(self) -> None:
+        self._stream.close()
+        self._assembler.close()
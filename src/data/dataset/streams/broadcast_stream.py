@@ -0,0 +1,27 @@
+from typing import TypeVar, Generic, Optional
+
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.data.structures.broadcast_buffer import BroadcastBuffer
+
+# stream data type
+T = TypeVar("T")
+
+
+class BroadcastStream(Generic[T], ClosableStream[T]):
+    """Stream reading its own cursor over a broadcast buffer shared with other streams."""
+
+    def __init__(self, buffer: BroadcastBuffer[T]):
+        """
+        Initializes a BroadcastStream instance.
+
+        Args:
+            buffer (BroadcastBuffer[T]): the buffer to read from
+        """
+        self._buffer = buffer
+        self._cursor = buffer.subscribe()
+
+    def read(self) -> Optional[T]:
+        return self._buffer.read(self._cursor)
+
+    def close(self) -> None:
+        self._buffer.unsubscribe(self._cursor)
@@ -1,11 +1,13 @@
 import queue
 import threading
-from typing import TypeVar, Generic, Optional
+import time
+from typing import TypeVar, Generic, Optional, List
 
 from src.data.dataset.streams.writable_stream import WritableStream
 from src.data.pipeline.consumer import Consumer
 from src.data.pipeline.consuming_queue import ConsumingQueue
 from src.data.structures.atomic_bool import AtomicBool
+from src.data.structures.queue_drainer import QueueDrainer
 
 T = TypeVar("T")
 
@@ -53,6 +55,38 @@ class DockStream(Generic[T], WritableStream[T]):
 
         return result
 
+    def read_many(self, n: int, timeout: Optional[float] = None) -> List[T]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        result = []
+
+        try:
+            while len(result) < n and not self._eos:
+                if self._current_dock is None:
+                    self._current_dock = self._dock_queue.get(timeout=self._remaining(deadline))
+                    if self._current_dock is None:
+                        self._eos = True
+                        continue
+
+                instances, dock_ended = QueueDrainer.drain(
+                    self._current_dock, n - len(result), timeout=self._remaining(deadline)
+                )
+                result.extend(instances)
+
+                if dock_ended:
+                    self._current_dock = None
+                elif len(result) < n:
+                    break
+
+        except queue.Empty:
+            pass
+
+        return result
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        """Returns the number of seconds left until the deadline, or None if there is no deadline."""
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+
     def get_consumer(self, release: Optional[AtomicBool] = None) -> Optional[Consumer[T]]:
         dock = None
 
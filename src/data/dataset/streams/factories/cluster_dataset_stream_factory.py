@@ -0,0 +1,61 @@
+from typing import TypeVar, Generic, Optional, Union, List
+
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.dataset.dataset_split import DatasetSplit
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.data.dataset.streams.factories.stream_factory import ClosableStreamFactory
+from src.data.dataset.streams.merging_stream import MergingStream
+from src.data.dataset.streams.pipeline_stream import PipelineStream
+from src.data.dataset.streams.shard_stream import ShardStream
+from src.data.pipeline.pipeline_builder import PipelineBuilder
+from src.network.client.node_coordinator import NodeCoordinator
+
+# stream data type
+T = TypeVar("T")
+
+# sink input data type
+B = TypeVar("B")
+
+
+class ClusterDatasetStreamFactory(Generic[T], ClosableStreamFactory[T]):
+    """Factory for creating dataset streams pulling concurrently from a cluster of data server nodes."""
+
+    def __init__(self, server_ips: List[str], split: DatasetSplit,
+                 pipeline: PipelineBuilder[Union[AnnotatedFrame, CompressedAnnotatedFrame], B],
+                 encoding: Optional[FrameEncoding] = None, buffer_size: int = 10):
+        """
+        Initializes a ClusterDatasetStreamFactory instance.
+
+        Args:
+            server_ips (List[str]): the addresses of the data server nodes, as 'ip' or 'ip:port'
+            split (DatasetSplit): the dataset split to get stream for
+            pipeline (PipelineBuilder[T]): the data processing pipeline
+            encoding (Optional[FrameEncoding]): the frame encoding to request, None for the server default
+            buffer_size (int): the number of instances to buffer across all nodes
+        """
+        self._server_ips = server_ips
+        self._split = split
+        self._pipeline = pipeline
+        self._encoding = encoding
+        self._buffer_size = buffer_size
+
+    def create_stream(self) -> ClosableStream[T]:
+        coordinator = NodeCoordinator(self._server_ips)
+        shard_streams = [
+            ShardStream(
+                coordinator=coordinator,
+                shard_index=index,
+                split=self._split,
+                data_type=(AnnotatedFrame, CompressedAnnotatedFrame),
+                encoding=self._encoding
+            )
+            for index in range(coordinator.n_shards())
+        ]
+
+        merging_stream = MergingStream(shard_streams, buffer_size=self._buffer_size)
+        stream = PipelineStream(source=merging_stream, pipeline=self._pipeline)
+
+        merging_stream.run()
+        return stream
@@ -0,0 +1,69 @@
+from typing import Optional
+
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.assembled_batch import AssembledBatch
+from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.dataset.dataset_split import DatasetSplit
+from src.data.dataset.streams.assembling_stream import AssemblingStream
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.data.dataset.streams.factories.stream_factory import ClosableStreamFactory
+from src.data.dataset.streams.network_stream import NetworkStream
+from src.data.dataset.streams.prefetcher import Prefetcher
+from src.data.processing.batch_assembler import BatchAssembler
+from src.network.client.resumable_network_client import ResumableNetworkClient
+from src.network.client.simple_network_client import SimpleNetworkClient
+from src.network.messages.serialization.pickle_message_deserializer import PickleMessageDeserializer
+from src.network.messages.serialization.pickle_message_serializer import PickleMessageSerializer
+
+
+class NetworkAssemblingStreamFactory(ClosableStreamFactory[AssembledBatch]):
+    """Factory for creating streams of batches assembled on the client, decoding frames on a thread pool."""
+
+    def __init__(self, server_ip: str, split: DatasetSplit, batch_size: int, n_workers: int = 4, buffer_size: int = 4,
+                 encoding: Optional[FrameEncoding] = None, rank: int = 0, world_size: int = 1):
+        """
+        Initializes a NetworkAssemblingStreamFactory instance.
+
+        Args:
+            server_ip (str): the server ip address
+            split (DatasetSplit): the dataset split to get stream for
+            batch_size (int): the number of instances per batch
+            n_workers (int): the number of threads decoding frames into each batch, defaults to 4
+            buffer_size (int): the number of assembled batches to prefetch, defaults to 4
+            encoding (Optional[FrameEncoding]): the frame encoding to request, None for the server default
+            rank (int): the rank of the client in distributed training, defaults to 0
+            world_size (int): the total number of ranks in distributed training, defaults to 1
+        """
+        self._server_ip = server_ip
+        self._split = split
+        self._batch_size = batch_size
+        self._n_workers = n_workers
+        self._buffer_size = buffer_size
+        self._encoding = encoding
+        self._rank = rank
+        self._world_size = world_size
+
+    def create_stream(self) -> ClosableStream[AssembledBatch]:
+        client = ResumableNetworkClient(SimpleNetworkClient(PickleMessageSerializer(), PickleMessageDeserializer()))
+        client.connect(self._server_ip)
+
+        network_stream = NetworkStream(
+            client=client,
+            split=self._split,
+            data_type=(AnnotatedFrame, CompressedAnnotatedFrame),
+            encoding=self._encoding,
+            rank=self._rank,
+            world_size=self._world_size
+        )
+        instance_prefetcher = Prefetcher(network_stream, buffer_size=2 * self._batch_size, fetch_size=self._batch_size)
+        assembling_stream = AssemblingStream(
+            stream=instance_prefetcher,
+            batch_size=self._batch_size,
+            assembler=BatchAssembler(n_workers=self._n_workers)
+        )
+        batch_prefetcher = Prefetcher(assembling_stream, buffer_size=self._buffer_size)
+
+        instance_prefetcher.run()
+        batch_prefetcher.run()
+        return batch_prefetcher
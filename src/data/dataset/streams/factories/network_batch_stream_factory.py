@@ -0,0 +1,50 @@
+from typing import Optional
+
+from src.data.dataclasses.assembled_batch import AssembledBatch
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.dataset.dataset_split import DatasetSplit
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.data.dataset.streams.factories.stream_factory import ClosableStreamFactory
+from src.data.dataset.streams.network_batch_stream import NetworkBatchStream
+from src.data.dataset.streams.prefetcher import Prefetcher
+from src.network.client.resumable_network_client import ResumableNetworkClient
+from src.network.client.simple_network_client import SimpleNetworkClient
+from src.network.messages.serialization.pickle_message_deserializer import PickleMessageDeserializer
+from src.network.messages.serialization.pickle_message_serializer import PickleMessageSerializer
+
+
+class NetworkBatchStreamFactory(ClosableStreamFactory[AssembledBatch]):
+    """Factory for creating streams of server-assembled batches."""
+
+    def __init__(self, server_ip: str, split: DatasetSplit, batch_size: int, buffer_size: int = 4,
+                 encoding: Optional[FrameEncoding] = None, rank: int = 0, world_size: int = 1):
+        """
+        Initializes a NetworkBatchStreamFactory instance.
+
+        Args:
+            server_ip (str): the server ip address
+            split (DatasetSplit): the dataset split to get stream for
+            batch_size (int): the number of instances per batch
+            buffer_size (int): the number of batches to prefetch, defaults to 4
+            encoding (Optional[FrameEncoding]): the frame encoding to request, None for the server default
+            rank (int): the rank of the client in distributed training, defaults to 0
+            world_size (int): the total number of ranks in distributed training, defaults to 1
+        """
+        self._server_ip = server_ip
+        self._split = split
+        self._batch_size = batch_size
+        self._buffer_size = buffer_size
+        self._encoding = encoding
+        self._rank = rank
+        self._world_size = world_size
+
+    def create_stream(self) -> ClosableStream[AssembledBatch]:
+        client = ResumableNetworkClient(SimpleNetworkClient(PickleMessageSerializer(), PickleMessageDeserializer()))
+        client.connect(self._server_ip)
+
+        batch_stream = NetworkBatchStream(client=client, split=self._split, batch_size=self._batch_size,
+                                          encoding=self._encoding, rank=self._rank, world_size=self._world_size)
+        prefetcher = Prefetcher(batch_stream, buffer_size=self._buffer_size)
+
+        prefetcher.run()
+        return prefetcher
@@ -1,16 +1,18 @@
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Optional
 
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.catalog_shard import CatalogShard
 from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
+from src.data.dataclasses.frame_encoding import FrameEncoding
 from src.data.dataset.dataset_split import DatasetSplit
 from src.data.dataset.streams.closable_stream import ClosableStream
 from src.data.dataset.streams.factories.stream_factory import ClosableStreamFactory
 from src.data.dataset.streams.network_stream import NetworkStream
 from src.data.dataset.streams.pipeline_stream import PipelineStream
 from src.data.dataset.streams.prefetcher import Prefetcher
-from src.data.pipeline.pipeline import Pipeline
 from src.data.pipeline.pipeline_builder import PipelineBuilder
-from src.data.pipeline.preprocessor import Preprocessor
-from src.data.processing.zlib_decompressor import ZlibDecompressor
+from src.data.processing.frame_decoder import FrameDecoder
+from src.network.client.resumable_network_client import ResumableNetworkClient
 from src.network.client.simple_network_client import SimpleNetworkClient
 from src.network.messages.serialization.pickle_message_deserializer import PickleMessageDeserializer
 from src.network.messages.serialization.pickle_message_serializer import PickleMessageSerializer
@@ -25,25 +27,57 @@ B = TypeVar("B")
 class NetworkDatasetStreamFactory(Generic[T], ClosableStreamFactory[T]):
     """Factory for creating network dataset streams."""
 
-    def __init__(self, server_ip: str, split: DatasetSplit, pipeline: PipelineBuilder[CompressedAnnotatedFrame, B]):
+    def __init__(self, server_ip: str, split: DatasetSplit,
+                 pipeline: PipelineBuilder[AnnotatedFrame, B],
+                 encoding: Optional[FrameEncoding] = None, rank: int = 0, world_size: int = 1, fetch_size: int = 16,
+                 n_workers: int = 1, ordered: bool = True, shard: Optional[CatalogShard] = None):
         """
         Initializes a NetworkDatasetStreamFactory instance.
 
         Args:
             server_ip (str): the server ip address
             split (DatasetSplit): the dataset split to get stream for
-            pipeline (PipelineBuilder[T]): the data processing pipeline
+            pipeline (PipelineBuilder[AnnotatedFrame, B]): the data processing pipeline, receiving decoded frames
+            encoding (Optional[FrameEncoding]): the frame encoding to request, None for the server default
+            rank (int): the rank of the client in distributed training, defaults to 0
+            world_size (int): the total number of ranks in distributed training, defaults to 1
+            fetch_size (int): the number of instances to fetch from the server with each request, defaults to 16
+            n_workers (int): the number of prefetch workers fetching and decoding frames, defaults to 1
+            ordered (bool): whether to keep the order of instances across prefetch workers, defaults to True
+            shard (Optional[CatalogShard]): the shard of the catalog to stream, None for the whole catalog
         """
         self._server_ip = server_ip
         self._split = split
         self._pipeline = pipeline
+        self._encoding = encoding
+        self._rank = rank
+        self._world_size = world_size
+        self._fetch_size = fetch_size
+        self._n_workers = n_workers
+        self._ordered = ordered
+        self._shard = shard
 
     def create_stream(self) -> ClosableStream[T]:
-        client = SimpleNetworkClient(PickleMessageSerializer(), PickleMessageDeserializer())
+        client = ResumableNetworkClient(SimpleNetworkClient(PickleMessageSerializer(), PickleMessageDeserializer()))
         client.connect(self._server_ip)
 
-        network_stream = NetworkStream(client=client, split=self._split, data_type=CompressedAnnotatedFrame)
-        prefetcher = Prefetcher(network_stream)
+        network_stream = NetworkStream(
+            client=client,
+            split=self._split,
+            data_type=(AnnotatedFrame, CompressedAnnotatedFrame),
+            encoding=self._encoding,
+            shard=self._shard,
+            rank=self._rank,
+            world_size=self._world_size
+        )
+        prefetcher = Prefetcher(
+            network_stream,
+            buffer_size=2 * self._fetch_size * self._n_workers,
+            fetch_size=self._fetch_size,
+            n_workers=self._n_workers,
+            ordered=self._ordered,
+            processor=FrameDecoder()
+        )
         stream = PipelineStream(source=prefetcher, pipeline=self._pipeline)
 
         prefetcher.run()
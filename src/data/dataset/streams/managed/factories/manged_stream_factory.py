@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Optional
 
+from src.data.dataclasses.catalog_shard import CatalogShard
+from src.data.dataclasses.frame_encoding import FrameEncoding
 from src.data.dataset.streams.managed.managed_stream import ManagedStream
 
 T = TypeVar("T")
@@ -9,10 +11,15 @@ class ManagedStreamFactory(Generic[T], ABC):
     """Interface for managed streams factories."""
 
     @abstractmethod
-    def create_stream(self) -> ManagedStream[T]:
+    def create_stream(self, encoding: Optional[FrameEncoding] = None,
+                      shard: Optional[CatalogShard] = None) -> ManagedStream[T]:
         """
         Creates a data stream.
 
+        Args:
+            encoding (Optional[FrameEncoding]): optional encoding for the frames of the stream, using the factory default if None
+            shard (Optional[CatalogShard]): optional shard of the catalog to restrict the stream to, all videos if None
+
         Returns:
             ManagedStream: the created data stream
         """
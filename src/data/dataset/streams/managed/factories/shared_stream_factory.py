@@ -0,0 +1,50 @@
+import threading
+from typing import TypeVar, Generic, Optional, Dict, Tuple
+
+from src.data.dataclasses.catalog_shard import CatalogShard
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.dataset.streams.managed.factories.manged_stream_factory import ManagedStreamFactory
+from src.data.dataset.streams.managed.managed_stream import ManagedStream
+from src.data.dataset.streams.managed.shared_managed_stream import SharedManagedStream
+from src.data.dataset.streams.managed.shared_stream_source import SharedStreamSource
+
+T = TypeVar("T")
+
+
+class SharedStreamFactory(Generic[T], ManagedStreamFactory[T]):
+    """
+    Factory for creating streams that share a single underlying stream between sessions.
+
+    Only suitable for deterministic splits, where every session is expected to see the same sequence of instances.
+    Sessions joining after the shared stream has evicted instances get a fresh underlying stream instead.
+    """
+
+    def __init__(self, stream_factory: ManagedStreamFactory[T], lag_window: int = 1000):
+        """
+        Initializes a SharedStreamFactory instance.
+
+        Args:
+            stream_factory (ManagedStreamFactory[T]): factory for creating the underlying streams
+            lag_window (int): the maximum number of instances the fastest session can be ahead of the slowest one,
+                defaults to 1000
+        """
+        self._stream_factory = stream_factory
+        self._lag_window = lag_window
+
+        self._sources: Dict[Tuple[Optional[FrameEncoding], Optional[CatalogShard]], SharedStreamSource[T]] = {}
+        self._lock = threading.Lock()
+
+    def create_stream(self, encoding: Optional[FrameEncoding] = None,
+                      shard: Optional[CatalogShard] = None) -> ManagedStream[T]:
+        key = (encoding, shard)
+
+        with self._lock:
+            source = self._sources.get(key)
+            if source is None or not source.is_joinable():
+                source = SharedStreamSource[T](
+                    stream=self._stream_factory.create_stream(encoding=encoding, shard=shard),
+                    lag_window=self._lag_window
+                )
+                self._sources[key] = source
+
+            return SharedManagedStream[T](stream=source.create_reader(), source=source)
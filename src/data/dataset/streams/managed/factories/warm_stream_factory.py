@@ -0,0 +1,110 @@
+import threading
+from collections import deque
+from typing import TypeVar, Generic, Optional, Dict, Deque, Iterable
+
+from src.data.dataclasses.catalog_shard import CatalogShard
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.dataset.streams.managed.factories.manged_stream_factory import ManagedStreamFactory
+from src.data.dataset.streams.managed.managed_stream import ManagedStream
+from src.data.dataset.streams.managed.warm_managed_stream import WarmManagedStream
+
+T = TypeVar("T")
+
+
+class WarmStreamFactory(Generic[T], ManagedStreamFactory[T]):
+    """Factory keeping a number of streams built and running ahead of demand, so they can be handed out instantly."""
+
+    def __init__(self, stream_factory: ManagedStreamFactory[T], n_warm: int = 1,
+                 encodings: Iterable[Optional[FrameEncoding]] = (None,)):
+        """
+        Initializes a WarmStreamFactory instance.
+
+        Args:
+            stream_factory (ManagedStreamFactory[T]): factory for creating the underlying streams
+            n_warm (int): the number of warm streams to keep per encoding, defaults to 1
+            encodings (Iterable[Optional[FrameEncoding]]): the encodings to keep warm streams for,
+                defaults to only the factory default encoding
+        """
+        if n_warm < 1:
+            raise ValueError("n_warm must be greater than 0")
+
+        self._stream_factory = stream_factory
+        self._n_warm = n_warm
+        self._encodings = list(encodings)
+
+        self._warm_streams: Dict[Optional[FrameEncoding], Deque[WarmManagedStream[T]]] = {
+            encoding: deque() for encoding in self._encodings
+        }
+        self._running = False
+        self._lock = threading.Lock()
+
+    def run(self) -> None:
+        """Starts warming the initial streams in the background."""
+        with self._lock:
+            if self._running:
+                raise RuntimeError("WarmStreamFactory is already running")
+            self._running = True
+
+        for encoding in self._encodings:
+            for _ in range(self._n_warm):
+                self._warm_in_background(encoding)
+
+    def stop(self) -> None:
+        """Stops all warm streams that have not been handed out."""
+        with self._lock:
+            self._running = False
+            unclaimed = [stream for streams in self._warm_streams.values() for stream in streams]
+            for streams in self._warm_streams.values():
+                streams.clear()
+
+        for stream in unclaimed:
+            stream.stop()
+
+    def create_stream(self, encoding: Optional[FrameEncoding] = None,
+                      shard: Optional[CatalogShard] = None) -> ManagedStream[T]:
+        stream = None
+
+        with self._lock:
+            warm_streams = self._warm_streams.get(encoding)
+            if self._running and shard is None and warm_streams:
+                stream = warm_streams.popleft()
+
+        if stream is None:
+            return self._stream_factory.create_stream(encoding=encoding, shard=shard)
+
+        self._warm_in_background(encoding)
+        return stream
+
+    def n_warm_streams(self, encoding: Optional[FrameEncoding] = None) -> int:
+        """
+        Returns the number of warm streams ready to be handed out.
+
+        Args:
+            encoding (Optional[FrameEncoding]): the encoding of the streams
+
+        Returns:
+            int: the number of warm streams
+        """
+        with self._lock:
+            return len(self._warm_streams.get(encoding, ()))
+
+    def _warm_in_background(self, encoding: Optional[FrameEncoding]) -> None:
+        """Builds and starts a stream on a background thread, adding it to the warm streams once running."""
+        threading.Thread(target=self._warm, args=(encoding,), daemon=True).start()
+
+    def _warm(self, encoding: Optional[FrameEncoding]) -> None:
+        """Builds and starts a stream, adding it to the warm streams."""
+        try:
+            stream = WarmManagedStream[T](self._stream_factory.create_stream(encoding=encoding))
+            stream.run()
+        except Exception as e:
+            print(f"[WarmStreamFactory] Failed to warm stream: {e}")
+            return
+
+        with self._lock:
+            keep = self._running
+            if keep:
+                self._warm_streams[encoding].append(stream)
+
+        if not keep:
+            stream.stop()
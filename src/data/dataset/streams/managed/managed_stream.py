@@ -1,4 +1,4 @@
-from typing import Optional, Generic, TypeVar
+from typing import Optional, Generic, TypeVar, List
 
 from src.data.dataset.streams.stream import Stream
 from src.data.streaming.managers.streamer_manager import StreamerManager
@@ -22,6 +22,9 @@ class ManagedStream(Generic[T], Stream[T], StreamerManager):
     def read(self) -> Optional[T]:
         return self._stream.read()
 
+    def read_many(self, n: int, timeout: Optional[float] = None) -> List[T]:
+        return self._stream.read_many(n, timeout=timeout)
+
     def run(self) -> None:
         self._manager.run()
 
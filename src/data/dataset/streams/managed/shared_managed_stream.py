@@ -0,0 +1,27 @@
+from typing import TypeVar, Generic
+
+from src.data.dataset.streams.broadcast_stream import BroadcastStream
+from src.data.dataset.streams.managed.managed_stream import ManagedStream
+from src.data.dataset.streams.managed.shared_stream_source import SharedStreamSource
+
+T = TypeVar("T")
+
+
+class SharedManagedStream(Generic[T], ManagedStream[T]):
+    """Managed stream reading its own cursor over a stream shared with other sessions."""
+
+    def __init__(self, stream: BroadcastStream[T], source: SharedStreamSource[T]):
+        """
+        Initializes a SharedManagedStream instance.
+
+        Args:
+            stream (BroadcastStream[T]): the reader of the shared stream
+            source (SharedStreamSource[T]): the source of the shared stream
+        """
+        super().__init__(stream=stream, manager=source)
+        self._reader = stream
+        self._source = source
+
+    def stop(self) -> None:
+        self._reader.close()
+        self._source.release()
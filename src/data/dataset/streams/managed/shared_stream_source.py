@@ -0,0 +1,99 @@
+import threading
+from typing import TypeVar, Generic
+
+from src.data.dataset.streams.broadcast_stream import BroadcastStream
+from src.data.dataset.streams.managed.managed_stream import ManagedStream
+from src.data.streaming.managers.streamer_manager import StreamerManager
+from src.data.structures.broadcast_buffer import BroadcastBuffer
+
+# stream data type
+T = TypeVar("T")
+
+
+class SharedStreamSource(Generic[T], StreamerManager):
+    """Single managed stream whose instances are broadcast to several readers."""
+
+    def __init__(self, stream: ManagedStream[T], lag_window: int = 1000):
+        """
+        Initializes a SharedStreamSource instance.
+
+        Args:
+            stream (ManagedStream[T]): the managed stream to share
+            lag_window (int): the maximum number of instances the fastest reader can be ahead of the slowest one,
+                defaults to 1000
+        """
+        self._stream = stream
+        self._buffer = BroadcastBuffer[T](lag_window=lag_window)
+
+        self._thread = None
+        self._running = False
+        self._stopped = False
+        self._lock = threading.Lock()
+
+    def create_reader(self) -> BroadcastStream[T]:
+        """
+        Creates a new reader of the shared stream, starting at the oldest buffered instance.
+
+        Returns:
+            BroadcastStream[T]: the reader
+        """
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Cannot create reader for a stopped shared stream")
+
+            return BroadcastStream[T](self._buffer)
+
+    def release(self) -> None:
+        """Stops the shared stream once no readers are left."""
+        with self._lock:
+            if self._buffer.n_subscribers() == 0:
+                self._stop()
+
+    def is_joinable(self) -> bool:
+        """
+        Checks whether new readers will see every instance of the stream.
+
+        Returns:
+            bool: True if no instance has been evicted and the source is not stopped, False otherwise
+        """
+        with self._lock:
+            return not self._stopped and self._buffer.is_pristine()
+
+    def run(self) -> None:
+        with self._lock:
+            if self._running or self._stopped:
+                return
+
+            self._running = True
+            self._stream.run()
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+
+    def _worker(self) -> None:
+        """Worker function moving instances from the shared stream into the broadcast buffer."""
+        try:
+            instance = self._stream.read()
+            while instance is not None and self._buffer.write(instance):
+                instance = self._stream.read()
+        finally:
+            self._buffer.close()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stop()
+
+    def _stop(self) -> None:
+        """Stops the shared stream, assuming the lock is held."""
+        if self._stopped:
+            return
+
+        self._stopped = True
+        self._buffer.close()
+
+        if self._running:
+            self._stream.stop()
+            self._thread.join()
+            self._thread = None
+
+    def n_active_streamers(self) -> int:
+        return self._stream.n_active_streamers()
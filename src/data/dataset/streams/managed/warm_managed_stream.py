@@ -0,0 +1,27 @@
+import threading
+from typing import TypeVar, Generic
+
+from src.data.dataset.streams.managed.managed_stream import ManagedStream
+
+T = TypeVar("T")
+
+
+class WarmManagedStream(Generic[T], ManagedStream[T]):
+    """Managed stream that can be started ahead of being handed out, ignoring later requests to run."""
+
+    def __init__(self, stream: ManagedStream[T]):
+        """
+        Initializes a WarmManagedStream instance.
+
+        Args:
+            stream (ManagedStream[T]): the managed stream to warm
+        """
+        super().__init__(stream=stream, manager=stream)
+        self._started = False
+        self._lock = threading.Lock()
+
+    def run(self) -> None:
+        with self._lock:
+            if not self._started:
+                self._started = True
+                super().run()
@@ -0,0 +1,97 @@
+import queue
+import threading
+from typing import TypeVar, Generic, List, Optional
+
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.data.structures.atomic_bool import AtomicBool
+
+# stream data type
+T = TypeVar("T")
+
+WORKER_LOOP_TIMEOUT = 0.1
+
+# marks the end of one of the merged streams
+_END_OF_STREAM = object()
+
+
+class MergingStream(Generic[T], ClosableStream[T]):
+    """Stream reading several streams concurrently, merging their instances in the order they arrive."""
+
+    def __init__(self, streams: List[ClosableStream[T]], buffer_size: int = 10):
+        """
+        Initializes a MergingStream instance.
+
+        Args:
+            streams (List[ClosableStream[T]]): the streams to merge
+            buffer_size (int): the size of the buffer shared by the streams
+        """
+        if not streams:
+            raise ValueError("streams cannot be empty")
+
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be greater than 0")
+
+        self._streams = streams
+        self._queue: queue.Queue = queue.Queue(maxsize=buffer_size)
+        self._n_active = len(streams)
+
+        self._threads: List[threading.Thread] = []
+        self._run_lock = threading.Lock()
+        self._running = AtomicBool(False)
+
+    def read(self) -> Optional[T]:
+        while self._n_active > 0:
+            item = self._queue.get()
+            if item is not _END_OF_STREAM:
+                return item
+
+            self._n_active -= 1
+
+        return None
+
+    def run(self) -> None:
+        """Starts reading the merged streams."""
+        with self._run_lock:
+            if self._running:
+                raise RuntimeError("MergingStream is already running")
+
+            self._running.set(True)
+            self._threads = [threading.Thread(target=self._worker, args=(stream,)) for stream in self._streams]
+            for thread in self._threads:
+                thread.start()
+
+    def _worker(self, stream: ClosableStream[T]) -> None:
+        """Worker function reading one of the merged streams."""
+        item = None
+
+        try:
+            item = stream.read()
+            while item is not None and self._put(item):
+                item = stream.read()
+
+        except Exception as e:
+            print(f"[MergingStream] Stream failed: {e}")
+
+        finally:
+            self._put(_END_OF_STREAM)
+
+    def _put(self, item: object) -> bool:
+        """Puts an item into the buffer, returning False if the stream was closed while waiting."""
+        while self._running:
+            try:
+                self._queue.put(item, timeout=WORKER_LOOP_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def close(self) -> None:
+        with self._run_lock:
+            self._running.set(False)
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
+
+        for stream in self._streams:
+            stream.close()
@@ -0,0 +1,85 @@
+from typing import Optional
+
+from src.data.dataclasses.assembled_batch import AssembledBatch
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.dataset.dataset_split import DatasetSplit
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.network.client.network_client import NetworkClient
+from src.network.messages.requests.close_stream_request import CloseStreamRequest
+from src.network.messages.requests.get_assembled_batch_request import GetAssembledBatchRequest
+from src.network.messages.requests.open_stream_request import OpenStreamRequest
+from src.network.messages.responses.close_stream_response import CloseStreamResponse
+from src.network.messages.responses.get_assembled_batch_response import GetAssembledBatchResponse
+from src.network.messages.responses.open_stream_response import OpenStreamResponse
+from src.network.messages.responses.response_status import ResponseStatus
+
+
+class NetworkBatchStream(ClosableStream[AssembledBatch]):
+    """Dataset stream that fetches batches assembled into model-ready arrays by a server."""
+
+    def __init__(self, client: NetworkClient, split: DatasetSplit, batch_size: int,
+                 encoding: Optional[FrameEncoding] = None, rank: int = 0, world_size: int = 1):
+        """
+        Initializes a NetworkBatchStream instance.
+
+        Args:
+            client (NetworkClient): network client for sending requests to server
+            split (DatasetSplit): dataset split to get data from
+            batch_size (int): the number of instances per batch
+            encoding (Optional[FrameEncoding]): the frame encoding to request, None for the server default
+            rank (int): the rank of the client in distributed training, defaults to 0
+            world_size (int): the total number of ranks in distributed training, defaults to 1
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+
+        self._client = client
+        self._split = split
+        self._batch_size = batch_size
+        self._encoding = encoding
+        self._rank = rank
+        self._world_size = world_size
+
+        self._stream_open = False
+
+    def read(self) -> Optional[AssembledBatch]:
+        if not self._stream_open:
+            self._open_stream()
+            self._stream_open = True
+
+        request = GetAssembledBatchRequest(split=self._split, batch_size=self._batch_size)
+        response = self._client.send_request(request)
+
+        if not isinstance(response, GetAssembledBatchResponse):
+            raise RuntimeError("Got unexpected response from server")
+
+        if not response.status == ResponseStatus.SUCCESS:
+            raise RuntimeError("Could not read batch from stream")
+
+        return response.batch
+
+    def _open_stream(self) -> None:
+        """Opens the stream."""
+        request = OpenStreamRequest(
+            split=self._split,
+            encoding=self._encoding,
+            rank=self._rank,
+            world_size=self._world_size
+        )
+        response = self._client.send_request(request)
+
+        if not isinstance(response, OpenStreamResponse):
+            raise RuntimeError("Got unexpected response from server")
+
+        if not response.status == ResponseStatus.SUCCESS:
+            raise RuntimeError(f"Could not open stream for split: {self._split}")
+
+    def close(self) -> None:
+        request = CloseStreamRequest(split=self._split)
+        response = self._client.send_request(request)
+
+        if not isinstance(response, CloseStreamResponse):
+            raise RuntimeError("Got unexpected response from server")
+
+        if response.status != ResponseStatus.SUCCESS:
+            raise RuntimeError("Could not close stream")
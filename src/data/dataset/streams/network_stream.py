@@ -1,12 +1,16 @@
-from typing import TypeVar, Optional, Generic
+from typing import TypeVar, Optional, Generic, Union, Tuple, List
 
+from src.data.dataclasses.catalog_shard import CatalogShard
+from src.data.dataclasses.frame_encoding import FrameEncoding
 from src.data.dataset.dataset_split import DatasetSplit
 from src.data.dataset.streams.closable_stream import ClosableStream
 from src.network.client.network_client import NetworkClient
 from src.network.messages.requests.close_stream_request import CloseStreamRequest
+from src.network.messages.requests.get_batch_request import GetBatchRequest
 from src.network.messages.requests.open_stream_request import OpenStreamRequest
 from src.network.messages.requests.read_stream_request import ReadStreamRequest
 from src.network.messages.responses.close_stream_response import CloseStreamResponse
+from src.network.messages.responses.get_batch_response import GetBatchResponse
 from src.network.messages.responses.open_stream_response import OpenStreamResponse
 from src.network.messages.responses.read_stream_response import ReadStreamResponse
 from src.network.messages.responses.response_status import ResponseStatus
@@ -18,18 +22,28 @@ T = TypeVar("T")
 class NetworkStream(Generic[T], ClosableStream[T]):
     """Dataset stream that fetches data from a server."""
 
-    def __init__(self, client: NetworkClient, split: DatasetSplit, data_type: type[T]):
+    def __init__(self, client: NetworkClient, split: DatasetSplit, data_type: Union[type[T], Tuple[type, ...]],
+                 encoding: Optional[FrameEncoding] = None, shard: Optional[CatalogShard] = None, rank: int = 0,
+                 world_size: int = 1):
         """
         Initializes a NetworkStream instance.
 
         Args:
             client (NetworkClient): network client for sending requests to server
             split (DatasetSplit): dataset split to get data from
-            data_type (type[T]): data type
+            data_type (Union[type[T], Tuple[type, ...]]): data type, or tuple of accepted data types
+            encoding (Optional[FrameEncoding]): the frame encoding to request, None for the server default
+            shard (Optional[CatalogShard]): the shard of the catalog to request, None for the whole catalog
+            rank (int): the rank of the client in distributed training, defaults to 0
+            world_size (int): the total number of ranks in distributed training, defaults to 1
         """
         self._client = client
         self._split = split
         self._data_type = data_type
+        self._encoding = encoding
+        self._shard = shard
+        self._rank = rank
+        self._world_size = world_size
 
         self._stream_open = False
 
@@ -52,9 +66,34 @@ class NetworkStream(Generic[T], ClosableStream[T]):
 
         return response.instance
 
+    def read_many(self, n: int, timeout: Optional[float] = None) -> List[T]:
+        if not self._stream_open:
+            self._open_stream()
+            self._stream_open = True
+
+        request = GetBatchRequest(split=self._split, batch_size=n, timeout=timeout)
+        response = self._client.send_request(request)
+
+        if not isinstance(response, GetBatchResponse):
+            raise RuntimeError("Got unexpected response from server")
+
+        if not response.status == ResponseStatus.SUCCESS:
+            raise RuntimeError("Could not read batch from stream")
+
+        if not all(isinstance(instance, self._data_type) for instance in response.batch):
+            raise RuntimeError("Response contains unexpected data type")
+
+        return response.batch
+
     def _open_stream(self) -> None:
         """Opens the stream."""
-        request = OpenStreamRequest(split=self._split)
+        request = OpenStreamRequest(
+            split=self._split,
+            encoding=self._encoding,
+            shard=self._shard,
+            rank=self._rank,
+            world_size=self._world_size
+        )
         response = self._client.send_request(request)
 
         if not isinstance(response, OpenStreamResponse):
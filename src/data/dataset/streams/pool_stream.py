@@ -1,5 +1,5 @@
 from collections import deque
-from typing import TypeVar, Optional, Generic, Deque
+from typing import TypeVar, Optional, Generic, Deque, List
 
 from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
 from src.data.dataset.streams.writable_stream import WritableStream
@@ -38,6 +38,14 @@ class PoolStream(Generic[T], WritableStream[T]):
 
         return instance
 
+    def read_many(self, n: int, timeout: Optional[float] = None) -> List[T]:
+        instances = []
+
+        if not self._closed:
+            instances = self._pool.get_many(n, timeout=timeout)
+
+        return instances
+
     def get_consumer(self, release: Optional[AtomicBool] = None) -> Optional[Consumer[T]]:
         entry = None
 
@@ -1,12 +1,15 @@
 import queue
 import threading
-from typing import TypeVar, List, Optional
+import time
+from typing import TypeVar, List, Optional, Dict
 
 from typing_extensions import Generic
 
 from src.data.dataset.streams.closable_stream import ClosableStream
 from src.data.dataset.streams.stream import Stream
+from src.data.processing.processor import Processor
 from src.data.structures.atomic_bool import AtomicBool
+from src.data.structures.queue_drainer import QueueDrainer
 
 T = TypeVar("T")
 
@@ -14,28 +17,75 @@ T = TypeVar("T")
 WORKER_LOOP_TIMEOUT = 0.1
 
 class Prefetcher(Generic[T], ClosableStream[T]):
-    """Simple data prefetcher."""
+    """Data prefetcher with one or more worker threads."""
 
-    def __init__(self, stream: ClosableStream[T], buffer_size: int = 10):
+    def __init__(self, stream: ClosableStream[T], buffer_size: int = 10, fetch_size: int = 1, n_workers: int = 1,
+                 ordered: bool = True, processor: Optional[Processor[T, T]] = None):
         """
         Initializes a BatchPrefetcher instance.
 
         Args:
             stream (ClosableStream[T]): stream to fetch from
             buffer_size (int): the size of the buffer
+            fetch_size (int): the number of items to fetch from the stream with each read, defaults to 1
+            n_workers (int): the number of worker threads, defaults to 1
+            ordered (bool): whether to output items in the order they were read from the stream, defaults to True
+            processor (Optional[Processor[T, T]]): optional processor applied to each item by the workers in parallel
         """
         if buffer_size < 1:
             raise ValueError("buffer_size must be greater than 0")
 
+        if fetch_size < 1:
+            raise ValueError("fetch_size must be greater than 0")
+
+        if n_workers < 1:
+            raise ValueError("n_workers must be greater than 0")
+
         self._stream = stream
+        self._fetch_size = fetch_size
+        self._n_workers = n_workers
+        self._ordered = ordered
+        self._processor = processor
         self._queue: queue.Queue[T] = queue.Queue(maxsize=buffer_size)
 
-        self._thread = None
+        self._read_lock = threading.Lock()
+        self._next_seq = 0
+
+        self._in_flight_cond = threading.Condition()
+        self._in_flight = 0
+
+        self._reorder_cond = threading.Condition()
+        self._reorder_buffer: Dict[int, List[Optional[T]]] = {}
+        self._max_reorder = buffer_size + n_workers
+        self._next_out = 0
+
+        self._starvation_lock = threading.Lock()
+        self._starvation_time = 0.0
+
+        self._threads: List[threading.Thread] = []
         self._run_lock = threading.Lock()
         self._running = AtomicBool(False)
 
     def read(self) -> Optional[T]:
-        return self._queue.get()
+        if not self._queue.empty():
+            return self._queue.get()
+
+        start = time.perf_counter()
+        item = self._queue.get()
+        self._add_starvation(time.perf_counter() - start)
+
+        return item
+
+    def read_many(self, n: int, timeout: Optional[float] = None) -> List[T]:
+        if self._queue.qsize() >= n:
+            items, _ = QueueDrainer.drain(self._queue, n, timeout=timeout)
+            return items
+
+        start = time.perf_counter()
+        items, _ = QueueDrainer.drain(self._queue, n, timeout=timeout)
+        self._add_starvation(time.perf_counter() - start)
+
+        return items
 
     def run(self) -> None:
         """Runs the prefetcher."""
@@ -44,14 +94,104 @@ class Prefetcher(Generic[T], ClosableStream[T]):
                 raise RuntimeError("Prefetcher is already running")
 
             self._running.set(True)
-            self._thread = threading.Thread(target=self._worker)
-            self._thread.start()
+            self._threads = [threading.Thread(target=self._worker) for _ in range(self._n_workers)]
+            for thread in self._threads:
+                thread.start()
+
+    def get_queue_depth(self) -> int:
+        """
+        Returns the number of prefetched items waiting to be read.
+
+        Returns:
+            int: the number of prefetched items
+        """
+        return self._queue.qsize()
+
+    def get_starvation_time(self) -> float:
+        """
+        Returns the total time the consumer has spent waiting for items because the buffer was empty.
+
+        Returns:
+            float: the total starvation time in seconds
+        """
+        with self._starvation_lock:
+            return self._starvation_time
 
     def _worker(self) -> None:
         """Worker function that runs on the worker threads."""
         while self._running:
-            item = self._stream.read()
+            with self._read_lock:
+                seq = self._next_seq
+                self._next_seq += 1
+                items = self._fetch()
+                ended = items == [None]
+
+                if not self._ordered and not ended:
+                    with self._in_flight_cond:
+                        self._in_flight += 1
+
+            if self._processor is not None:
+                items = self._process(items)
+
+            if self._ordered:
+                self._put_in_order(seq, items)
+            else:
+                self._put_unordered(items, ended)
+
+    def _fetch(self) -> List[Optional[T]]:
+        """Fetches the next items from the stream, with a single None at the end of the stream."""
+        if self._fetch_size == 1:
+            return [self._stream.read()]
+
+        return self._stream.read_many(self._fetch_size) or [None]
+
+    def _process(self, items: List[Optional[T]]) -> List[Optional[T]]:
+        """Processes fetched items, skipping items that fail to process."""
+        processed = []
+        for item in items:
+            if item is None:
+                processed.append(None)
+                continue
+
+            try:
+                processed.append(self._processor.process(item))
+            except Exception as e:
+                print(f"[Prefetcher] Skipping item that failed to process: {e}")
+
+        return processed
+
+    def _put_in_order(self, seq: int, items: List[Optional[T]]) -> None:
+        """
+        Adds fetched items to the reorder buffer, and outputs all buffered items that are next in order, waiting while
+        the buffer holds too many items ahead of the next ones in order.
+        """
+        with self._reorder_cond:
+            while seq - self._next_out >= self._max_reorder and self._running:
+                self._reorder_cond.wait(WORKER_LOOP_TIMEOUT)
 
+            self._reorder_buffer[seq] = items
+
+            while self._next_out in self._reorder_buffer and self._running:
+                self._put_all(self._reorder_buffer.pop(self._next_out))
+                self._next_out += 1
+                self._reorder_cond.notify_all()
+
+    def _put_unordered(self, items: List[Optional[T]], ended: bool) -> None:
+        """Outputs fetched items right away, holding back the end of the stream until all other items are output."""
+        with self._in_flight_cond:
+            while ended and self._in_flight > 0 and self._running:
+                self._in_flight_cond.wait(WORKER_LOOP_TIMEOUT)
+
+        self._put_all(items)
+
+        if not ended:
+            with self._in_flight_cond:
+                self._in_flight -= 1
+                self._in_flight_cond.notify_all()
+
+    def _put_all(self, items: List[Optional[T]]) -> None:
+        """Puts items into the buffer, blocking while the buffer is full and the prefetcher is running."""
+        for item in items:
             putting = True
             while putting and self._running:
                 try:
@@ -61,10 +201,16 @@ class Prefetcher(Generic[T], ClosableStream[T]):
                 except queue.Full:
                     pass
 
+    def _add_starvation(self, seconds: float) -> None:
+        """Adds to the total starvation time."""
+        with self._starvation_lock:
+            self._starvation_time += seconds
+
     def close(self) -> None:
         with self._run_lock:
             self._running.set(False)
-            self._thread.join()
-            self._thread = None
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
 
-        self._stream.close()
\ No newline at end of file
+        self._stream.close()
@@ -0,0 +1,85 @@
+from typing import TypeVar, Generic, Callable, Optional
+
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.data.dataset.streams.factories.stream_factory import ClosableStreamFactory
+from src.data.dataset.streams.providers.stream_provider import StreamProvider
+from src.data.dataset.streams.stream import Stream
+
+# stream data type
+T = TypeVar("T")
+
+
+class RankedStreamProvider(Generic[T], StreamProvider[T]):
+    """
+    Provider of a reusable stream for the current rank in distributed training.
+
+    Each rank can be split further between data loader workers, every worker streaming a disjoint part of the rank's
+    share as if it were a rank of its own.
+    """
+
+    def __init__(self, stream_factory_fn: Callable[[int, int], ClosableStreamFactory[T]]):
+        """
+        Initializes a RankedStreamProvider instance.
+
+        Args:
+            stream_factory_fn (Callable[[int, int], ClosableStreamFactory[T]]): function creating a stream factory for
+                a given rank and world size
+        """
+        self._stream_factory_fn = stream_factory_fn
+
+        self._rank = 0
+        self._world_size = 1
+        self._worker_id = 0
+        self._n_workers = 1
+        self._stream: Optional[ClosableStream[T]] = None
+
+    def set_rank(self, rank: int, world_size: int) -> None:
+        """
+        Sets the rank to provide streams for, closing the current stream if the rank changed.
+
+        Args:
+            rank (int): the rank of this process
+            world_size (int): the total number of ranks
+        """
+        if not 0 <= rank < world_size:
+            raise ValueError(f"rank must be in range [0, {world_size}), got {rank}")
+
+        if (rank, world_size) == (self._rank, self._world_size):
+            return
+
+        self._close_stream()
+        self._rank = rank
+        self._world_size = world_size
+
+    def set_worker(self, worker_id: int, n_workers: int) -> None:
+        """
+        Sets the data loader worker of the rank to provide streams for, closing the current stream if it changed.
+
+        Args:
+            worker_id (int): the id of the worker
+            n_workers (int): the total number of workers of the rank
+        """
+        if not 0 <= worker_id < n_workers:
+            raise ValueError(f"worker_id must be in range [0, {n_workers}), got {worker_id}")
+
+        if (worker_id, n_workers) == (self._worker_id, self._n_workers):
+            return
+
+        self._close_stream()
+        self._worker_id = worker_id
+        self._n_workers = n_workers
+
+    def get_stream(self) -> Stream[T]:
+        if self._stream is None:
+            self._stream = self._stream_factory_fn(
+                self._rank * self._n_workers + self._worker_id,
+                self._world_size * self._n_workers
+            ).create_stream()
+
+        return self._stream
+
+    def _close_stream(self) -> None:
+        """Closes the current stream, if any."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
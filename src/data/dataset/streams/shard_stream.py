@@ -0,0 +1,93 @@
+from typing import TypeVar, Generic, Optional, Union, Tuple, List, Callable
+
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.dataset.dataset_split import DatasetSplit
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.data.dataset.streams.network_stream import NetworkStream
+from src.network.client.node_coordinator import NodeCoordinator
+from src.network.client.resumable_network_client import ResumableNetworkClient
+from src.network.client.simple_network_client import SimpleNetworkClient
+from src.network.messages.serialization.pickle_message_deserializer import PickleMessageDeserializer
+from src.network.messages.serialization.pickle_message_serializer import PickleMessageSerializer
+
+# stream data type
+T = TypeVar("T")
+
+# read result type
+R = TypeVar("R")
+
+
+class ShardStream(Generic[T], ClosableStream[T]):
+    """Network stream for one shard of the catalog, failing over to another node when its node fails."""
+
+    def __init__(self, coordinator: NodeCoordinator, shard_index: int, split: DatasetSplit,
+                 data_type: Union[type[T], Tuple[type, ...]], encoding: Optional[FrameEncoding] = None):
+        """
+        Initializes a ShardStream instance.
+
+        Args:
+            coordinator (NodeCoordinator): coordinator assigning shards to nodes
+            shard_index (int): the index of the shard to stream
+            split (DatasetSplit): dataset split to get data from
+            data_type (Union[type[T], Tuple[type, ...]]): data type, or tuple of accepted data types
+            encoding (Optional[FrameEncoding]): the frame encoding to request, None for the server default
+        """
+        self._coordinator = coordinator
+        self._shard_index = shard_index
+        self._split = split
+        self._data_type = data_type
+        self._encoding = encoding
+
+        self._address = None
+        self._client = None
+        self._stream = None
+
+    def read(self) -> Optional[T]:
+        return self._with_failover(lambda stream: stream.read())
+
+    def read_many(self, n: int, timeout: Optional[float] = None) -> List[T]:
+        return self._with_failover(lambda stream: stream.read_many(n, timeout=timeout))
+
+    def close(self) -> None:
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except (ConnectionError, RuntimeError) as e:
+                print(f"[ShardStream] Failed to close stream for shard {self._shard_index}: {e}")
+        self._disconnect()
+
+    def _with_failover(self, fn: Callable[[NetworkStream[T]], R]) -> R:
+        """Applies a read function to the stream of the shard, failing over to another node until it succeeds."""
+        while True:
+            try:
+                if self._stream is None:
+                    self._connect()
+                return fn(self._stream)
+
+            except (ConnectionError, RuntimeError) as e:
+                if not self._coordinator.get_alive_nodes():
+                    raise
+                print(f"[ShardStream] Node {self._address} failed for shard {self._shard_index}: {e}")
+                self._coordinator.report_failure(self._address)
+                self._disconnect()
+
+    def _connect(self) -> None:
+        """Connects to the node assigned to the shard and prepares a stream for it."""
+        self._address = self._coordinator.get_node(self._shard_index)
+        self._client = ResumableNetworkClient(SimpleNetworkClient(PickleMessageSerializer(), PickleMessageDeserializer()))
+        self._client.connect(self._address)
+        self._stream = NetworkStream[T](
+            client=self._client,
+            split=self._split,
+            data_type=self._data_type,
+            encoding=self._encoding,
+            shard=self._coordinator.get_shard(self._shard_index)
+        )
+
+    def _disconnect(self) -> None:
+        """Drops the connection to the current node."""
+        if self._client is not None:
+            self._client.disconnect()
+
+        self._client = None
+        self._stream = None
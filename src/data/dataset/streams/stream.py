@@ -1,5 +1,6 @@
+import time
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Optional
+from typing import TypeVar, Generic, Optional, List
 
 T = TypeVar("T")
 
@@ -14,4 +15,27 @@ class Stream(Generic[T], ABC):
         Returns:
             T: the item, or None if end of streams is reached
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def read_many(self, n: int, timeout: Optional[float] = None) -> List[T]:
+        """
+        Returns up to n next items in the stream, blocking until n items are read, the end of the stream is reached,
+        or the timeout expires.
+
+        Args:
+            n (int): the max number of items to read
+            timeout (Optional[float]): the max number of seconds to keep reading, None for no timeout
+
+        Returns:
+            List[T]: the items read, fewer than n if the end of the stream was reached or the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        items = []
+        while len(items) < n and (deadline is None or time.monotonic() < deadline):
+            item = self.read()
+            if item is None:
+                break
+            items.append(item)
+
+        return items
@@ -0,0 +1,9 @@
+from src.data.loading.loaders.video_file_loader import VideoFileLoader
+
+
+class LocalVideoLoader(VideoFileLoader):
+    """Loads video files from the local file system."""
+
+    def load_video_file(self, video_id: str) -> bytes:
+        with open(video_id, "rb") as f:
+            return f.read()
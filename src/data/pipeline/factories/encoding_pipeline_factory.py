@@ -0,0 +1,36 @@
+from typing import TypeVar, Generic, Optional, Union
+
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.pipeline.factories.pipeline_factory import PipelineFactory
+from src.data.pipeline.pipeline import Pipeline
+from src.data.pipeline.pipeline_builder import PipelineBuilder
+from src.data.pipeline.preprocessor import Preprocessor
+from src.data.processing.frame_encoder import FrameEncoder
+
+# data type for pipeline entry
+A = TypeVar("A")
+
+
+class EncodingPipelineFactory(Generic[A], PipelineFactory[A, Union[AnnotatedFrame, CompressedAnnotatedFrame]]):
+    """Factory for creating pipelines that end with a frame encoding stage."""
+
+    def __init__(self, encoding: FrameEncoding, base: Optional[PipelineFactory[A, AnnotatedFrame]] = None):
+        """
+        Initializes an EncodingPipelineFactory instance.
+
+        Args:
+            encoding (FrameEncoding): the encoding to apply at the end of the pipeline
+            base (Optional[PipelineFactory[A, AnnotatedFrame]]): optional factory for the pipeline preceding the encoder
+        """
+        self._encoding = encoding
+        self._base = base
+
+    def create_pipeline(self) -> PipelineBuilder[A, Union[AnnotatedFrame, CompressedAnnotatedFrame]]:
+        encoder = Preprocessor(FrameEncoder(self._encoding))
+
+        if self._base is None:
+            return Pipeline(encoder)
+
+        return self._base.create_pipeline().then(encoder)
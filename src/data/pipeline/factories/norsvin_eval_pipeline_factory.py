@@ -1,5 +1,4 @@
 from src.data.dataclasses.annotated_frame import AnnotatedFrame
-from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
 from src.data.pipeline.factories.pipeline_factory import PipelineFactory
 from src.data.pipeline.field_transformer import FieldTransformer
 from src.data.pipeline.norsvin_pipeline_config import RESIZE_SHAPE, NORMALIZE_RANGE
@@ -9,17 +8,14 @@ from src.data.pipeline.preprocessor import Preprocessor
 from src.data.processing.bbox_normalizer_processor import BBoxNormalizerProcessor
 from src.data.processing.frame_resizer import FrameResizer
 from src.data.processing.normalization.simple_bbox_normalizer import SimpleBBoxNormalizer
-from src.data.processing.zlib_compressor import ZlibCompressor
 
 
-class NorsvinEvalPipelineFactory(PipelineFactory[AnnotatedFrame, CompressedAnnotatedFrame]):
+class NorsvinEvalPipelineFactory(PipelineFactory[AnnotatedFrame, AnnotatedFrame]):
     """Factory for creating evaluation set pipelines for the Norsvin dataset."""
 
-    def create_pipeline(self) -> PipelineTail[AnnotatedFrame, CompressedAnnotatedFrame]:
+    def create_pipeline(self) -> PipelineTail[AnnotatedFrame, AnnotatedFrame]:
         return Pipeline(
             FieldTransformer.of("frame").using(FrameResizer(RESIZE_SHAPE))
         ).then(
             Preprocessor(BBoxNormalizerProcessor(SimpleBBoxNormalizer(NORMALIZE_RANGE)))
-        ).then(
-            Preprocessor(ZlibCompressor())
         )
\ No newline at end of file
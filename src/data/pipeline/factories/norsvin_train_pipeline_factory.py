@@ -2,7 +2,6 @@ import random
 from typing import List
 
 from src.data.dataclasses.annotated_frame import AnnotatedFrame
-from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
 from src.data.pipeline.field_transformer import FieldTransformer
 from src.data.pipeline.filter_component import FilterComponent
 from src.data.pipeline.norsvin_pipeline_config import RESIZE_SHAPE, NORMALIZE_RANGE, CLASS_COUNTS
@@ -22,14 +21,13 @@ from src.data.processing.bbox_normalizer_processor import BBoxNormalizerProcesso
 from src.data.processing.class_balancer import ClassBalancer
 from src.data.processing.frame_resizer import FrameResizer
 from src.data.processing.normalization.simple_bbox_normalizer import SimpleBBoxNormalizer
-from src.data.processing.zlib_compressor import ZlibCompressor
 from src.data.structures.random_float import RandomFloat
 
 
-class NorsvinTrainPipelineFactory(PipelineFactory[AnnotatedFrame, CompressedAnnotatedFrame]):
+class NorsvinTrainPipelineFactory(PipelineFactory[AnnotatedFrame, AnnotatedFrame]):
     """Factory for creating training set pipelines for the Norsvin dataset."""
 
-    def create_pipeline(self) -> PipelineTail[AnnotatedFrame, CompressedAnnotatedFrame]:
+    def create_pipeline(self) -> PipelineTail[AnnotatedFrame, AnnotatedFrame]:
         def filter_func(frame: AnnotatedFrame) -> bool:
             return len(frame.annotations) > 0
 
@@ -43,8 +41,6 @@ class NorsvinTrainPipelineFactory(PipelineFactory[AnnotatedFrame, CompressedAnno
             SplittingPreprocessor(ClassBalancer(class_counts=CLASS_COUNTS, max_samples_per=3))
         ).then(
             Preprocessor(Augmentor(plan_factory=AugmentationPlanFactory(), filters=self._create_filters()))
-        ).then(
-            Preprocessor(ZlibCompressor())
         )
 
     @staticmethod
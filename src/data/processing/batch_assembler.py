@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union, Tuple, Optional
+
+import numpy as np
+
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.assembled_batch import AssembledBatch
+from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
+from src.data.processing.frame_decoder import FrameDecoder
+from src.data.processing.processor import Processor
+
+# number of values per target row, [cls, cx, cy, w, h]
+TARGET_SIZE = 5
+
+# value used for padding targets
+TARGET_PAD_VALUE = -1.0
+
+
+class BatchAssembler(Processor[List[Union[AnnotatedFrame, CompressedAnnotatedFrame]], AssembledBatch]):
+    """Assembles lists of frames into model-ready batches of contiguous arrays."""
+
+    def __init__(self, denormalize: bool = True, n_workers: int = 1):
+        """
+        Initializes a BatchAssembler instance.
+
+        Args:
+            denormalize (bool): whether to scale normalized bounding boxes to pixel coordinates, defaults to True
+            n_workers (int): the number of threads decoding frames into the batch in parallel, defaults to 1
+        """
+        if n_workers < 1:
+            raise ValueError("n_workers must be greater than 0")
+
+        self._denormalize = denormalize
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(n_workers) if n_workers > 1 else None
+
+    def process(self, data: List[Union[AnnotatedFrame, CompressedAnnotatedFrame]]) -> AssembledBatch:
+        if not data:
+            raise ValueError("Cannot assemble an empty batch")
+
+        height, width, channels = self._get_shape(data[0])
+        images = np.empty((len(data), channels, height, width), dtype=np.uint8)
+
+        max_boxes = max(len(instance.annotations) for instance in data)
+        targets = np.full((len(data), max_boxes, TARGET_SIZE), TARGET_PAD_VALUE, dtype=np.float32)
+
+        for i, instance in enumerate(data):
+            if self._get_shape(instance) != (height, width, channels):
+                raise ValueError(f"All frames in a batch must have the same shape, got {self._get_shape(instance)}")
+
+            n_boxes = len(instance.annotations)
+            if n_boxes > 0:
+                targets[i, :n_boxes] = self._get_targets(instance, width, height)
+
+        slots = [images[i].transpose(1, 2, 0) for i in range(len(data))]
+        if self._executor is None:
+            for instance, slot in zip(data, slots):
+                FrameDecoder.decode_into(instance, slot)
+        else:
+            list(self._executor.map(FrameDecoder.decode_into, data, slots))
+
+        return AssembledBatch(images=images, targets=targets)
+
+    def close(self) -> None:
+        """Shuts down the decoding threads."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @staticmethod
+    def _get_shape(instance: Union[AnnotatedFrame, CompressedAnnotatedFrame]) -> Tuple[int, int, int]:
+        """Returns the (height, width, channels) shape of the frame of an instance."""
+        shape = instance.shape if isinstance(instance, CompressedAnnotatedFrame) else instance.frame.shape
+        return tuple(shape) if len(shape) == 3 else (shape[0], shape[1], 1)
+
+    def _get_targets(self, instance: Union[AnnotatedFrame, CompressedAnnotatedFrame], width: int,
+                     height: int) -> np.ndarray:
+        """Packs the annotations of an instance into an array of [cls, cx, cy, w, h] rows."""
+        boxes = np.array(
+            [[a.cls.value, a.bbox.x, a.bbox.y, a.bbox.width, a.bbox.height] for a in instance.annotations],
+            dtype=np.float32
+        )
+
+        if self._denormalize:
+            boxes[:, [1, 3]] *= width
+            boxes[:, [2, 4]] *= height
+
+        boxes[:, 1] += boxes[:, 3] / 2
+        boxes[:, 2] += boxes[:, 4] / 2
+
+        return boxes
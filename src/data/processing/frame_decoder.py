@@ -0,0 +1,63 @@
+import zlib
+from typing import Union
+
+import cv2
+import numpy as np
+
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
+from src.data.dataclasses.frame_codec import FrameCodec
+from src.data.processing.processor import Processor
+
+
+class FrameDecoder(Processor[Union[AnnotatedFrame, CompressedAnnotatedFrame], AnnotatedFrame]):
+    """Pipeline component for decoding frames encoded with any supported codec."""
+
+    def process(self, data: Union[AnnotatedFrame, CompressedAnnotatedFrame]) -> AnnotatedFrame:
+        if not isinstance(data, CompressedAnnotatedFrame):
+            return data
+
+        return AnnotatedFrame(
+            source=data.source,
+            index=data.index,
+            frame=self.decode_frame(data),
+            annotations=data.annotations
+        )
+
+    @staticmethod
+    def decode_frame(data: CompressedAnnotatedFrame) -> np.ndarray:
+        """
+        Decodes the pixel data of a compressed frame.
+
+        Args:
+            data (CompressedAnnotatedFrame): the compressed frame
+
+        Returns:
+            np.ndarray: the decoded frame with its original shape
+        """
+        if data.codec == FrameCodec.ZLIB:
+            pixels = np.frombuffer(zlib.decompress(data.frame), dtype=np.dtype(data.dtype))
+        elif data.codec == FrameCodec.RAW:
+            pixels = np.frombuffer(data.frame, dtype=np.dtype(data.dtype))
+        else:
+            pixels = cv2.imdecode(np.frombuffer(data.frame, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+            if pixels is None:
+                raise ValueError(f"Failed to decode frame with codec {data.codec}")
+
+        return pixels.reshape(data.shape)
+
+    @staticmethod
+    def decode_into(data: Union[AnnotatedFrame, CompressedAnnotatedFrame], out: np.ndarray) -> None:
+        """
+        Decodes the pixel data of a frame straight into a preallocated array, such as a slot of a batch array.
+
+        Args:
+            data (Union[AnnotatedFrame, CompressedAnnotatedFrame]): the frame to decode
+            out (np.ndarray): the array to write the pixels to, with the (height, width, channels) shape of the frame
+        """
+        if isinstance(data, CompressedAnnotatedFrame):
+            pixels = FrameDecoder.decode_frame(data)
+        else:
+            pixels = data.frame
+
+        np.copyto(out, pixels.reshape(out.shape), casting="unsafe")
@@ -0,0 +1,70 @@
+import zlib
+from typing import Union, List
+
+import cv2
+import numpy as np
+
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
+from src.data.dataclasses.frame_codec import FrameCodec
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.processing.processor import Processor
+
+
+class FrameEncoder(Processor[AnnotatedFrame, Union[AnnotatedFrame, CompressedAnnotatedFrame]]):
+    """Pipeline component for encoding frames with a negotiated codec."""
+
+    def __init__(self, encoding: FrameEncoding):
+        """
+        Initializes a FrameEncoder instance.
+
+        Args:
+            encoding (FrameEncoding): the encoding to apply to frames
+        """
+        self._encoding = encoding
+
+    def process(self, data: AnnotatedFrame) -> Union[AnnotatedFrame, CompressedAnnotatedFrame]:
+        if self._encoding.codec == FrameCodec.RAW:
+            return data
+
+        frame = data.frame
+        return CompressedAnnotatedFrame(
+            source=data.source,
+            index=data.index,
+            frame=self._encode(frame),
+            shape=frame.shape,
+            dtype=str(frame.dtype),
+            annotations=data.annotations,
+            codec=self._encoding.codec
+        )
+
+    def _encode(self, frame: np.ndarray) -> bytes:
+        """Encodes the pixel data of a frame."""
+        codec = self._encoding.codec
+        level = self._encoding.level
+
+        if codec == FrameCodec.ZLIB:
+            return zlib.compress(frame, -1 if level is None else level)
+
+        if frame.dtype != np.uint8:
+            raise ValueError(f"Codec {codec} only supports uint8 frames, got {frame.dtype}")
+
+        success, buffer = cv2.imencode(self._get_extension(codec), frame, self._get_params(codec, level))
+        if not success:
+            raise ValueError(f"Failed to encode frame with codec {codec}")
+
+        return buffer.tobytes()
+
+    @staticmethod
+    def _get_extension(codec: FrameCodec) -> str:
+        """Returns the file extension used by OpenCV to select the image codec."""
+        return ".jpg" if codec == FrameCodec.JPEG else ".webp"
+
+    @staticmethod
+    def _get_params(codec: FrameCodec, level: int) -> List[int]:
+        """Returns the OpenCV encoding parameters for a codec."""
+        if level is None:
+            return []
+
+        flag = cv2.IMWRITE_JPEG_QUALITY if codec == FrameCodec.JPEG else cv2.IMWRITE_WEBP_QUALITY
+        return [flag, level]
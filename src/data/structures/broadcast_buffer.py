@@ -0,0 +1,139 @@
+import itertools
+import threading
+from collections import deque
+from typing import Generic, TypeVar, Dict, Optional
+
+# generic type for stored data
+T = TypeVar("T")
+
+
+class BroadcastBuffer(Generic[T]):
+    """Thread-safe buffer broadcasting every written item to all subscribed readers, each with its own cursor."""
+
+    def __init__(self, lag_window: int = 1000):
+        """
+        Initializes a BroadcastBuffer instance.
+
+        Args:
+            lag_window (int): the maximum number of items the fastest reader can be ahead of the slowest one,
+                bounding the number of buffered items, defaults to 1000
+        """
+        if lag_window < 1:
+            raise ValueError("lag_window must be greater than 0")
+
+        self._lag_window = lag_window
+
+        self._items = deque()
+        self._base = 0
+        self._cursors: Dict[int, int] = {}
+        self._ids = itertools.count()
+        self._closed = False
+
+        self._cond = threading.Condition()
+
+    def subscribe(self) -> int:
+        """
+        Subscribes a new reader, starting at the oldest buffered item.
+
+        Returns:
+            int: the id of the reader cursor
+        """
+        with self._cond:
+            cursor = next(self._ids)
+            self._cursors[cursor] = self._base
+            return cursor
+
+    def unsubscribe(self, cursor: int) -> None:
+        """
+        Unsubscribes a reader, releasing any items only it was holding back.
+
+        Args:
+            cursor (int): the id of the reader cursor
+        """
+        with self._cond:
+            self._cursors.pop(cursor, None)
+            self._cond.notify_all()
+
+    def write(self, item: T) -> bool:
+        """
+        Writes an item to the buffer, blocking while the slowest reader is a full lag window behind.
+
+        Args:
+            item (T): the item to write
+
+        Returns:
+            bool: True if the item was written, False if the buffer was closed
+        """
+        with self._cond:
+            while not self._closed and len(self._items) >= self._lag_window and not self._trim():
+                self._cond.wait()
+
+            if self._closed:
+                return False
+
+            self._items.append(item)
+            self._cond.notify_all()
+            return True
+
+    def read(self, cursor: int) -> Optional[T]:
+        """
+        Reads the next item for a reader, blocking until it is available.
+
+        Args:
+            cursor (int): the id of the reader cursor
+
+        Returns:
+            Optional[T]: the next item, or None if the buffer is closed and drained, or the reader is unsubscribed
+        """
+        with self._cond:
+            while cursor in self._cursors and self._cursors[cursor] >= self._end() and not self._closed:
+                self._cond.wait()
+
+            position = self._cursors.get(cursor)
+            if position is None or position >= self._end():
+                return None
+
+            self._cursors[cursor] = position + 1
+            self._cond.notify_all()
+            return self._items[position - self._base]
+
+    def close(self) -> None:
+        """Closes the buffer, letting readers drain the remaining items."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def is_pristine(self) -> bool:
+        """
+        Checks whether no item has been evicted yet, meaning new readers will see the full sequence of items.
+
+        Returns:
+            bool: True if no item has been evicted and the buffer is open, False otherwise
+        """
+        with self._cond:
+            return self._base == 0 and not self._closed
+
+    def n_subscribers(self) -> int:
+        """
+        Returns the number of subscribed readers.
+
+        Returns:
+            int: the number of subscribed readers
+        """
+        with self._cond:
+            return len(self._cursors)
+
+    def _end(self) -> int:
+        """Returns the absolute position one past the newest item."""
+        return self._base + len(self._items)
+
+    def _trim(self) -> bool:
+        """Evicts items consumed by all readers, returning whether any item was evicted."""
+        slowest = min(self._cursors.values(), default=self._end())
+        n_evict = min(slowest - self._base, len(self._items))
+
+        for _ in range(n_evict):
+            self._items.popleft()
+        self._base += n_evict
+
+        return n_evict > 0
@@ -0,0 +1,63 @@
+from typing import Tuple
+
+import numpy as np
+
+
+class GrowableArray:
+    """Numpy array growing along its first axis, doubling its capacity to give amortized constant time appends."""
+
+    def __init__(self, row_shape: Tuple[int, ...] = (), dtype: np.dtype = np.float64, capacity: int = 1024):
+        """
+        Initializes a GrowableArray instance.
+
+        Args:
+            row_shape (Tuple[int, ...]): the shape of each row, defaults to () for scalar rows
+            dtype (np.dtype): the data type of the array, defaults to float64
+            capacity (int): the initial number of rows to allocate, defaults to 1024
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be greater than 0")
+
+        self._data = np.empty((capacity, *row_shape), dtype=dtype)
+        self._size = 0
+
+    def extend(self, rows: np.ndarray) -> None:
+        """
+        Appends rows to the end of the array.
+
+        Args:
+            rows (np.ndarray): the rows to append, with the row shape of the array
+        """
+        n = len(rows)
+        self._reserve(self._size + n)
+        self._data[self._size:self._size + n] = rows
+        self._size += n
+
+    def view(self) -> np.ndarray:
+        """
+        Returns a view of the filled part of the array, only valid until the next append.
+
+        Returns:
+            np.ndarray: the filled rows
+        """
+        return self._data[:self._size]
+
+    def clear(self) -> None:
+        """Removes all rows, keeping the allocated capacity."""
+        self._size = 0
+
+    def _reserve(self, size: int) -> None:
+        """Grows the allocated array to hold at least the given number of rows."""
+        capacity = len(self._data)
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        data = np.empty((capacity, *self._data.shape[1:]), dtype=self._data.dtype)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
+
+    def __len__(self) -> int:
+        return self._size
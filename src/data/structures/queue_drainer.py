@@ -0,0 +1,47 @@
+import queue
+import time
+from typing import TypeVar, List, Tuple, Optional
+
+T = TypeVar("T")
+
+
+class QueueDrainer:
+    """Gets items from queues in bulk, holding the queue lock once for every available run of items."""
+
+    @staticmethod
+    def drain(q: queue.Queue, n: int, timeout: Optional[float] = None) -> Tuple[List[T], bool]:
+        """
+        Gets up to n items from a queue, blocking until n items are taken, a None end marker is taken, or the timeout
+        expires.
+
+        Args:
+            q (queue.Queue): the queue to get items from
+            n (int): the max number of items to get
+            timeout (Optional[float]): the max number of seconds to wait for items, None for no timeout
+
+        Returns:
+            Tuple[List[T], bool]: the items taken, and whether the None end marker was taken
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        items = []
+        ended = False
+
+        with q.not_empty:
+            while len(items) < n and not ended:
+                if not q.queue:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+
+                    q.not_empty.wait(remaining)
+                    continue
+
+                item = q.queue.popleft()
+                q.not_full.notify()
+
+                if item is None:
+                    ended = True
+                else:
+                    items.append(item)
+
+        return items, ended
@@ -1,6 +1,7 @@
 import threading
 import random
-from typing import TypeVar, Generic, Optional
+import time
+from typing import TypeVar, Generic, Optional, List
 
 from src.data.structures.atomic_bool import AtomicBool
 from src.data.structures.atomic_var import AtomicVar
@@ -72,12 +73,50 @@ class RABPool(Generic[T]):
                 self._ready.wait(WAITING_TIMEOUT)
 
             if not released and len(self._items) > 0:
-                index = random.randint(0, len(self._items) - 1)
-                item = self._items.pop(index)
+                item = self._pop_random()
             self._not_full.notify()
 
         return item
 
+    def get_many(self, n: int, release: Optional[AtomicBool] = None, timeout: Optional[float] = None) -> List[T]:
+        """
+        Gets up to n random items from the pool, drawing them under a single lock acquisition while enough items
+        are ready.
+
+        Args:
+            n (int): the max number of items to get
+            release (Optional[AtomicBool]): optional release for unblocking the operation
+            timeout (Optional[float]): the max number of seconds to wait for ready items, None for no timeout
+
+        Returns:
+            List[T]: the random items, fewer than n if released or the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        items = []
+
+        with self._ready:
+            while len(items) < n and not self._is_released(release):
+                if len(self._items) > 0 and len(self._items) >= self._min_ready.get():
+                    items.append(self._pop_random())
+                    continue
+
+                remaining = WAITING_TIMEOUT if deadline is None else min(WAITING_TIMEOUT, deadline - time.monotonic())
+                if remaining <= 0:
+                    break
+
+                self._not_full.notify_all()
+                self._ready.wait(remaining)
+
+            self._not_full.notify_all()
+
+        return items
+
+    def _pop_random(self) -> T:
+        """Removes and returns a random item, swapping it with the last item to avoid shifting the list."""
+        index = random.randint(0, len(self._items) - 1)
+        self._items[index], self._items[-1] = self._items[-1], self._items[index]
+        return self._items.pop()
+
     @staticmethod
     def _is_released(release: Optional[AtomicBool]) -> bool:
         """Checks whether the release is released."""
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CachedFeatures:
+    """
+    Represents the cached backbone features of a single frame.
+
+    Attributes:
+        features (Dict[str, np.ndarray]): the (C, H, W) feature maps of each feature level, in order
+        image_size (Tuple[int, int]): the (height, width) of the frame after resizing by the model
+        padded_size (Tuple[int, int]): the (height, width) of the frame after padding by the model
+    """
+    features: Dict[str, np.ndarray]
+    image_size: Tuple[int, int]
+    padded_size: Tuple[int, int]
@@ -0,0 +1,161 @@
+import os
+import queue
+import shutil
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import torch
+
+from src.data.structures.atomic_bool import AtomicBool
+
+# timeout for worker loop iterations, in seconds
+WORKER_LOOP_TIMEOUT = 0.1
+
+
+class CheckpointWriter:
+    """
+    Writes checkpoints from a background thread, so training does not block on disk.
+
+    Each checkpoint is snapshotted to CPU memory when submitted, written once to a temporary file and renamed into
+    place, and then hard linked as the latest checkpoint, replacing the previous one atomically.
+    """
+
+    def __init__(self, output_dir: str, last_name: str = "last_ckpt.pth", keep_last: Optional[int] = None,
+                 max_pending: int = 2):
+        """
+        Initializes a CheckpointWriter instance.
+
+        Args:
+            output_dir (str): the directory to write checkpoints to
+            last_name (str): the file name of the latest checkpoint, defaults to last_ckpt.pth
+            keep_last (Optional[int]): the number of checkpoints to keep, deleting older ones written by this writer,
+                None to keep all
+            max_pending (int): the max number of snapshots waiting to be written before submitting blocks, defaults
+                to 2
+        """
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last must be greater than 0")
+
+        if max_pending < 1:
+            raise ValueError("max_pending must be greater than 0")
+
+        self._output_dir = output_dir
+        self._last_name = last_name
+        self._keep_last = keep_last
+        self._queue: queue.Queue[Tuple[Dict[str, Any], str]] = queue.Queue(maxsize=max_pending)
+
+        self._written: Deque[str] = deque()
+        self._error: Optional[Exception] = None
+
+        self._thread: Optional[threading.Thread] = None
+        self._run_lock = threading.Lock()
+        self._running = AtomicBool(False)
+
+    def run(self) -> None:
+        """Runs the writer thread."""
+        with self._run_lock:
+            if self._running:
+                raise RuntimeError("CheckpointWriter is already running")
+
+            os.makedirs(self._output_dir, exist_ok=True)
+            self._running.set(True)
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+
+    def submit(self, state: Dict[str, Any], file_name: str) -> None:
+        """
+        Snapshots a checkpoint to CPU memory and queues it to be written, blocking only if too many are pending.
+
+        Args:
+            state (Dict[str, Any]): the checkpoint, possibly containing tensors and state dicts on any device
+            file_name (str): the file name of the checkpoint in the output directory
+        """
+        if not self._running:
+            raise RuntimeError("CheckpointWriter is not running")
+
+        self._raise_error()
+        self._queue.put((self._snapshot(state), file_name))
+
+    def flush(self) -> None:
+        """Blocks until all queued checkpoints have been written."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Writes the queued checkpoints and stops the writer thread."""
+        with self._run_lock:
+            if not self._running:
+                return
+
+            self._queue.join()
+            self._running.set(False)
+            self._thread.join()
+            self._thread = None
+
+        self._raise_error()
+
+    def _worker(self) -> None:
+        """Worker function writing queued checkpoints."""
+        while self._running:
+            try:
+                state, file_name = self._queue.get(timeout=WORKER_LOOP_TIMEOUT)
+            except queue.Empty:
+                continue
+
+            try:
+                self._write(state, file_name)
+            except Exception as e:
+                print(f"[CheckpointWriter] Failed to write {file_name}: {e}")
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _write(self, state: Dict[str, Any], file_name: str) -> None:
+        """Writes a checkpoint, links it as the latest checkpoint and deletes checkpoints beyond the retention limit."""
+        path = os.path.join(self._output_dir, file_name)
+        tmp_path = f"{path}.tmp"
+        torch.save(state, tmp_path)
+        os.replace(tmp_path, path)
+
+        last_path = os.path.join(self._output_dir, self._last_name)
+        if os.path.abspath(last_path) != os.path.abspath(path):
+            tmp_last_path = f"{last_path}.tmp"
+            if os.path.lexists(tmp_last_path):
+                os.remove(tmp_last_path)
+
+            try:
+                os.link(path, tmp_last_path)
+            except OSError:
+                shutil.copyfile(path, tmp_last_path)
+
+            os.replace(tmp_last_path, last_path)
+
+        if path in self._written:
+            self._written.remove(path)
+        self._written.append(path)
+
+        while self._keep_last is not None and len(self._written) > self._keep_last:
+            old_path = self._written.popleft()
+            if os.path.exists(old_path):
+                os.remove(old_path)
+
+    def _raise_error(self) -> None:
+        """Raises an error if writing a checkpoint has failed."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Failed to write checkpoint: {error}") from error
+
+    @staticmethod
+    def _snapshot(obj: Any) -> Any:
+        """Returns a copy of an object with all tensors copied to CPU memory."""
+        if isinstance(obj, torch.Tensor):
+            return obj.detach().to("cpu", copy=True)
+
+        if isinstance(obj, dict):
+            return type(obj)((key, CheckpointWriter._snapshot(value)) for key, value in obj.items())
+
+        if isinstance(obj, (list, tuple)):
+            return type(obj)(CheckpointWriter._snapshot(value) for value in obj)
+
+        return obj
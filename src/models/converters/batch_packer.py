@@ -0,0 +1,114 @@
+from typing import List, Tuple
+
+import numpy as np
+import torch
+
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+
+# number of values per box row, [cls, cx, cy, w, h]
+BOX_SIZE = 5
+
+# value used for padding boxes
+BOX_PAD_VALUE = -1.0
+
+
+class BatchPacker:
+    """Packs the images and boxes of a batch of frames into contiguous arrays, shared by the batch converters."""
+
+    @staticmethod
+    def pack_images(batch: List[AnnotatedFrame]) -> torch.Tensor:
+        """
+        Packs the images of a batch into one preallocated uint8 tensor, leaving float scaling to the model side.
+
+        Args:
+            batch (List[AnnotatedFrame]): the frames of the batch, all of the same shape
+
+        Returns:
+            torch.Tensor: the images, of shape (N, C, H, W) and dtype uint8
+        """
+        if not batch:
+            raise ValueError("Cannot pack an empty batch")
+
+        height, width, channels = BatchPacker._get_shape(batch[0].frame)
+        images = torch.empty((len(batch), channels, height, width), dtype=torch.uint8)
+        slots = images.numpy()
+
+        for slot, annotated_frame in zip(slots, batch):
+            frame = annotated_frame.frame
+            if BatchPacker._get_shape(frame) != (height, width, channels):
+                raise ValueError(f"All frames in a batch must have the same shape, got {frame.shape}")
+
+            np.copyto(slot, frame.reshape(height, width, channels).transpose(2, 0, 1))
+
+        return images
+
+    @staticmethod
+    def pack_boxes(batch: List[AnnotatedFrame]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Packs the boxes of all frames of a batch into a single array.
+
+        Args:
+            batch (List[AnnotatedFrame]): the frames of the batch
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: the [cls, cx, cy, w, h] rows of all boxes, of shape (M, 5), and the offsets
+                of the boxes of each frame, of shape (N + 1,), the boxes of frame i being rows offsets[i]:offsets[i + 1]
+        """
+        counts = np.fromiter((len(f.annotations) for f in batch), dtype=np.int64, count=len(batch))
+        offsets = np.zeros(len(batch) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        boxes = np.array(
+            [[a.cls.value, a.bbox.x, a.bbox.y, a.bbox.width, a.bbox.height] for f in batch for a in f.annotations],
+            dtype=np.float32
+        ).reshape(-1, BOX_SIZE)
+
+        boxes[:, 1] += boxes[:, 3] / 2
+        boxes[:, 2] += boxes[:, 4] / 2
+
+        return boxes, offsets
+
+    @staticmethod
+    def filter_boxes(boxes: np.ndarray, offsets: np.ndarray, keep: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Keeps a subset of packed boxes, updating the offsets of each frame.
+
+        Args:
+            boxes (np.ndarray): the packed boxes, of shape (M, 5)
+            offsets (np.ndarray): the offsets of the boxes of each frame, of shape (N + 1,)
+            keep (np.ndarray): boolean mask of the boxes to keep, of shape (M,)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: the kept boxes and their offsets
+        """
+        kept_before = np.zeros(len(boxes) + 1, dtype=np.int64)
+        np.cumsum(keep, out=kept_before[1:])
+
+        return boxes[keep], kept_before[offsets]
+
+    @staticmethod
+    def pad_boxes(boxes: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """
+        Scatters packed boxes into an array padded to the max number of boxes per frame.
+
+        Args:
+            boxes (np.ndarray): the packed boxes, of shape (M, 5)
+            offsets (np.ndarray): the offsets of the boxes of each frame, of shape (N + 1,)
+
+        Returns:
+            np.ndarray: the padded boxes, of shape (N, max_boxes, 5), padded with -1
+        """
+        counts = np.diff(offsets)
+        max_boxes = int(counts.max()) if len(counts) > 0 else 0
+        padded = np.full((len(counts), max_boxes, BOX_SIZE), BOX_PAD_VALUE, dtype=np.float32)
+
+        frame_indices = np.repeat(np.arange(len(counts)), counts)
+        row_indices = np.arange(len(boxes)) - np.repeat(offsets[:-1], counts)
+        padded[frame_indices, row_indices] = boxes
+
+        return padded
+
+    @staticmethod
+    def _get_shape(frame: np.ndarray) -> Tuple[int, int, int]:
+        """Returns the (height, width, channels) shape of a frame."""
+        return tuple(frame.shape) if frame.ndim == 3 else (frame.shape[0], frame.shape[1], 1)
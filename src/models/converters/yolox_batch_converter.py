@@ -1,9 +1,10 @@
 from typing import List, Tuple
 
-import numpy as np
 import torch
 
 from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.assembled_batch import AssembledBatch
+from src.models.converters.batch_packer import BatchPacker
 
 
 class YOLOXBatchConverter:
@@ -11,57 +12,49 @@ class YOLOXBatchConverter:
 
     @staticmethod
     def convert(batch: List[AnnotatedFrame]) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
-        images = []
-        targets = []
-        img_info = []
-        img_ids = []
-
-        for idx, annotated_frame in enumerate(batch):
-            img = annotated_frame.frame
-            height, width = img.shape[:2]
-
-            img = img.astype(np.float32) / 255.0
-            img = np.transpose(img, (2, 0, 1))
-            images.append(torch.tensor(img, dtype=torch.float32))
-
-            frame_targets = []
-            for ann in annotated_frame.annotations:
-                bbox = ann.bbox
-
-                cx = bbox.x + bbox.width / 2
-                cy = bbox.y + bbox.height / 2
-                w = bbox.width
-                h = bbox.height
-                cls = ann.cls.value
-
-                frame_targets.append([cls, cx, cy, w, h])
+        """
+        Converts a list of frames, packing all images into one uint8 tensor and all boxes into one padded tensor.
 
-            if frame_targets:
-                targets.append(torch.tensor(frame_targets, dtype=torch.float32))
-            else:
-                targets.append(torch.zeros((0, 5), dtype=torch.float32))
+        Args:
+            batch (List[AnnotatedFrame]): the frames of the batch, all of the same shape
 
-            img_info.append(torch.tensor([height, width, 1.0], dtype=torch.float32))
-            img_ids.append(torch.tensor(idx, dtype=torch.int64))
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]: uint8 images, targets, image info and image
+                ids
+        """
+        images = BatchPacker.pack_images(batch)
+        boxes, offsets = BatchPacker.pack_boxes(batch)
 
         return (
-            torch.stack(images, dim=0),
-            YOLOXBatchConverter.pad_targets(targets),
-            torch.stack(img_info, dim=0),
-            torch.stack(img_ids, dim=0)
+            images,
+            torch.from_numpy(BatchPacker.pad_boxes(boxes, offsets)),
+            YOLOXBatchConverter._get_img_info(images),
+            torch.arange(len(batch), dtype=torch.int64)
         )
 
     @staticmethod
-    def pad_targets(targets: List[torch.Tensor]) -> torch.Tensor:
+    def convert_assembled(batch: AssembledBatch) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
         """
-        Pads variable-length targets into a single tensor of shape (B, max_boxes, 5)
+        Converts a server-assembled batch without any per-frame work, sharing memory with the batch arrays.
+
+        Args:
+            batch (AssembledBatch): the assembled batch
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]: uint8 images, targets, image info and image
+                ids
         """
-        batch_size = len(targets)
-        max_boxes = max(t.shape[0] for t in targets)
+        images = torch.from_numpy(batch.images)
 
-        padded = torch.full((batch_size, max_boxes, 5), fill_value=-1.0, dtype=torch.float32)
-        for i, t in enumerate(targets):
-            if t.shape[0] > 0:
-                padded[i, :t.shape[0], :] = t
+        return (
+            images,
+            torch.from_numpy(batch.targets),
+            YOLOXBatchConverter._get_img_info(images),
+            torch.arange(len(images), dtype=torch.int64)
+        )
 
-        return padded
+    @staticmethod
+    def _get_img_info(images: torch.Tensor) -> torch.Tensor:
+        """Returns the [height, width, scale] image info of each image of a batch."""
+        n, _, height, width = images.shape
+        return torch.tensor([[height, width, 1.0]], dtype=torch.float32).repeat(n, 1)
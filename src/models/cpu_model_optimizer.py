@@ -0,0 +1,47 @@
+import copy
+from typing import Optional
+
+import torch
+from torch.nn import Module, Linear
+
+from src.models.cpu_optimization_config import CPUOptimizationConfig
+from src.models.optimized_module import OptimizedModule
+
+
+class CPUModelOptimizer:
+    """Optimizes copies of models for inference on CPUs."""
+
+    @staticmethod
+    def optimize(model: Module, config: CPUOptimizationConfig, submodule: Optional[str] = None) -> Module:
+        """
+        Returns an optimized copy of a model, leaving the model itself unchanged.
+
+        Args:
+            model (Module): the model to optimize
+            config (CPUOptimizationConfig): the optimizations to apply
+            submodule (Optional[str]): the name of the submodule taking a single image tensor to trace, for models
+                with inputs or control flow that cannot be traced as a whole, None to trace the whole model
+
+        Returns:
+            Module: the optimized model, in eval mode
+        """
+        if submodule is not None and not hasattr(model, submodule):
+            raise ValueError(f"Model has no submodule {submodule}")
+
+        optimized = copy.deepcopy(model).cpu().eval()
+
+        if config.quantize_linear:
+            optimized = torch.ao.quantization.quantize_dynamic(optimized, {Linear}, dtype=torch.qint8, inplace=True)
+
+        if config.channels_last:
+            optimized = optimized.to(memory_format=torch.channels_last)
+
+        if not config.jit and not config.channels_last:
+            return optimized
+
+        if submodule is None:
+            return OptimizedModule(optimized, jit=config.jit, channels_last=config.channels_last).eval()
+
+        setattr(optimized, submodule, OptimizedModule(getattr(optimized, submodule), jit=config.jit,
+                                                      channels_last=config.channels_last).eval())
+        return optimized
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CPUOptimizationConfig:
+    """
+    Represents the optimizations applied to a model for inference on CPUs. Optimized predictors always run under
+    torch.inference_mode.
+
+    Attributes:
+        jit (bool): whether to trace and freeze the model with torch.jit, once for each input shape
+        channels_last (bool): whether to run convolutions in the channels last memory format
+        quantize_linear (bool): whether to quantize the weights of linear layers to int8 dynamically
+    """
+    jit: bool = True
+    channels_last: bool = True
+    quantize_linear: bool = True
@@ -0,0 +1,144 @@
+import queue
+import threading
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+import torch
+
+from src.data.structures.atomic_bool import AtomicBool
+
+# timeout for worker loop iterations, in seconds
+WORKER_LOOP_TIMEOUT = 0.1
+
+
+class DevicePrefetcher:
+    """
+    Loader wrapper assembling the next batches on a background thread and moving them to the device ahead of use.
+
+    On CUDA devices, batches are staged in pinned memory and copied with non-blocking transfers on a separate stream,
+    so copies overlap with compute. On other devices, loading and preprocessing the next batches still overlaps with
+    training on the current one.
+    """
+
+    def __init__(self, loader: Iterable, device: torch.device, depth: int = 2):
+        """
+        Initializes a DevicePrefetcher instance.
+
+        Args:
+            loader (Iterable): the loader to prefetch from, yielding batches of tensors nested in lists, tuples and
+                dicts
+            device (torch.device): the device to move batches to
+            depth (int): the max number of batches to prefetch, defaults to 2
+        """
+        if depth < 1:
+            raise ValueError("depth must be greater than 0")
+
+        self._loader = loader
+        self._device = device
+        self._depth = depth
+        self._cuda = device.type == "cuda"
+
+    def __iter__(self) -> Iterator[Any]:
+        batches: queue.Queue[Tuple[str, Any, Optional[torch.cuda.Event]]] = queue.Queue(maxsize=self._depth)
+        running = AtomicBool(True)
+        thread = threading.Thread(target=self._worker, args=(batches, running), daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                kind, batch, event = batches.get()
+                if kind == "error":
+                    raise batch
+
+                if kind == "end":
+                    return
+
+                if event is not None:
+                    stream = torch.cuda.current_stream(self._device)
+                    stream.wait_event(event)
+                    self._record_stream(batch, stream)
+
+                yield batch
+
+        finally:
+            # the worker stops at its next batch, without blocking the consumer if the loader is slow
+            running.set(False)
+
+    def __len__(self) -> int:
+        return len(self._loader)
+
+    def _worker(self, batches: queue.Queue, running: AtomicBool) -> None:
+        """Worker function loading batches and moving them to the device."""
+        copy_stream = torch.cuda.Stream(self._device) if self._cuda else None
+
+        try:
+            for batch in self._loader:
+                if not running:
+                    return
+
+                event = None
+                if copy_stream is not None:
+                    with torch.cuda.stream(copy_stream):
+                        batch = self._to_device(self._pin(batch))
+                        event = torch.cuda.Event()
+                        event.record(copy_stream)
+                else:
+                    batch = self._to_device(batch)
+
+                if not self._put(batches, running, ("batch", batch, event)):
+                    return
+
+            self._put(batches, running, ("end", None, None))
+
+        except Exception as e:
+            self._put(batches, running, ("error", e, None))
+
+    def _to_device(self, obj: Any) -> Any:
+        """Moves all tensors of a batch to the device, without blocking on transfers from pinned memory."""
+        if isinstance(obj, torch.Tensor):
+            return obj.to(self._device, non_blocking=True)
+
+        if isinstance(obj, dict):
+            return type(obj)((key, self._to_device(value)) for key, value in obj.items())
+
+        if isinstance(obj, (list, tuple)):
+            return type(obj)(self._to_device(value) for value in obj)
+
+        return obj
+
+    def _pin(self, obj: Any) -> Any:
+        """Copies all tensors of a batch to pinned memory, unless they are pinned already."""
+        if isinstance(obj, torch.Tensor):
+            return obj if obj.is_pinned() else obj.pin_memory()
+
+        if isinstance(obj, dict):
+            return type(obj)((key, self._pin(value)) for key, value in obj.items())
+
+        if isinstance(obj, (list, tuple)):
+            return type(obj)(self._pin(value) for value in obj)
+
+        return obj
+
+    def _record_stream(self, obj: Any, stream: torch.cuda.Stream) -> None:
+        """Marks all tensors of a batch as used by a stream, so their memory is not reused while it is in use."""
+        if isinstance(obj, torch.Tensor):
+            obj.record_stream(stream)
+
+        elif isinstance(obj, dict):
+            for value in obj.values():
+                self._record_stream(value, stream)
+
+        elif isinstance(obj, (list, tuple)):
+            for value in obj:
+                self._record_stream(value, stream)
+
+    @staticmethod
+    def _put(batches: queue.Queue, running: AtomicBool, item: Tuple[str, Any, Optional[torch.cuda.Event]]) -> bool:
+        """Puts an item in the queue, giving up if the consumer stops, returning whether the item was put."""
+        while running:
+            try:
+                batches.put(item, timeout=WORKER_LOOP_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+
+        return False
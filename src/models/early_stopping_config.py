@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class EarlyStoppingConfig:
+    """
+    Represents the stopping rule of a quick evaluation, which stops reading the stream once the bootstrap confidence
+    intervals of the metrics are narrow enough.
+
+    Attributes:
+        max_ci_width (float): the max width of the confidence intervals of macro F1 and mAP to stop at
+        min_videos (int): the min number of videos to evaluate before stopping
+        check_interval (int): the number of batches between checks of the confidence intervals
+        n_resamples (int): the number of bootstrap resamples
+        confidence (float): the confidence level of the intervals
+        seed (Optional[int]): optional seed for the resampling
+    """
+    max_ci_width: float = 0.05
+    min_videos: int = 10
+    check_interval: int = 20
+    n_resamples: int = 200
+    confidence: float = 0.95
+    seed: Optional[int] = 0
+
+    def __post_init__(self):
+        if self.max_ci_width <= 0:
+            raise ValueError("max_ci_width must be greater than 0")
+
+        if self.min_videos < 1:
+            raise ValueError("min_videos must be greater than 0")
+
+        if self.check_interval < 1:
+            raise ValueError("check_interval must be greater than 0")
@@ -0,0 +1,181 @@
+from typing import List, Optional, Dict, Any
+
+import numpy as np
+from rich.table import Table
+from torch.utils.tensorboard import SummaryWriter
+
+from src.utils.calculators.metrics.box_matcher import BoxMatcher
+from src.utils.calculators.metrics.confusion_calculator import ConfusionCalculator
+from src.utils.calculators.metrics.f1_calculator import F1Calculator
+from src.utils.calculators.metrics.streaming_map_calculator import StreamingMAPCalculator, COCO_IOU_THRESHOLDS
+from src.utils.logging import console
+
+
+class EvaluationMetrics:
+    """Accumulates the confusion matrix, F1 scores and mAP over batches of frames, and reports them."""
+
+    def __init__(self, classes: List[str], iou_thresh: float = 0.5):
+        """
+        Initializes an EvaluationMetrics instance.
+
+        Args:
+            classes (List[str]): the class names in order
+            iou_thresh (float): the iou threshold for matching predictions to ground truths
+        """
+        self._classes = classes
+        self._iou_thresh = iou_thresh
+        self._map_calculator = StreamingMAPCalculator(
+            num_classes=len(self._classes),
+            iou_thresholds=sorted({*COCO_IOU_THRESHOLDS, self._iou_thresh})
+        )
+        self._conf_mat = np.zeros((len(self._classes) + 1, len(self._classes) + 1))
+
+    def reset(self) -> None:
+        """Clears the accumulated metrics."""
+        self._map_calculator.reset()
+        self._conf_mat[:] = 0
+
+    def update(self, preds: List[np.ndarray], gts: List[np.ndarray]) -> np.ndarray:
+        """
+        Updates the metrics with a batch of frames.
+
+        Args:
+            preds (List[np.ndarray]): predictions for each frame, of shape (N, 6) → [x1, y1, x2, y2, class_id, score]
+            gts (List[np.ndarray]): ground truths for each frame, of shape (M, 5) → [x1, y1, x2, y2, class_id]
+
+        Returns:
+            np.ndarray: whether each frame has false positives, false negatives or misclassifications
+        """
+        self._map_calculator.update_batch(preds, gts)
+
+        pred_offsets = np.cumsum([0] + [len(p) for p in preds])
+        gt_offsets = np.cumsum([0] + [len(g) for g in gts])
+        all_preds = np.concatenate([np.asarray(p, dtype=np.float64).reshape(-1, 6) for p in preds], axis=0)
+        all_gts = np.concatenate([np.asarray(g, dtype=np.float64).reshape(-1, 5) for g in gts], axis=0)
+
+        matches = BoxMatcher.match(
+            pred_boxes=all_preds[:, :4],
+            pred_offsets=pred_offsets,
+            gt_boxes=all_gts[:, :4],
+            gt_offsets=gt_offsets,
+            iou_thresh=self._iou_thresh
+        )
+
+        self._conf_mat += ConfusionCalculator.calculate_from_matches(
+            pred_classes=all_preds[:, 4],
+            gt_classes=all_gts[:, 4],
+            matches=matches,
+            num_classes=len(self._classes) + 1
+        )
+
+        n_frames = len(preds)
+        matched = matches >= 0
+        correct = np.zeros(len(matches), dtype=bool)
+        correct[matched] = all_preds[matched, 4] == all_gts[matches[matched], 4]
+        gt_matched = np.zeros(len(all_gts), dtype=bool)
+        gt_matched[matches[matched]] = True
+
+        pred_frames = np.repeat(np.arange(n_frames), np.diff(pred_offsets))
+        gt_frames = np.repeat(np.arange(n_frames), np.diff(gt_offsets))
+        return (np.bincount(pred_frames[~correct], minlength=n_frames) +
+                np.bincount(gt_frames[~gt_matched], minlength=n_frames)) > 0
+
+    def compute(self) -> Dict[str, Any]:
+        """
+        Computes the metrics from the accumulated frames.
+
+        Returns:
+            Dict[str, Any]: the confusion matrix under "confusion_matrix", per-class F1 scores and their mean under
+                "f1" and "macro_f1", the mAP and per-class AP at the iou threshold under "mAP" and "per_class_ap",
+                and the mAP over the COCO thresholds under "mAP_50_95"
+        """
+        f1_scores = [F1Calculator.calculate(self._conf_mat, i) for i in range(len(self._classes))]
+
+        map_result = self._map_calculator.compute()
+        thresh_result = map_result["per_threshold"][self._iou_thresh]
+
+        return {
+            "confusion_matrix": self._conf_mat.copy(),
+            "f1": f1_scores,
+            "macro_f1": sum(f1_scores) / len(f1_scores) if f1_scores else 0.0,
+            "mAP": thresh_result["mAP"],
+            "per_class_ap": thresh_result["per_class_ap"],
+            "mAP_50_95": float(np.mean([map_result["per_threshold"][t]["mAP"] for t in COCO_IOU_THRESHOLDS]))
+        }
+
+    def report(self, summary_writer: Optional[SummaryWriter] = None, epoch: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Prints the metrics to the console, and writes them to tensorboard if a summary writer is given.
+
+        Args:
+            summary_writer (Optional[SummaryWriter]): optional tensorboard summary writer
+            epoch (Optional[int]): optional epoch number
+
+        Returns:
+            Dict[str, Any]: the metrics, as returned by compute
+        """
+        result = self.compute()
+
+        self._write_confusion_matrix(result["confusion_matrix"])
+        self._write_f1(result["f1"], result["macro_f1"], summary_writer, epoch)
+        self._write_map(result["mAP"], result["per_class_ap"], result["mAP_50_95"], summary_writer, epoch)
+
+        return result
+
+    def _write_confusion_matrix(self, matrix: np.ndarray) -> None:
+        """Prints a confusion matrix to the console."""
+        names = self._classes + ["background"]
+
+        table = Table(title="Confusion Matrix")
+        table.add_column("GT \\ Pred", justify="right", style="bold")
+        for name in names:
+            table.add_column(name, justify="right")
+
+        for i, row in enumerate(matrix):
+            table.add_row(names[i], *[str(int(cell)) for cell in row])
+
+        console.print(table)
+
+    def _write_f1(self, f1_scores: List[float], macro_f1: float, summary_writer: Optional[SummaryWriter],
+                  epoch: Optional[int]) -> None:
+        """Prints the F1 scores to the console."""
+        table = Table(title="F1 Scores")
+        table.add_column("Class", justify="right", style="bold")
+        table.add_column("F1 Score", justify="right", style="bold")
+
+        for cls_name, f1 in zip(self._classes, f1_scores):
+            table.add_row(cls_name, f"{f1:.4f}")
+
+        table.add_row("[bold yellow]Macro Avg[/bold yellow]", f"[bold yellow]{macro_f1:.4f}[/bold yellow]")
+
+        console.print(table)
+
+        if summary_writer:
+            epoch = epoch if epoch is not None else 0
+            for label, score in zip(self._classes, f1_scores):
+                summary_writer.add_scalar(f"eval/f1_{label}", score, epoch)
+
+            summary_writer.add_scalar("eval/macro_f1", macro_f1, epoch)
+
+    def _write_map(self, map_score: float, per_class_ap: dict, coco_map: float,
+                   summary_writer: Optional[SummaryWriter], epoch: Optional[int]) -> None:
+        """Prints mAP, per-class AP and mAP@[.5:.95] using rich table."""
+        table = Table(title="AP Scores")
+        table.add_column("Class", justify="right", style="bold")
+        table.add_column("AP", justify="right", style="bold")
+
+        for cls_id, ap in sorted(per_class_ap.items()):
+            class_name = self._classes[cls_id] if cls_id < len(self._classes) else f"Class {cls_id}"
+            table.add_row(class_name, f"{ap:.4f}")
+
+        table.add_row("[bold yellow]mAP[/bold yellow]", f"[bold yellow]{map_score:.4f}[/bold yellow]")
+        table.add_row("[bold yellow]mAP@[.5:.95][/bold yellow]", f"[bold yellow]{coco_map:.4f}[/bold yellow]")
+        console.print(table)
+
+        if summary_writer:
+            epoch = epoch if epoch is not None else 0
+            for cls_id, ap in per_class_ap.items():
+                label = self._classes[cls_id] if cls_id < len(self._classes) else f"class_{cls_id}"
+                summary_writer.add_scalar(f"eval/ap_{label}", ap, epoch)
+            summary_writer.add_scalar("eval/mAP", map_score, epoch)
+            summary_writer.add_scalar("eval/mAP_50_95", coco_map, epoch)
@@ -0,0 +1,161 @@
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import torch
+
+from src.models.cached_features import CachedFeatures
+
+# file with the feature maps of all cached frames, stored back to back
+DATA_FILE = "features.bin"
+
+# file with the position and shapes of the features of each cached frame
+INDEX_FILE = "index.json"
+
+# data type the features are stored as
+FEATURE_DTYPE = np.float16
+
+# torch counterpart of the feature data type
+FEATURE_DTYPE_TORCH = torch.float16
+
+
+class FeatureCache:
+    """
+    On-disk cache of the backbone features of frames, for training heads on top of a frozen backbone.
+
+    Features are appended to a single data file and read back through a memory map, so cached frames cost no memory
+    beyond the pages in use. The index is written on flush, and frames appended after the last flush are discarded
+    when the cache is reopened.
+    """
+
+    def __init__(self, path: str, max_bytes: Optional[int] = None):
+        """
+        Initializes a FeatureCache instance.
+
+        Args:
+            path (str): the directory of the cache, reopening the cache if it exists
+            max_bytes (Optional[int]): the max size of the cached features in bytes, frames beyond it are not
+                cached, None for no limit
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+        self._max_bytes = max_bytes
+
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+        self._size = max((e["offset"] + e["n_bytes"] for e in self._index.values()), default=0)
+
+        self._data_path = os.path.join(path, DATA_FILE)
+        with open(self._data_path, "ab") as f:
+            f.truncate(self._size)
+
+        self._file = open(self._data_path, "ab")
+        self._mmap: Optional[np.memmap] = None
+
+    def get(self, key: str) -> Optional[CachedFeatures]:
+        """
+        Returns the cached features of a frame.
+
+        Args:
+            key (str): the key of the frame
+
+        Returns:
+            Optional[CachedFeatures]: read-only views of the cached features, or None if the frame is not cached
+        """
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+
+        data = self._get_mmap(entry["offset"] + entry["n_bytes"])
+        features = {}
+        offset = entry["offset"]
+        for name, shape in entry["levels"]:
+            n_bytes = int(np.prod(shape)) * np.dtype(FEATURE_DTYPE).itemsize
+            features[name] = data[offset:offset + n_bytes].view(FEATURE_DTYPE).reshape(shape)
+            offset += n_bytes
+
+        return CachedFeatures(
+            features=features,
+            image_size=tuple(entry["image_size"]),
+            padded_size=tuple(entry["padded_size"])
+        )
+
+    def put(self, key: str, features: Dict[str, torch.Tensor], image_size: Tuple[int, int],
+            padded_size: Tuple[int, int]) -> bool:
+        """
+        Caches the features of a frame, unless it is cached already or the cache is full.
+
+        Args:
+            key (str): the key of the frame
+            features (Dict[str, torch.Tensor]): the (C, H, W) feature maps of each feature level, in order
+            image_size (Tuple[int, int]): the (height, width) of the frame after resizing by the model
+            padded_size (Tuple[int, int]): the (height, width) of the frame after padding by the model
+
+        Returns:
+            bool: True if the features were cached, False otherwise
+        """
+        if key in self._index:
+            return False
+
+        arrays = [(name, f.detach().to("cpu", FEATURE_DTYPE_TORCH).numpy()) for name, f in features.items()]
+        n_bytes = sum(a.nbytes for _, a in arrays)
+        if self._max_bytes is not None and self._size + n_bytes > self._max_bytes:
+            return False
+
+        for _, a in arrays:
+            self._file.write(np.ascontiguousarray(a).tobytes())
+
+        self._index[key] = {
+            "offset": self._size,
+            "n_bytes": n_bytes,
+            "levels": [[name, list(a.shape)] for name, a in arrays],
+            "image_size": list(image_size),
+            "padded_size": list(padded_size)
+        }
+        self._size += n_bytes
+
+        return True
+
+    def flush(self) -> None:
+        """Writes the cached features and the index to disk."""
+        self._file.flush()
+
+        tmp_path = os.path.join(self._path, f"{INDEX_FILE}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, os.path.join(self._path, INDEX_FILE))
+
+    def close(self) -> None:
+        """Flushes and closes the cache."""
+        if self._file.closed:
+            return
+
+        self.flush()
+        self._file.close()
+        self._mmap = None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _get_mmap(self, end: int) -> np.memmap:
+        """Returns a memory map of the data file, remapping it if it does not cover the bytes up to end."""
+        if self._mmap is None or len(self._mmap) < end:
+            self._file.flush()
+            self._mmap = np.memmap(self._data_path, dtype=np.uint8, mode="r")
+
+        return self._mmap
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Loads the index of an existing cache, or returns an empty index."""
+        index_path = os.path.join(self._path, INDEX_FILE)
+        if not os.path.exists(index_path):
+            return {}
+
+        with open(index_path) as f:
+            return json.load(f)
@@ -0,0 +1,57 @@
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class FrameDifferenceScorer:
+    """Scores how much frames differ from a reference frame, comparing small grayscale copies of the frames."""
+
+    def __init__(self, size: Tuple[int, int] = (64, 36)):
+        """
+        Initializes a FrameDifferenceScorer instance.
+
+        Args:
+            size (Tuple[int, int]): the (width, height) frames are downscaled to before comparing, defaults to (64, 36)
+        """
+        if size[0] < 1 or size[1] < 1:
+            raise ValueError("size must be positive")
+
+        self._size = size
+        self._reference: Optional[np.ndarray] = None
+
+    def score(self, image: np.ndarray) -> float:
+        """
+        Scores the difference between an image and the reference frame.
+
+        Args:
+            image (np.ndarray): the (H, W, C) BGR or (H, W) grayscale image
+
+        Returns:
+            float: the mean absolute difference of the downscaled images, from 0 to 1, or infinity without a reference
+        """
+        if self._reference is None:
+            return float("inf")
+
+        return float(np.abs(self._downscale(image) - self._reference).mean())
+
+    def set_reference(self, image: np.ndarray) -> None:
+        """
+        Sets the frame to compare images to.
+
+        Args:
+            image (np.ndarray): the (H, W, C) BGR or (H, W) grayscale image
+        """
+        self._reference = self._downscale(image)
+
+    def reset(self) -> None:
+        """Clears the reference frame."""
+        self._reference = None
+
+    def _downscale(self, image: np.ndarray) -> np.ndarray:
+        """Downscales an image to a small grayscale copy with values from 0 to 1."""
+        small = cv2.resize(image, self._size, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+        return small.astype(np.float32) / 255.0
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import List
+
+from src.data.dataclasses.frame import Frame
+from src.models.prediction import Prediction
+
+
+@dataclass(frozen=True)
+class GatedPrediction:
+    """
+    Represents the predictions for a frame of motion-gated inference.
+
+    Attributes:
+        frame (Frame): the frame
+        predictions (List[Prediction]): the predictions for the frame
+        inferred (bool): whether the predictions were inferred for this frame, or propagated from an earlier frame
+        motion (float): the difference score of the frame against the last inferred frame
+    """
+    frame: Frame
+    predictions: List[Prediction]
+    inferred: bool
+    motion: float
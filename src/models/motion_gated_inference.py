@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from src.data.dataclasses.frame import Frame
+from src.data.pipeline.consumer import Consumer
+from src.models.frame_difference_scorer import FrameDifferenceScorer
+from src.models.gated_prediction import GatedPrediction
+from src.models.prediction import Prediction
+from src.models.predictor import Predictor
+
+
+class MotionGatedInference(Consumer[Frame]):
+    """
+    Consumer of video frames running a predictor only on frames that differ enough from the last frame it ran on, and
+    propagating the last predictions to the frames in between.
+    """
+
+    def __init__(self, predictor: Predictor, consumer: Optional[Consumer[GatedPrediction]] = None,
+                 motion_thresh: float = 0.02, max_staleness: int = 30, size: Tuple[int, int] = (64, 36)):
+        """
+        Initializes a MotionGatedInference instance.
+
+        Args:
+            predictor (Predictor): the predictor to run on frames with motion
+            consumer (Optional[Consumer[GatedPrediction]]): optional consumer of the predictions for each frame
+            motion_thresh (float): the min mean absolute difference from the last inferred frame, from 0 to 1, for
+                running the predictor, defaults to 0.02
+            max_staleness (int): the max number of frames to propagate predictions to before running the predictor
+                regardless of motion, defaults to 30
+            size (Tuple[int, int]): the (width, height) frames are downscaled to for scoring motion, defaults to
+                (64, 36)
+        """
+        if motion_thresh < 0:
+            raise ValueError("motion_thresh must be non-negative")
+
+        if max_staleness < 0:
+            raise ValueError("max_staleness must be non-negative")
+
+        self._predictor = predictor
+        self._consumer = consumer
+        self._motion_thresh = motion_thresh
+        self._max_staleness = max_staleness
+        self._scorer = FrameDifferenceScorer(size)
+
+        self._source_id: Optional[str] = None
+        self._predictions: List[Prediction] = []
+        self._staleness = 0
+
+        self._n_frames = 0
+        self._n_inferences = 0
+        self._inference_time = 0.0
+        self._stats_lock = threading.Lock()
+
+    def consume(self, data: Optional[Frame]) -> bool:
+        if data is None:
+            self._reset()
+            print(f"[MotionGatedInference] Ran inference on {self._n_inferences}/{self._n_frames} frames, "
+                  f"effective inference rate {self.get_inference_rate():.1%}")
+            return self._consumer.consume(None) if self._consumer is not None else True
+
+        if data.source.source_id != self._source_id:
+            self._reset()
+            self._source_id = data.source.source_id
+
+        motion = self._scorer.score(data.data)
+        inferred = motion > self._motion_thresh or self._staleness >= self._max_staleness
+        if inferred:
+            start = time.perf_counter()
+            self._predictions = self._predictor.predict(data.data)
+            elapsed = time.perf_counter() - start
+
+            self._scorer.set_reference(data.data)
+            self._staleness = 0
+        else:
+            elapsed = 0.0
+            self._staleness += 1
+
+        with self._stats_lock:
+            self._n_frames += 1
+            self._n_inferences += int(inferred)
+            self._inference_time += elapsed
+
+        if self._consumer is not None:
+            return self._consumer.consume(GatedPrediction(
+                frame=data, predictions=self._predictions, inferred=inferred, motion=motion
+            ))
+
+        return True
+
+    def get_n_frames(self) -> int:
+        """
+        Returns the number of frames consumed.
+
+        Returns:
+            int: the number of frames
+        """
+        with self._stats_lock:
+            return self._n_frames
+
+    def get_n_inferences(self) -> int:
+        """
+        Returns the number of frames the predictor has run on.
+
+        Returns:
+            int: the number of inferred frames
+        """
+        with self._stats_lock:
+            return self._n_inferences
+
+    def get_inference_rate(self) -> float:
+        """
+        Returns the effective inference rate, the fraction of frames the predictor has run on.
+
+        Returns:
+            float: the fraction of inferred frames, or 0 if no frames have been consumed
+        """
+        with self._stats_lock:
+            return self._n_inferences / self._n_frames if self._n_frames > 0 else 0.0
+
+    def get_inference_time(self) -> float:
+        """
+        Returns the total time spent running the predictor.
+
+        Returns:
+            float: the inference time in seconds
+        """
+        with self._stats_lock:
+            return self._inference_time
+
+    def _reset(self) -> None:
+        """Forgets the last inferred frame and its predictions, so the next frame is inferred."""
+        self._scorer.reset()
+        self._source_id = None
+        self._predictions = []
+        self._staleness = 0
@@ -0,0 +1,47 @@
+from typing import Any, Dict, Tuple
+
+import torch
+from torch.nn import Module
+
+
+class OptimizedModule(Module):
+    """
+    Wraps a module taking a single image tensor, converting its input to the channels last memory format and running
+    a frozen torch.jit trace of the module traced for each input shape.
+    """
+
+    def __init__(self, module: Module, jit: bool = True, channels_last: bool = True):
+        """
+        Initializes an OptimizedModule instance.
+
+        Args:
+            module (Module): the module to wrap, in eval mode
+            jit (bool): whether to trace and freeze the module, defaults to True
+            channels_last (bool): whether to convert inputs to the channels last memory format, defaults to True
+        """
+        super().__init__()
+        self.module = module
+        self._jit = jit
+        self._channels_last = channels_last
+        self._traces: Dict[Tuple[Tuple[int, ...], torch.dtype], torch.jit.ScriptModule] = {}
+
+    def forward(self, x: torch.Tensor) -> Any:
+        if self._channels_last and x.dim() == 4:
+            x = x.contiguous(memory_format=torch.channels_last)
+
+        if not self._jit:
+            return self.module(x)
+
+        key = (tuple(x.shape), x.dtype)
+        trace = self._traces.get(key)
+        if trace is None:
+            trace = self._trace(x)
+            self._traces[key] = trace
+
+        return trace(x)
+
+    def _trace(self, x: torch.Tensor) -> torch.jit.ScriptModule:
+        """Traces and freezes the module for inputs of the shape of an example input."""
+        with torch.no_grad():
+            trace = torch.jit.trace(self.module, x, strict=False)
+            return torch.jit.freeze(trace.eval())
@@ -0,0 +1,40 @@
+from typing import Optional
+
+import numpy as np
+import torch
+import torchvision.ops
+
+
+class PredictionFilter:
+    """Filters prediction arrays by confidence and per-class non-maximum suppression."""
+
+    def __init__(self, conf_thresh: float = 0.0, nms_iou: Optional[float] = None):
+        """
+        Initializes a PredictionFilter instance.
+
+        Args:
+            conf_thresh (float): the minimum confidence of predictions to keep, defaults to 0
+            nms_iou (Optional[float]): the iou threshold for per-class non-maximum suppression, None for no
+                suppression
+        """
+        self._conf_thresh = conf_thresh
+        self._nms_iou = nms_iou
+
+    def filter(self, preds: np.ndarray) -> np.ndarray:
+        """
+        Returns the indices of the predictions to keep.
+
+        Args:
+            preds (np.ndarray): the predictions of a frame, of shape (N, 6) → [x1, y1, x2, y2, class_id, score]
+
+        Returns:
+            np.ndarray: the indices of the kept predictions, in ascending order
+        """
+        keep = np.flatnonzero(preds[:, 5] >= self._conf_thresh)
+
+        if self._nms_iou is not None and len(keep) > 1:
+            kept = torch.from_numpy(np.ascontiguousarray(preds[keep], dtype=np.float32))
+            nms_keep = torchvision.ops.batched_nms(kept[:, :4], kept[:, 5], kept[:, 4].long(), self._nms_iou)
+            keep = np.sort(keep[nms_keep.numpy()])
+
+        return keep
@@ -0,0 +1,123 @@
+import json
+import os
+from typing import List, Tuple, Iterator
+
+import numpy as np
+
+# file with the class names and frame count
+META_FILE = "meta.json"
+
+# file with the predictions of all frames, [x1, y1, x2, y2, class_id, score] rows
+PREDS_FILE = "preds.npy"
+
+# file with the index of the first prediction of each frame, followed by the number of predictions
+PRED_OFFSETS_FILE = "pred_offsets.npy"
+
+# file with the ground truths of all frames, [x1, y1, x2, y2, class_id] rows
+GTS_FILE = "gts.npy"
+
+# file with the index of the first ground truth of each frame, followed by the number of ground truths
+GT_OFFSETS_FILE = "gt_offsets.npy"
+
+# file with the source id of each frame
+SOURCE_IDS_FILE = "source_ids.npy"
+
+# file with the index of each frame in its source
+FRAME_INDICES_FILE = "frame_indices.npy"
+
+
+class PredictionStore:
+    """
+    Read-only columnar store of raw predictions and ground truths for evaluated frames.
+
+    The rows of all frames are stored in memory-mapped arrays, with per-frame offsets, so metrics can be recomputed
+    without loading the whole store or running inference again.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes a PredictionStore instance.
+
+        Args:
+            path (str): the directory of the store
+        """
+        with open(os.path.join(path, META_FILE)) as f:
+            meta = json.load(f)
+
+        self._classes: List[str] = meta["classes"]
+
+        self._preds = self._load(path, PREDS_FILE)
+        self._pred_offsets = self._load(path, PRED_OFFSETS_FILE)
+        self._gts = self._load(path, GTS_FILE)
+        self._gt_offsets = self._load(path, GT_OFFSETS_FILE)
+        self._source_ids = self._load(path, SOURCE_IDS_FILE)
+        self._frame_indices = self._load(path, FRAME_INDICES_FILE)
+
+    def get_classes(self) -> List[str]:
+        """
+        Returns the class names of the store.
+
+        Returns:
+            List[str]: the class names in order
+        """
+        return list(self._classes)
+
+    def get_frame(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the predictions and ground truths of a frame.
+
+        Args:
+            i (int): the position of the frame in the store
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: the (N, 6) predictions and (M, 5) ground truths of the frame
+        """
+        if not 0 <= i < len(self):
+            raise IndexError(f"Frame {i} is out of range for store with {len(self)} frames")
+
+        preds = self._preds[self._pred_offsets[i]:self._pred_offsets[i + 1]]
+        gts = self._gts[self._gt_offsets[i]:self._gt_offsets[i + 1]]
+        return preds, gts
+
+    def get_frame_key(self, i: int) -> Tuple[str, int]:
+        """
+        Returns the key of a frame.
+
+        Args:
+            i (int): the position of the frame in the store
+
+        Returns:
+            Tuple[str, int]: the source id and index of the frame
+        """
+        return str(self._source_ids[i]), int(self._frame_indices[i])
+
+    def iter_batches(self, batch_size: int) -> Iterator[Tuple[List[np.ndarray], List[np.ndarray]]]:
+        """
+        Iterates over the frames of the store in batches.
+
+        Args:
+            batch_size (int): the number of frames per batch
+
+        Returns:
+            Iterator[Tuple[List[np.ndarray], List[np.ndarray]]]: the predictions and ground truths of each frame in
+                each batch
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+
+        for start in range(0, len(self), batch_size):
+            end = min(start + batch_size, len(self))
+            preds = np.split(self._preds[self._pred_offsets[start]:self._pred_offsets[end]],
+                             self._pred_offsets[start + 1:end] - self._pred_offsets[start])
+            gts = np.split(self._gts[self._gt_offsets[start]:self._gt_offsets[end]],
+                           self._gt_offsets[start + 1:end] - self._gt_offsets[start])
+            yield preds, gts
+
+    def __len__(self) -> int:
+        return len(self._pred_offsets) - 1
+
+    @staticmethod
+    def _load(path: str, file: str) -> np.ndarray:
+        """Loads an array of the store, memory-mapping it unless it is empty."""
+        array = np.load(os.path.join(path, file), mmap_mode="r")
+        return array if array.size > 0 else np.load(os.path.join(path, file))
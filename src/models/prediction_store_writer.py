@@ -0,0 +1,83 @@
+import json
+import os
+import shutil
+from typing import List
+
+import numpy as np
+
+from src.data.structures.growable_array import GrowableArray
+from src.models.prediction_store import PredictionStore, META_FILE, PREDS_FILE, PRED_OFFSETS_FILE, GTS_FILE, \
+    GT_OFFSETS_FILE, SOURCE_IDS_FILE, FRAME_INDICES_FILE
+
+
+class PredictionStoreWriter:
+    """Collects predictions and ground truths of evaluated frames and writes them as a PredictionStore."""
+
+    def __init__(self, path: str, classes: List[str]):
+        """
+        Initializes a PredictionStoreWriter instance.
+
+        Args:
+            path (str): the directory to write the store to, replaced if it exists
+            classes (List[str]): the class names in order
+        """
+        self._path = path
+        self._classes = classes
+
+        self._preds = GrowableArray(row_shape=(6,), dtype=np.float32)
+        self._gts = GrowableArray(row_shape=(5,), dtype=np.float32)
+        self._pred_counts = GrowableArray(dtype=np.int64)
+        self._gt_counts = GrowableArray(dtype=np.int64)
+        self._source_ids: List[str] = []
+        self._frame_indices = GrowableArray(dtype=np.int64)
+
+    def append(self, source_ids: List[str], frame_indices: List[int], preds: List[np.ndarray],
+               gts: List[np.ndarray]) -> None:
+        """
+        Appends a batch of frames.
+
+        Args:
+            source_ids (List[str]): the id of the source of each frame
+            frame_indices (List[int]): the index of each frame in its source
+            preds (List[np.ndarray]): predictions for each frame, of shape (N, 6) → [x1, y1, x2, y2, class_id, score]
+            gts (List[np.ndarray]): ground truths for each frame, of shape (M, 5) → [x1, y1, x2, y2, class_id]
+        """
+        if not len(source_ids) == len(frame_indices) == len(preds) == len(gts):
+            raise ValueError("Got different numbers of source ids, frame indices, predictions and ground truths")
+
+        for frame_preds, frame_gts in zip(preds, gts):
+            self._preds.extend(np.asarray(frame_preds).reshape(-1, 6))
+            self._gts.extend(np.asarray(frame_gts).reshape(-1, 5))
+
+        self._pred_counts.extend(np.array([len(p) for p in preds], dtype=np.int64))
+        self._gt_counts.extend(np.array([len(g) for g in gts], dtype=np.int64))
+        self._source_ids.extend(source_ids)
+        self._frame_indices.extend(np.asarray(frame_indices, dtype=np.int64))
+
+    def close(self) -> PredictionStore:
+        """
+        Writes the store, first to a temporary directory which is then moved into place.
+
+        Returns:
+            PredictionStore: the written store
+        """
+        tmp_path = f"{self._path}.tmp"
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
+        os.makedirs(tmp_path)
+
+        np.save(os.path.join(tmp_path, PREDS_FILE), self._preds.view())
+        np.save(os.path.join(tmp_path, GTS_FILE), self._gts.view())
+        np.save(os.path.join(tmp_path, PRED_OFFSETS_FILE), np.concatenate([[0], np.cumsum(self._pred_counts.view())]))
+        np.save(os.path.join(tmp_path, GT_OFFSETS_FILE), np.concatenate([[0], np.cumsum(self._gt_counts.view())]))
+        np.save(os.path.join(tmp_path, SOURCE_IDS_FILE), np.array(self._source_ids, dtype=str))
+        np.save(os.path.join(tmp_path, FRAME_INDICES_FILE), self._frame_indices.view())
+
+        with open(os.path.join(tmp_path, META_FILE), "w") as f:
+            json.dump({"classes": self._classes, "n_frames": len(self._source_ids)}, f)
+
+        if os.path.exists(self._path):
+            shutil.rmtree(self._path)
+        os.replace(tmp_path, self._path)
+
+        return PredictionStore(self._path)
@@ -20,4 +20,16 @@ class Predictor(ABC):
         Returns:
             List[Prediction]: list of predictions
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def predict_batch(self, images: List[np.ndarray]) -> List[List[Prediction]]:
+        """
+        Makes predictions for a batch of images.
+
+        Args:
+            images (List[np.ndarray]): the images to make predictions for
+
+        Returns:
+            List[List[Prediction]]: list of predictions for each image, in the order of the images
+        """
+        return [self.predict(image) for image in images]
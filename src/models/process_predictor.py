@@ -0,0 +1,97 @@
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from src.models.prediction import Prediction
+from src.models.predictor import Predictor
+
+# seconds to wait for the worker process to shut down before terminating it
+WORKER_SHUTDOWN_TIMEOUT = 10.0
+
+
+def _run_worker(predictor_factory: Callable[[], Predictor], conn: Connection) -> None:
+    """Creates a predictor and serves batch predictions over the connection until it receives None."""
+    predictor = predictor_factory()
+
+    while (images := conn.recv()) is not None:
+        try:
+            conn.send(("ok", predictor.predict_batch(images)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+    conn.close()
+
+
+class ProcessPredictor(Predictor):
+    """Predictor running another predictor in a separate worker process."""
+
+    def __init__(self, predictor_factory: Callable[[], Predictor]):
+        """
+        Initializes a ProcessPredictor instance.
+
+        Args:
+            predictor_factory (Callable[[], Predictor]): picklable function creating the predictor, called inside
+                the worker process
+        """
+        self._factory = predictor_factory
+
+        self._conn: Optional[Connection] = None
+        self._process: Optional[multiprocessing.Process] = None
+        self._lock = threading.Lock()
+
+    def run(self) -> None:
+        """Starts the worker process."""
+        with self._lock:
+            if self._process is not None:
+                raise RuntimeError("ProcessPredictor is already running")
+
+            self._conn, child_conn = multiprocessing.Pipe()
+            self._process = multiprocessing.Process(
+                target=_run_worker,
+                args=(self._factory, child_conn),
+                daemon=True
+            )
+            self._process.start()
+            child_conn.close()
+
+    def predict(self, image: np.ndarray) -> List[Prediction]:
+        return self.predict_batch([image])[0]
+
+    def predict_batch(self, images: List[np.ndarray]) -> List[List[Prediction]]:
+        with self._lock:
+            if self._process is None:
+                raise RuntimeError("ProcessPredictor is not running")
+
+            try:
+                self._conn.send(images)
+                status, result = self._conn.recv()
+            except (EOFError, OSError) as e:
+                raise RuntimeError(f"Predictor worker process died: {e}")
+
+        if status != "ok":
+            raise RuntimeError(f"Predictor worker process failed to make predictions: {result}")
+
+        return result
+
+    def close(self) -> None:
+        """Stops the worker process."""
+        with self._lock:
+            if self._process is None:
+                return
+
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+
+            self._process.join(timeout=WORKER_SHUTDOWN_TIMEOUT)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+
+            self._conn.close()
+            self._conn = None
+            self._process = None
@@ -0,0 +1,164 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Tuple, Optional
+
+import numpy as np
+
+from src.data.structures.atomic_bool import AtomicBool
+from src.models.prediction import Prediction
+from src.utils.histogram import Histogram
+
+# upper bounds for latency histogram buckets, in seconds
+LATENCY_BOUNDS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]
+
+WORKER_LOOP_TIMEOUT = 0.1
+
+
+class DynamicBatcher:
+    """Coalesces single-image prediction requests from many threads into batches for a batch prediction function."""
+
+    def __init__(self, predict_fn: Callable[[List[np.ndarray]], List[List[Prediction]]], max_batch_size: int = 8,
+                 max_queue_delay: float = 0.01):
+        """
+        Initializes a DynamicBatcher instance.
+
+        Args:
+            predict_fn (Callable[[List[np.ndarray]], List[List[Prediction]]]): function making predictions for a batch
+                of images, returning the predictions of each image in order
+            max_batch_size (int): the max number of images per batch, defaults to 8
+            max_queue_delay (float): the max number of seconds the first request of a batch waits for more requests,
+                defaults to 0.01
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be greater than 0")
+
+        if max_queue_delay < 0:
+            raise ValueError("max_queue_delay must be non-negative")
+
+        self._predict_fn = predict_fn
+        self._max_batch_size = max_batch_size
+        self._max_queue_delay = max_queue_delay
+
+        self._queue: queue.Queue[Tuple[np.ndarray, Future, float]] = queue.Queue()
+
+        self._latency_histogram = Histogram(LATENCY_BOUNDS)
+        self._batch_size_histogram = Histogram(list(range(1, max_batch_size + 1)))
+
+        self._thread: Optional[threading.Thread] = None
+        self._run_lock = threading.Lock()
+        self._running = AtomicBool(False)
+
+    def run(self) -> None:
+        """Runs the batcher."""
+        with self._run_lock:
+            if self._running:
+                raise RuntimeError("DynamicBatcher is already running")
+
+            self._running.set(True)
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the batcher, failing all pending requests."""
+        with self._run_lock:
+            self._running.set(False)
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            future.set_exception(RuntimeError("DynamicBatcher was stopped"))
+
+    def submit(self, image: np.ndarray) -> Future:
+        """
+        Submits an image for prediction.
+
+        Args:
+            image (np.ndarray): the image to make predictions for
+
+        Returns:
+            Future: future resolving to the list of predictions for the image
+        """
+        if not self._running:
+            raise RuntimeError("DynamicBatcher is not running")
+
+        future = Future()
+        self._queue.put((image, future, time.perf_counter()))
+        return future
+
+    def predict(self, image: np.ndarray, timeout: Optional[float] = None) -> List[Prediction]:
+        """
+        Makes predictions for an image, blocking until its batch has been run.
+
+        Args:
+            image (np.ndarray): the image to make predictions for
+            timeout (Optional[float]): the max number of seconds to wait, None for no timeout
+
+        Returns:
+            List[Prediction]: the predictions for the image
+        """
+        return self.submit(image).result(timeout=timeout)
+
+    def get_latency_histogram(self) -> Histogram:
+        """
+        Returns the histogram of request latencies, from submission until predictions are ready.
+
+        Returns:
+            Histogram: the latency histogram, in seconds
+        """
+        return self._latency_histogram
+
+    def get_batch_size_histogram(self) -> Histogram:
+        """
+        Returns the histogram of the sizes of the batches run.
+
+        Returns:
+            Histogram: the batch size histogram
+        """
+        return self._batch_size_histogram
+
+    def _worker(self) -> None:
+        """Worker function collecting and running batches."""
+        while self._running:
+            try:
+                first = self._queue.get(timeout=WORKER_LOOP_TIMEOUT)
+            except queue.Empty:
+                continue
+
+            self._run_batch(self._collect(first))
+
+    def _collect(self, first: Tuple[np.ndarray, Future, float]) -> List[Tuple[np.ndarray, Future, float]]:
+        """Collects requests into a batch until it is full or the first request has waited the max queue delay."""
+        batch = [first]
+        deadline = first[2] + self._max_queue_delay
+
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run_batch(self, batch: List[Tuple[np.ndarray, Future, float]]) -> None:
+        """Runs the prediction function on a batch and resolves the futures of its requests."""
+        self._batch_size_histogram.record(len(batch))
+
+        try:
+            results = self._predict_fn([image for image, _, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"Expected {len(batch)} prediction lists, got {len(results)}")
+
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        now = time.perf_counter()
+        for (_, future, submitted), predictions in zip(batch, results):
+            self._latency_histogram.record(now - submitted)
+            future.set_result(predictions)
@@ -0,0 +1,47 @@
+from typing import List
+
+import numpy as np
+
+from src.models.prediction import Prediction
+from src.models.predictor import Predictor
+from src.network.client.network_client import NetworkClient
+from src.network.messages.requests.predict_batch_request import PredictBatchRequest
+from src.network.messages.requests.predict_request import PredictRequest
+from src.network.messages.responses.predict_batch_response import PredictBatchResponse
+from src.network.messages.responses.predict_response import PredictResponse
+from src.network.messages.responses.response_status import ResponseStatus
+
+
+class RemotePredictor(Predictor):
+    """Predictor sending images to an inference server."""
+
+    def __init__(self, client: NetworkClient):
+        """
+        Initializes a RemotePredictor instance.
+
+        Args:
+            client (NetworkClient): network client connected to an inference server
+        """
+        self._client = client
+
+    def predict(self, image: np.ndarray) -> List[Prediction]:
+        response = self._client.send_request(PredictRequest(image=image))
+
+        if not isinstance(response, PredictResponse):
+            raise RuntimeError("Got unexpected response from server")
+
+        if response.status != ResponseStatus.SUCCESS:
+            raise RuntimeError("Server failed to make predictions")
+
+        return response.predictions
+
+    def predict_batch(self, images: List[np.ndarray]) -> List[List[Prediction]]:
+        response = self._client.send_request(PredictBatchRequest(images=images))
+
+        if not isinstance(response, PredictBatchResponse):
+            raise RuntimeError("Got unexpected response from server")
+
+        if response.status != ResponseStatus.SUCCESS:
+            raise RuntimeError("Server failed to make predictions")
+
+        return response.predictions
@@ -1,25 +1,27 @@
+import copy
 import os
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Tuple
 import datetime
 
 import numpy as np
-import torchvision.ops
 from rich.table import Table
-from scipy.optimize import linear_sum_assignment
 from torch.utils.tensorboard import SummaryWriter
-import torch
 
 from src.data.dataclasses.annotated_bbox import AnnotatedBBox
 from src.data.dataclasses.annotated_frame import AnnotatedFrame
 from src.data.dataset.streams.providers.stream_provider import StreamProvider
-from src.models.evalutor_visualizer import EvaluatorVisualizer
+from src.models.early_stopping_config import EarlyStoppingConfig
+from src.models.evaluation_metrics import EvaluationMetrics
 from src.models.prediction import Prediction
+from src.models.prediction_filter import PredictionFilter
+from src.models.prediction_store_writer import PredictionStoreWriter
 from src.models.predictor import Predictor
-from src.utils.calculators.metrics.confusion_calculator import ConfusionCalculator
-from src.utils.calculators.metrics.f1_calculator import F1Calculator
-from src.utils.calculators.metrics.iou_calculator import IoUCalculator
-from src.utils.calculators.metrics.map_calculator import MAPCalculator
+from src.utils.calculators.metrics.bootstrap_metrics_estimator import BootstrapMetricsEstimator
 from src.utils.logging import console
+from src.utils.visualization.samplers.every_nth_frame_sampler import EveryNthFrameSampler
+from src.utils.visualization.samplers.visualization_sampler import VisualizationSampler
+from src.utils.visualization.visualization_writer import VisualizationWriter
 
 BATCH_SIZE = 300
 
@@ -28,7 +30,11 @@ class StreamingEvaluator:
     """Computes evaluation metrics with streaming compatibility."""
 
     def __init__(self, stream_provider: StreamProvider[AnnotatedFrame], classes: List[str], iou_thresh: float = 0.5,
-                 nms: bool = True, output_dir: str = "faster_rcnn_outputs"):
+                 nms: bool = True, output_dir: str = "faster_rcnn_outputs", batch_size: int = 8,
+                 sampler: Optional[VisualizationSampler] = None, n_writers: int = 2, max_pending_images: int = 64,
+                 conf_thresh: float = 0.0, save_predictions: bool = True,
+                 early_stopping: Optional[EarlyStoppingConfig] = None,
+                 subset_stream_provider: Optional[StreamProvider[AnnotatedFrame]] = None):
         """
         Initializes a StreamingEvaluator instance.
 
@@ -38,206 +44,296 @@ class StreamingEvaluator:
             iou_thresh (float): the iou threshold for predictions
             nms (bool): whether to apply non-maximum suppression
             output_dir (str): output directory
+            batch_size (int): the number of frames to predict on at once, defaults to 8
+            sampler (Optional[VisualizationSampler]): sampler choosing the frames to visualize, defaults to every frame
+                with predictions or ground truths
+            n_writers (int): the number of background threads writing visualizations, defaults to 2
+            max_pending_images (int): the max number of visualizations waiting to be written before new ones are
+                dropped, defaults to 64
+            conf_thresh (float): the minimum confidence of predictions to evaluate, defaults to 0
+            save_predictions (bool): whether to save the raw predictions and ground truths to a prediction store for
+                re-scoring, defaults to True
+            early_stopping (Optional[EarlyStoppingConfig]): optional stopping rule for quick evaluations, which report
+                bootstrap confidence intervals and stop once they are narrow enough, None to always evaluate fully
+            subset_stream_provider (Optional[StreamProvider[AnnotatedFrame]]): optional provider of a stream over a
+                subset of the evaluation videos for quick evaluations, defaults to the evaluation stream
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+
         self._stream_provider = stream_provider
         self._classes: List[str] = classes
         self._iou_thresh = iou_thresh
-        self._nms = nms
-        self._background_cls_idx = len(self._classes)
-        self._map_calculator = MAPCalculator(num_classes=len(self._classes), iou_threshold=self._iou_thresh)
+        self._filter = PredictionFilter(conf_thresh=conf_thresh, nms_iou=iou_thresh if nms else None)
         self._output_dir = output_dir
+        self._batch_size = batch_size
+        self._save_predictions = save_predictions
+        self._early_stopping = early_stopping
+        self._subset_stream_provider = subset_stream_provider if subset_stream_provider is not None else stream_provider
         self._summary_writer = SummaryWriter(log_dir=f"{self._output_dir}/tensorboard")
+        self._model_summary_writers: Dict[str, SummaryWriter] = {}
 
-    def evaluate(self, predictor: Predictor, epoch: Optional[int] = None) -> None:
+        self._sampler = sampler if sampler is not None else EveryNthFrameSampler()
+        self._visualization_writer = VisualizationWriter(
+            class_names=self._classes,
+            n_workers=n_writers,
+            max_pending=max_pending_images
+        )
+        self._visualization_writer.run()
+
+    def evaluate(self, predictor: Predictor, epoch: Optional[int] = None, full: bool = True) -> None:
         """
         Computes evaluation metrics for the predictor.
 
         Args:
             predictor (Predictor): the predictor to evaluate
             epoch (Optional[int]): optional epoch number
+            full (bool): whether to evaluate on the whole stream, or to do a quick evaluation if an early stopping
+                rule is given, defaults to True
+        """
+        self._evaluate({"": predictor}, epoch, full)
+
+    def evaluate_many(self, predictors: Dict[str, Predictor], epoch: Optional[int] = None, full: bool = True) -> None:
         """
-        n_classes = len(self._classes)
-        conf_mat = np.zeros((n_classes + 1, n_classes + 1))
-        stream = self._stream_provider.get_stream()
+        Computes evaluation metrics for several predictors, reading each batch of the stream once and running the
+        predictors on it concurrently.
 
-        img_idx = 0
-        while instance := stream.read():
-            predictions = predictor.predict(instance.frame)
-            if self._nms:
-                predictions = self._apply_nms(predictions, iou_thresh=self._iou_thresh)
+        The outputs of each predictor are written under its name, with its own tensorboard run so the predictors can be
+        compared side by side. Predictors running in their own process, such as ProcessPredictor, do not compete for
+        the GIL.
 
+        Args:
+            predictors (Dict[str, Predictor]): the predictors to evaluate by name
+            epoch (Optional[int]): optional epoch number
+            full (bool): whether to evaluate on the whole stream, or to do a quick evaluation if an early stopping
+                rule is given, defaults to True
+        """
+        if not predictors:
+            raise ValueError("predictors must not be empty")
+
+        if "" in predictors:
+            raise ValueError("Predictor names must not be empty")
+
+        self._evaluate(predictors, epoch, full)
+
+    def _evaluate(self, predictors: Dict[str, Predictor], epoch: Optional[int], full: bool) -> None:
+        """Computes evaluation metrics for predictors by name, the empty name using the top-level output paths."""
+        quick = not full and self._early_stopping is not None
+        stream = (self._subset_stream_provider if quick else self._stream_provider).get_stream()
+
+        run_name = f"run_{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}"
+        folder_name = f"epoch_{epoch}" if epoch is not None else run_name
+        n_dropped = self._visualization_writer.get_n_dropped()
+
+        metrics = {name: EvaluationMetrics(classes=self._classes, iou_thresh=self._iou_thresh) for name in predictors}
+        samplers = {name: self._sampler if name == "" else copy.deepcopy(self._sampler) for name in predictors}
+        img_indices = {name: 0 for name in predictors}
+
+        estimators = {}
+        if quick:
+            estimators = {
+                name: BootstrapMetricsEstimator(
+                    num_classes=len(self._classes),
+                    iou_thresh=self._iou_thresh,
+                    n_resamples=self._early_stopping.n_resamples,
+                    confidence=self._early_stopping.confidence,
+                    seed=self._early_stopping.seed
+                )
+                for name in predictors
+            }
+
+        store_writers = {}
+        if self._save_predictions:
+            store_writers = {
+                name: PredictionStoreWriter(
+                    path=os.path.join(self._output_dir, "predictions", name, folder_name),
+                    classes=self._classes
+                )
+                for name in predictors
+            }
+
+        executor = ThreadPoolExecutor(max_workers=len(predictors)) if len(predictors) > 1 else None
+        n_batches = 0
+        estimates = {}
+        try:
+            while batch := stream.read_many(self._batch_size):
+                images = [instance.frame for instance in batch]
+                batch_gts_np = [self._get_gt_array(instance.annotations) for instance in batch]
+
+                if executor is None:
+                    all_predictions = {name: predictor.predict_batch(images) for name, predictor in predictors.items()}
+                else:
+                    futures = {name: executor.submit(predictor.predict_batch, images)
+                               for name, predictor in predictors.items()}
+                    all_predictions = {name: future.result() for name, future in futures.items()}
+
+                for name, raw_predictions in all_predictions.items():
+                    img_indices[name] = self._update(
+                        name=name,
+                        batch=batch,
+                        raw_predictions=raw_predictions,
+                        batch_gts_np=batch_gts_np,
+                        metrics=metrics[name],
+                        estimator=estimators.get(name),
+                        sampler=samplers[name],
+                        store_writer=store_writers.get(name),
+                        img_idx=img_indices[name],
+                        folder_name=folder_name
+                    )
+
+                n_batches += 1
+                if quick and n_batches % self._early_stopping.check_interval == 0:
+                    estimates = self._get_estimates(estimators)
+                    if estimates and all(self._is_narrow(estimate) for estimate in estimates.values()):
+                        console.log(f"[cyan]Confidence intervals narrow enough after {n_batches} batches, "
+                                    f"stopping evaluation[/cyan]")
+                        break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        n_dropped = self._visualization_writer.get_n_dropped() - n_dropped
+        if n_dropped > 0:
+            console.log(f"[yellow]Dropped {n_dropped} of {sum(img_indices.values())} visualizations, writers could "
+                        f"not keep up[/yellow]")
+
+        for name in predictors:
+            if name in store_writers:
+                store = store_writers[name].close()
+                console.log(f"Saved predictions for {len(store)} frames to [bold]"
+                            f"{os.path.join(self._output_dir, 'predictions', name, folder_name)}[/bold]")
+
+            if name:
+                console.rule(f"[bold]{name}[/bold]")
+            metrics[name].report(self._get_summary_writer(name), epoch)
+
+        if quick:
+            estimates = estimates or self._get_estimates(estimators, min_videos=1)
+            for name, estimate in estimates.items():
+                self._write_estimate(name, estimate, estimators[name].get_n_videos(), epoch)
+
+    def _update(self, name: str, batch: List[AnnotatedFrame], raw_predictions: List[List[Prediction]],
+                batch_gts_np: List[np.ndarray], metrics: EvaluationMetrics,
+                estimator: Optional[BootstrapMetricsEstimator], sampler: VisualizationSampler,
+                store_writer: Optional[PredictionStoreWriter], img_idx: int, folder_name: str) -> int:
+        """Updates the outputs of a predictor with its predictions for a batch, returning the next image index."""
+        raw_preds_np = [self._get_pred_array(predictions) for predictions in raw_predictions]
+
+        if store_writer is not None:
+            store_writer.append(
+                source_ids=[instance.source.source_id for instance in batch],
+                frame_indices=[instance.index for instance in batch],
+                preds=raw_preds_np,
+                gts=batch_gts_np
+            )
+
+        batch_predictions = []
+        batch_preds_np = []
+        for predictions, preds_np in zip(raw_predictions, raw_preds_np):
+            keep = self._filter.filter(preds_np)
+            batch_predictions.append([predictions[i] for i in keep])
+            batch_preds_np.append(preds_np[keep])
+
+        for predictions in batch_predictions:
             for pred in predictions:
                 console.log(
                     f"Got prediction: [cyan bold]{pred}[/cyan bold]"
                 )
 
-            # compute map
-            pred_np = np.array([[p.x1, p.y1, p.x2, p.y2, p.cls, p.conf] for p in predictions])
-            gts_np = np.array([
-                [g.bbox.x, g.bbox.y, g.bbox.x + g.bbox.width, g.bbox.y + g.bbox.height, g.cls.value]
-                for g in instance.annotations
-            ], dtype=np.float32)
-
-            self._map_calculator.update(pred_np, gts_np)
-
-            # compute confusion matrix
-            gts = instance.annotations
-            matches = self._get_gt_for_pred(predictions, gts)
-
-            matched_gts = {m for m in matches if m is not None}
-            unmatched_gts = [gt for gt in gts if gt not in matched_gts]
-
-            pred_cls = [pred.cls for pred in predictions]
-            gt_cls = [
-                match.cls.value if match is not None else self._background_cls_idx
-                for match in matches
-            ]
+        frame_errors = metrics.update(batch_preds_np, batch_gts_np)
+        if estimator is not None:
+            estimator.update([instance.source.source_id for instance in batch], batch_preds_np, batch_gts_np)
 
-            for gt in unmatched_gts:
-                pred_cls.append(self._background_cls_idx)
-                gt_cls.append(gt.cls.value)
-
-            conf_mat += ConfusionCalculator.calculate(pred_cls, gt_cls, n_classes + 1)
-
-            # save image
-            if predictions:
-                folder_name = f"epoch_{epoch}" if epoch is not None else f"run_{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}"
+        # save sampled images in the background
+        for instance, predictions, has_errors in zip(batch, batch_predictions, frame_errors):
+            if sampler.sample(predictions, instance.annotations, bool(has_errors)):
                 self._save_image(
                     image=instance.frame,
                     predictions=predictions,
-                    gts=gts,
+                    gts=instance.annotations,
                     image_idx=img_idx,
-                    folder_name=folder_name
+                    folder_name=os.path.join(name, folder_name)
                 )
 
                 img_idx += 1
 
-        self._write_confusion_matrix(conf_mat)
-        self._write_f1(conf_mat, epoch=epoch)
+        return img_idx
+
+    def _get_estimates(self, estimators: Dict[str, BootstrapMetricsEstimator],
+                       min_videos: Optional[int] = None) -> Dict[str, Dict[str, Tuple[float, float, float]]]:
+        """Returns the bootstrap estimates of all predictors, or none if any predictor has seen too few videos."""
+        min_videos = min_videos if min_videos is not None else self._early_stopping.min_videos
+        if any(estimator.get_n_videos() < min_videos for estimator in estimators.values()):
+            return {}
 
-        map_result = self._map_calculator.compute()
-        self._write_map(map_result["mAP"], map_result["per_class_ap"], epoch=epoch)
+        return {name: estimator.estimate() for name, estimator in estimators.items()}
 
-    def _apply_nms(self, predictions: List[Prediction], iou_thresh: float) -> List[Prediction]:
-        """Performs NMS on the predictions."""
-        result = []
+    def _is_narrow(self, estimate: Dict[str, Tuple[float, float, float]]) -> bool:
+        """Checks whether all confidence intervals of an estimate are within the max width."""
+        return all(high - low <= self._early_stopping.max_ci_width for _, low, high in estimate.values())
 
-        if predictions:
-            boxes = torch.tensor([[p.x1, p.y1, p.x2, p.y2] for p in predictions], dtype=torch.float32)
-            scores = torch.tensor([p.conf for p in predictions], dtype=torch.float32)
-            labels = torch.tensor([p.cls for p in predictions])
+    def _write_estimate(self, name: str, estimate: Dict[str, Tuple[float, float, float]], n_videos: int,
+                        epoch: Optional[int]) -> None:
+        """Prints the bootstrap confidence intervals of a predictor, and writes them to tensorboard."""
+        title = f"Quick Evaluation ({n_videos} videos, {self._early_stopping.confidence:.0%} CI)"
+        table = Table(title=f"{name}: {title}" if name else title)
+        table.add_column("Metric", justify="right", style="bold")
+        table.add_column("Estimate", justify="right")
+        table.add_column("CI", justify="right")
 
-            keep_indices = []
+        for metric, (point, low, high) in estimate.items():
+            table.add_row(metric, f"{point:.4f}", f"[{low:.4f}, {high:.4f}]")
+
+        console.print(table)
 
-            # applying nms per class
-            for cls in labels.unique():
-                cls_mask = labels == cls
-                cls_boxes = boxes[cls_mask]
-                cls_scores = scores[cls_mask]
-                cls_indices = torch.where(cls_mask)[0]
+        summary_writer = self._get_summary_writer(name)
+        epoch = epoch if epoch is not None else 0
+        for metric, (_, low, high) in estimate.items():
+            summary_writer.add_scalar(f"eval/{metric}_ci_low", low, epoch)
+            summary_writer.add_scalar(f"eval/{metric}_ci_high", high, epoch)
+        summary_writer.add_scalar("eval/n_videos", n_videos, epoch)
 
-                if cls_boxes.size(0) > 0:
-                    keep = torchvision.ops.nms(cls_boxes, cls_scores, iou_thresh)
-                    keep_indices.extend(cls_indices[keep].tolist())
+    def _get_summary_writer(self, name: str) -> SummaryWriter:
+        """Returns the tensorboard summary writer of a predictor, creating it the first time it is used."""
+        if not name:
+            return self._summary_writer
 
-            result = [predictions[i] for i in keep_indices]
+        if name not in self._model_summary_writers:
+            self._model_summary_writers[name] = SummaryWriter(log_dir=f"{self._output_dir}/tensorboard/{name}")
 
-        return result
+        return self._model_summary_writers[name]
+
+    def close(self) -> None:
+        """Writes the pending visualizations and stops the writer threads."""
+        self._visualization_writer.close()
 
     def _save_image(self, image: np.ndarray, predictions: List[Prediction], gts: List[AnnotatedBBox],
                      image_idx: int, folder_name: str) -> None:
-        """Saves visualizations of predictions and ground truths on the images."""
+        """Queues a visualization of predictions and ground truths on an image for the writer threads."""
         output_dir = os.path.join(self._output_dir, f"eval_images/{folder_name}")
 
-        os.makedirs(output_dir, exist_ok=True)
         save_path = os.path.join(output_dir, f"frame_{image_idx}.jpg")
         if len(gts) > 0:
             save_path = os.path.join(output_dir, f"frame_{image_idx}_gt.jpg")
 
-        EvaluatorVisualizer.save_image(
+        self._visualization_writer.submit(
             image=image,
             predictions=predictions,
             ground_truths=gts,
-            class_names=self._classes,
             save_path=save_path
         )
 
-    def _write_confusion_matrix(self, matrix: np.ndarray) -> None:
-        """Prints a confusion matrix to the console."""
-        names = self._classes + ["background"]
-
-        table = Table(title="Confusion Matrix")
-        table.add_column("GT \\ Pred", justify="right", style="bold")
-        for name in names:
-            table.add_column(name, justify="right")
-
-        for i, row in enumerate(matrix):
-            table.add_row(names[i], *[str(int(cell)) for cell in row])
-
-        console.print(table)
-
-    def _write_f1(self, matrix: np.ndarray, epoch: Optional[int] = None) -> None:
-        """Prints the F1 scores to the console."""
-        f1_scores = [F1Calculator.calculate(matrix, i) for i in range(len(self._classes))]
-
-        table = Table(title="F1 Scores")
-        table.add_column("Class", justify="right", style="bold")
-        table.add_column("F1 Score", justify="right", style="bold")
-
-        for cls_name, f1 in zip(self._classes, f1_scores):
-            table.add_row(cls_name, f"{f1:.4f}")
-
-        macro_f1 = sum(f1_scores) / len(f1_scores) if f1_scores else 0.0
-        table.add_row("[bold yellow]Macro Avg[/bold yellow]", f"[bold yellow]{macro_f1:.4f}[/bold yellow]")
-
-        console.print(table)
-
-        if self._summary_writer:
-            epoch = epoch if epoch is not None else 0
-            for label, score in zip(self._classes, f1_scores):
-                self._summary_writer.add_scalar(f"eval/f1_{label}", score, epoch)
-
-            self._summary_writer.add_scalar("eval/macro_f1", macro_f1, epoch)
-
-    def _write_map(self, map_score: float, per_class_ap: dict, epoch: Optional[int] = None) -> None:
-        """Prints mAP and per-class AP using rich table."""
-        table = Table(title="AP Scores")
-        table.add_column("Class", justify="right", style="bold")
-        table.add_column("AP", justify="right", style="bold")
-
-        for cls_id, ap in sorted(per_class_ap.items()):
-            class_name = self._classes[cls_id] if cls_id < len(self._classes) else f"Class {cls_id}"
-            table.add_row(class_name, f"{ap:.4f}")
-
-        table.add_row("[bold yellow]mAP[/bold yellow]", f"[bold yellow]{map_score:.4f}[/bold yellow]")
-        console.print(table)
-
-        if self._summary_writer:
-            epoch = epoch if epoch is not None else 0
-            for cls_id, ap in per_class_ap.items():
-                label = self._classes[cls_id] if cls_id < len(self._classes) else f"class_{cls_id}"
-                self._summary_writer.add_scalar(f"eval/ap_{label}", ap, epoch)
-            self._summary_writer.add_scalar("eval/mAP", map_score, epoch)
-
-    def _get_gt_for_pred(self, predictions: List[Prediction], gts: List[AnnotatedBBox]) -> List[
-        Optional[AnnotatedBBox]]:
-        """Returns the ground truth that has the largest IoU with the given prediction."""
-        pred_boxes = [
-            [pred.x1, pred.y1, pred.x2, pred.y2] for pred in predictions
-        ]
-        gt_boxes = [
-            [gt.bbox.x, gt.bbox.y, gt.bbox.x + gt.bbox.width, gt.bbox.y + gt.bbox.height] for gt in gts
-        ]
-
-        gt_matches = [None] * len(predictions)
-        if len(pred_boxes) > 0 and len(gt_boxes) > 0:
-            iou_matrix = IoUCalculator.calculate(pred_boxes=np.array(pred_boxes), gt_boxes=np.array(gt_boxes))
-            cost_matrix = 1.0 - iou_matrix
-
-            pred_indices, gt_indices = linear_sum_assignment(cost_matrix)
-
-            for pi, gi in zip(pred_indices, gt_indices):
-                if iou_matrix[pi, gi] >= self._iou_thresh:
-                    gt_matches[pi] = gts[gi]
-
-        return gt_matches
\ No newline at end of file
+    @staticmethod
+    def _get_pred_array(predictions: List[Prediction]) -> np.ndarray:
+        """Returns predictions as an array of [x1, y1, x2, y2, cls, conf] rows."""
+        return np.array(
+            [[p.x1, p.y1, p.x2, p.y2, p.cls, p.conf] for p in predictions], dtype=np.float64
+        ).reshape(-1, 6)
+
+    @staticmethod
+    def _get_gt_array(gts: List[AnnotatedBBox]) -> np.ndarray:
+        """Returns ground truths as an array of [x1, y1, x2, y2, cls] rows."""
+        return np.array(
+            [[g.bbox.x, g.bbox.y, g.bbox.x + g.bbox.width, g.bbox.y + g.bbox.height, g.cls.value] for g in gts],
+            dtype=np.float64
+        ).reshape(-1, 5)
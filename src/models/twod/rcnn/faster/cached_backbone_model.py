@@ -0,0 +1,107 @@
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import torch
+from torchvision.models.detection import FasterRCNN
+from torchvision.models.detection.image_list import ImageList
+from torchvision.models.detection.transform import resize_boxes
+
+from src.models.feature_cache import FeatureCache
+from src.models.twod.rcnn.faster.streaming_dataset import FRAME_KEY
+
+
+class CachedBackboneModel:
+    """
+    Computes the training losses of a Faster R-CNN model with a frozen backbone, running the backbone and FPN only for
+    frames whose features are not in the feature cache yet.
+
+    The features only stay valid while the backbone is frozen and the frames are preprocessed deterministically, as
+    the cache is keyed by frame.
+    """
+
+    def __init__(self, model: FasterRCNN, cache: FeatureCache):
+        """
+        Initializes a CachedBackboneModel instance.
+
+        Args:
+            model (FasterRCNN): the model, with a frozen backbone
+            cache (FeatureCache): the cache of the backbone features of the frames
+        """
+        self._model = model
+        self._cache = cache
+
+    def compute_losses(self, images: List[torch.Tensor], targets: List[Dict[str, torch.Tensor]]) \
+            -> Dict[str, torch.Tensor]:
+        """
+        Computes the losses of the heads of the model for a batch.
+
+        Args:
+            images (List[torch.Tensor]): the (C, H, W) images of the batch
+            targets (List[Dict[str, torch.Tensor]]): the targets of the batch, each holding the key of its frame
+
+        Returns:
+            Dict[str, torch.Tensor]: the losses of the region proposal network and the detection head
+        """
+        device = images[0].device
+        keys = [target[FRAME_KEY] for target in targets]
+
+        missing = [i for i, key in enumerate(keys) if key not in self._cache]
+        computed = self._compute_features([images[i] for i in missing], [keys[i] for i in missing])
+
+        frames = [computed[key] if key in computed else self._load_features(key, device) for key in keys]
+
+        padded_sizes = {padded_size for _, _, padded_size in frames}
+        if len(padded_sizes) > 1:
+            raise ValueError(f"All frames in a batch must have the same padded size, got {padded_sizes}")
+
+        features = OrderedDict(
+            (name, torch.stack([frame_features[name] for frame_features, _, _ in frames]))
+            for name in frames[0][0]
+        )
+        image_sizes = [image_size for _, image_size, _ in frames]
+        image_list = ImageList(torch.empty((len(frames), 0, *padded_sizes.pop()), device=device), image_sizes)
+
+        resized_targets = [
+            {
+                "boxes": resize_boxes(target["boxes"], tuple(image.shape[-2:]), image_size),
+                "labels": target["labels"]
+            }
+            for image, target, image_size in zip(images, targets, image_sizes)
+        ]
+
+        proposals, proposal_losses = self._model.rpn(image_list, features, resized_targets)
+        _, detector_losses = self._model.roi_heads(features, proposals, image_list.image_sizes, resized_targets)
+
+        losses = {}
+        losses.update(detector_losses)
+        losses.update(proposal_losses)
+        return losses
+
+    def _compute_features(self, images: List[torch.Tensor], keys: List[str]) \
+            -> Dict[str, Tuple[Dict[str, torch.Tensor], Tuple[int, int], Tuple[int, int]]]:
+        """Runs the backbone for frames missing from the cache, caching their features."""
+        if not images:
+            return {}
+
+        with torch.no_grad():
+            image_list, _ = self._model.transform(images)
+            features = self._model.backbone(image_list.tensors)
+
+        padded_size = tuple(image_list.tensors.shape[-2:])
+        computed = {}
+        for i, key in enumerate(keys):
+            frame_features = OrderedDict((name, level[i]) for name, level in features.items())
+            image_size = tuple(image_list.image_sizes[i])
+            self._cache.put(key, frame_features, image_size, padded_size)
+            computed[key] = (frame_features, image_size, padded_size)
+
+        return computed
+
+    def _load_features(self, key: str, device: torch.device) \
+            -> Tuple[Dict[str, torch.Tensor], Tuple[int, int], Tuple[int, int]]:
+        """Loads the cached features of a frame onto the device."""
+        cached = self._cache.get(key)
+        features = OrderedDict(
+            (name, torch.tensor(level, dtype=torch.float32, device=device)) for name, level in cached.features.items()
+        )
+        return features, cached.image_size, cached.padded_size
@@ -1,45 +1,77 @@
-from typing import List
+from typing import List, Dict, Optional
 
 import numpy as np
 import torch
 from torch.nn import Module
 
+from src.models.cpu_model_optimizer import CPUModelOptimizer
+from src.models.cpu_optimization_config import CPUOptimizationConfig
 from src.models.prediction import Prediction
 from src.models.predictor import Predictor
-from torchvision.transforms.functional import normalize
+
+# channel means used for normalizing images
+NORMALIZE_MEAN = [0.485, 0.456, 0.406]
+
+# channel standard deviations used for normalizing images
+NORMALIZE_STD = [0.229, 0.224, 0.225]
 
 
 class FasterRCNNPredictor(Predictor):
     """Predictor wrapper for faster-RCNN model."""
 
-    def __init__(self, model: Module, device: torch.device, conf_thresh: float = 0.5, class_shift: int = 0):
+    def __init__(self, model: Module, device: torch.device, conf_thresh: float = 0.5, class_shift: int = 0,
+                 optimization: Optional[CPUOptimizationConfig] = None):
         """
         Initializes a FasterRCNNPredictor instance.
 
         Args:
             model (Module): the model to use for prediction
             device (torch.device): the device to use for prediction
+            conf_thresh (float): the minimum confidence score for predictions to keep
             class_shift (int): shift amount for class indices
+            optimization (Optional[CPUOptimizationConfig]): optional optimizations for inference on CPU, applied to
+                a copy of the model with the backbone traced, defaults to None for eager inference
         """
+        if optimization is not None:
+            if device.type != "cpu":
+                raise ValueError(f"CPU optimizations require a CPU device, got {device}")
+
+            model = CPUModelOptimizer.optimize(model, optimization, submodule="backbone")
+
         self._model = model
+        self._optimized = optimization is not None
         self._device = device
         self._conf_thresh = conf_thresh
         self._class_shift = class_shift
 
+        self._mean = torch.tensor(NORMALIZE_MEAN, device=device).view(1, 3, 1, 1)
+        self._std = torch.tensor(NORMALIZE_STD, device=device).view(1, 3, 1, 1)
+
     def predict(self, image: np.ndarray) -> List[Prediction]:
-        with torch.no_grad():
-            img_tensor = torch.from_numpy(image).permute(2, 0, 1).float() / 255.0
-            img_tensor = normalize(
-                img_tensor,
-                mean=[0.485, 0.456, 0.406],
-                std=[0.229, 0.224, 0.225]
-            ).to(self._device)
-            outputs = self._model([img_tensor])[0]
-
-            return [
-                Prediction(
-                    x1=float(b[0]), y1=float(b[1]), x2=float(b[2]), y2=float(b[3]), cls=int(c) + self._class_shift, conf=float(s)
-                )
-                for b, c, s in zip(outputs["boxes"], outputs["labels"], outputs["scores"])
-                if float(s) >= self._conf_thresh
-            ]
\ No newline at end of file
+        return self.predict_batch([image])[0]
+
+    def predict_batch(self, images: List[np.ndarray]) -> List[List[Prediction]]:
+        if not images:
+            return []
+
+        with torch.inference_mode() if self._optimized else torch.no_grad():
+            batch = torch.from_numpy(np.stack(images)).to(self._device)
+            batch = batch.permute(0, 3, 1, 2).float().div_(255.0)
+            batch = batch.sub_(self._mean).div_(self._std)
+
+            outputs = self._model(list(batch))
+
+        return [self._to_predictions(output) for output in outputs]
+
+    def _to_predictions(self, output: Dict[str, torch.Tensor]) -> List[Prediction]:
+        """Converts the model output for a single image to predictions above the confidence threshold."""
+        keep = output["scores"] >= self._conf_thresh
+
+        boxes = output["boxes"][keep].cpu().tolist()
+        scores = output["scores"][keep].cpu().tolist()
+        labels = (output["labels"][keep] + self._class_shift).cpu().tolist()
+
+        return [
+            Prediction(x1=b[0], y1=b[1], x2=b[2], y2=b[3], conf=s, cls=c)
+            for b, s, c in zip(boxes, scores, labels)
+        ]
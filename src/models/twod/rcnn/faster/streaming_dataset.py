@@ -5,10 +5,14 @@ from torch.utils.data import IterableDataset
 from torchvision.transforms.functional import normalize
 
 from src.data.dataset.streams.providers.stream_provider import StreamProvider
+from src.models.worker_sharding import WorkerSharding
 
 # data type for the data
 T = TypeVar("T")
 
+# target key of the unique key of the frame of a sample
+FRAME_KEY = "frame_key"
+
 
 class StreamingDataset(IterableDataset):
     """An IterableDataset wrapper for streaming datasets."""
@@ -29,14 +33,16 @@ class StreamingDataset(IterableDataset):
         self.class_names = ["tail_biting", "ear_biting", "belly_nosing", "tail_down"]
 
     def __iter__(self):
+        WorkerSharding.configure(self._stream_provider)
         stream = self._stream_provider.get_stream()
+        n_batches = WorkerSharding.get_n_batches(len(self))
 
         i = 0
-        instance = stream.read()
-        while i < len(self) and instance is not None:
+        instance = stream.read() if n_batches > 0 else None
+        while i < n_batches and instance is not None:
             image = instance.frame
-            image_tensor = torch.from_numpy(image).permute(2, 0, 1).float() / 255.0
-            image_tensor = normalize(image_tensor, mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
+            image_tensor = torch.from_numpy(image).permute(2, 0, 1).float().div_(255.0)
+            image_tensor = normalize(image_tensor, mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225], inplace=True)
 
             boxes = []
             labels = []
@@ -50,7 +56,8 @@ class StreamingDataset(IterableDataset):
 
             target = {
                 "boxes": torch.tensor(boxes, dtype=torch.float32),
-                "labels": torch.tensor(labels, dtype=torch.int64)
+                "labels": torch.tensor(labels, dtype=torch.int64),
+                FRAME_KEY: f"{instance.source.source_id}/{instance.index}"
             }
 
             yield image_tensor, target
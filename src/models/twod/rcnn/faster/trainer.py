@@ -10,7 +10,11 @@ from torch.utils.tensorboard import SummaryWriter
 from torchvision.models.detection import fasterrcnn_resnet50_fpn
 from torchvision.models.detection.faster_rcnn import FastRCNNPredictor
 
+from src.models.checkpoint_writer import CheckpointWriter
+from src.models.device_prefetcher import DevicePrefetcher
+from src.models.feature_cache import FeatureCache
 from src.models.streaming_evaluator import StreamingEvaluator
+from src.models.twod.rcnn.faster.cached_backbone_model import CachedBackboneModel
 from src.models.twod.rcnn.faster.faster_rcnn_predictor import FasterRCNNPredictor
 from src.utils.logging import console
 
@@ -25,7 +29,8 @@ class Trainer:
     def __init__(self, dataloader: DataLoader, n_classes: int, evaluator: Optional[StreamingEvaluator] = None,
                  lr: float = 0.005, momentum: float = 0.9, weight_decay: float = 5e-4,
                  output_dir: str = "faster_rcnn_outputs", log_interval: int = 10, eval_interval: int = 2,
-                 class_shift: int = 0, freeze_backbone: bool = False):
+                 class_shift: int = 0, freeze_backbone: bool = False, keep_last_ckpts: Optional[int] = None,
+                 feature_cache_dir: Optional[str] = None, feature_cache_max_bytes: Optional[int] = None):
         """
         Initializes a Trainer instance.
 
@@ -41,7 +46,15 @@ class Trainer:
             eval_interval (int): the interval for evaluating the model
             class_shift (int): the shift for the class ids, defaults to 0 (no shift)
             freeze_backbone (bool): whether to freeze backbone, defaults to False
+            keep_last_ckpts (Optional[int]): the number of epoch checkpoints to keep, None to keep all
+            feature_cache_dir (Optional[str]): directory for caching the backbone and FPN features of each frame,
+                freezing the FPN along with the backbone and training the heads from cached features, which requires
+                freeze_backbone and deterministic preprocessing, None to run the backbone on every sample
+            feature_cache_max_bytes (Optional[int]): the max size of the feature cache in bytes, None for no limit
         """
+        if feature_cache_dir is not None and not freeze_backbone:
+            raise ValueError("feature_cache_dir requires freeze_backbone")
+
         self._dataloader = dataloader
         self._n_classes = n_classes
         self._evaluator = evaluator
@@ -53,9 +66,16 @@ class Trainer:
         self._eval_interval = eval_interval
         self._class_shift = class_shift
         self._freeze_backbone = freeze_backbone
+        self._ckpt_writer = CheckpointWriter(output_dir=self._output_dir, keep_last=keep_last_ckpts)
 
         self._model = self._create_model()
 
+        self._feature_cache: Optional[FeatureCache] = None
+        self._cached_model: Optional[CachedBackboneModel] = None
+        if feature_cache_dir is not None:
+            self._feature_cache = FeatureCache(feature_cache_dir, max_bytes=feature_cache_max_bytes)
+            self._cached_model = CachedBackboneModel(self._model, self._feature_cache)
+
         self._writer = SummaryWriter(log_dir=f"{self._output_dir}/tensorboard")
 
         self._total_epoch_steps = len(dataloader)
@@ -108,6 +128,11 @@ class Trainer:
             for param in self._model.backbone.body.parameters():
                     param.requires_grad = False
 
+        if self._feature_cache is not None:
+            console.log(f"[bold cyan]Caching backbone features — {len(self._feature_cache)} frames cached[/bold cyan]")
+            for param in self._model.backbone.parameters():
+                param.requires_grad = False
+
         start_epoch = 0
         global_step = 0
         if ckpt_path is not None:
@@ -115,41 +140,51 @@ class Trainer:
 
         console.log("[bold]Starting training...[/bold]")
 
-        for epoch in range(start_epoch, n_epochs):
-            self._model.train()
-
-            for images, targets in self._dataloader:
-                images = [img.to(device) for img in images]
-                targets = [{k: v.to(device) for k, v in t.items()} for t in targets]
-
-                for target in targets:
-                    target["labels"] += self._class_shift
-
-                loss_dict = self._model(images, targets)
-                loss = sum(loss for loss in loss_dict.values())
-
-                optimizer.zero_grad()
-                loss.backward()
-                torch.nn.utils.clip_grad_norm_(self._model.parameters(), max_norm=1.0)
-                optimizer.step()
-                scheduler.step()
-
-                cls_loss, box_loss, obj_loss, rpn_loss = self._get_losses(loss_dict)
-
-                global_step += 1
-                if global_step % self._log_interval == 0:
-                    self._log_losses(loss.item(), cls_loss, box_loss, obj_loss, rpn_loss, epoch + 1, n_epochs,
-                                     global_step)
-                    lr = optimizer.param_groups[0]['lr']
-                    self._log_lr(lr, step=global_step)
-
-            self._save_ckpt(epoch, self._model, optimizer, global_step, scheduler)
-
-            if (epoch + 1) % self._eval_interval == 0:
-                self._evaluate(device, epoch)
+        self._ckpt_writer.run()
+        try:
+            for epoch in range(start_epoch, n_epochs):
+                self._model.train()
 
-    def _evaluate(self, device: torch.device, epoch: int) -> None:
-        """Evaluates the model if an evaluator is given."""
+                for images, targets in DevicePrefetcher(self._dataloader, device):
+                    for target in targets:
+                        target["labels"] += self._class_shift
+
+                    if self._cached_model is not None:
+                        loss_dict = self._cached_model.compute_losses(images, targets)
+                    else:
+                        loss_dict = self._model(images, targets)
+                    loss = sum(loss for loss in loss_dict.values())
+
+                    optimizer.zero_grad()
+                    loss.backward()
+                    torch.nn.utils.clip_grad_norm_(self._model.parameters(), max_norm=1.0)
+                    optimizer.step()
+                    scheduler.step()
+
+                    cls_loss, box_loss, obj_loss, rpn_loss = self._get_losses(loss_dict)
+
+                    global_step += 1
+                    if global_step % self._log_interval == 0:
+                        self._log_losses(loss.item(), cls_loss, box_loss, obj_loss, rpn_loss, epoch + 1, n_epochs,
+                                         global_step)
+                        lr = optimizer.param_groups[0]['lr']
+                        self._log_lr(lr, step=global_step)
+
+                self._save_ckpt(epoch, self._model, optimizer, global_step, scheduler)
+                if self._feature_cache is not None:
+                    self._feature_cache.flush()
+
+                final = epoch + 1 == n_epochs
+                if (epoch + 1) % self._eval_interval == 0 or final:
+                    self._evaluate(device, epoch, full=final)
+
+        finally:
+            self._ckpt_writer.close()
+            if self._feature_cache is not None:
+                self._feature_cache.close()
+
+    def _evaluate(self, device: torch.device, epoch: int, full: bool) -> None:
+        """Evaluates the model if an evaluator is given, quickly unless it is a full evaluation."""
         if self._evaluator:
             console.log("[bold]Evaluating...[/bold]")
             was_training = self._model.training
@@ -157,7 +192,7 @@ class Trainer:
 
             predictor = FasterRCNNPredictor(self._model, device=device, conf_thresh=CONF_THRESH,
                                             class_shift=-self._class_shift)
-            self._evaluator.evaluate(predictor, epoch=epoch)
+            self._evaluator.evaluate(predictor, epoch=epoch, full=full)
 
             if was_training:
                 self._model.train()
@@ -190,25 +225,14 @@ class Trainer:
 
     def _save_ckpt(self, epoch: int, model: Module, optimizer: Optimizer, global_step: int,
                    scheduler: torch.optim.lr_scheduler) -> None:
-        """Saves a checkpoint for the current state of the model."""
-        epoch_ckpt_path = os.path.join(self._output_dir, f"epoch{epoch + 1}.pth")
-        last_ckpt_path = os.path.join(self._output_dir, f"last_ckpt.pth")
-
-        torch.save({
-            "epoch": epoch + 1,
-            "global_step": global_step,
-            "model_state_dict": model.state_dict(),
-            "optimizer_state_dict": optimizer.state_dict(),
-            "lr_scheduler_state_dict": scheduler.state_dict()
-        }, epoch_ckpt_path)
-
-        torch.save({
+        """Snapshots the current state of the model and queues it to be written as a checkpoint."""
+        self._ckpt_writer.submit({
             "epoch": epoch + 1,
             "global_step": global_step,
             "model_state_dict": model.state_dict(),
             "optimizer_state_dict": optimizer.state_dict(),
             "lr_scheduler_state_dict": scheduler.state_dict()
-        }, last_ckpt_path)
+        }, f"epoch{epoch + 1}.pth")
 
     @staticmethod
     def _get_device() -> torch.device:
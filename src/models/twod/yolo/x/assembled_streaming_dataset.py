@@ -0,0 +1,42 @@
+from torch.utils.data import IterableDataset
+
+from src.data.dataclasses.assembled_batch import AssembledBatch
+from src.data.dataset.streams.providers.stream_provider import StreamProvider
+from src.models.converters.yolox_batch_converter import YOLOXBatchConverter
+from src.models.worker_sharding import WorkerSharding
+
+
+class AssembledStreamingDataset(IterableDataset):
+    """An IterableDataset wrapper for streams of server-assembled batches."""
+
+    def __init__(self, stream_provider: StreamProvider[AssembledBatch], n_batches: int):
+        """
+        Initializes an AssembledStreamingDataset instance.
+
+        Args:
+            stream_provider (StreamProvider[AssembledBatch]): provider of streams of assembled batches
+            n_batches (int): the number of total batches
+        """
+        super().__init__()
+        self._stream_provider = stream_provider
+        self._n_batches = n_batches
+
+        self.class_ids = [0, 1, 2, 3]
+        self.class_names = ["tail_biting", "ear_biting", "belly_nosing", "tail_down"]
+
+    def __iter__(self):
+        WorkerSharding.configure(self._stream_provider)
+        stream = self._stream_provider.get_stream()
+        n_batches = WorkerSharding.get_n_batches(len(self))
+
+        i = 0
+        batch = stream.read() if n_batches > 0 else None
+        while i < n_batches and batch is not None:
+            yield YOLOXBatchConverter.convert_assembled(batch)
+            i += 1
+
+            if i < n_batches:
+                batch = stream.read()
+
+    def __len__(self):
+        return self._n_batches
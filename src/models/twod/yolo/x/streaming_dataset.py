@@ -6,6 +6,7 @@ from src.data.dataset.streams.closable_stream import ClosableStream
 from src.data.dataset.streams.factories.stream_factory import ClosableStreamFactory
 from src.data.dataset.streams.providers.stream_provider import StreamProvider
 from src.models.converters.yolox_batch_converter import YOLOXBatchConverter
+from src.models.worker_sharding import WorkerSharding
 
 # data type for the data
 T = TypeVar("T")
@@ -32,11 +33,13 @@ class StreamingDataset(IterableDataset):
         self.class_names = ["tail_biting", "ear_biting", "belly_nosing", "tail_down"]
 
     def __iter__(self):
+        WorkerSharding.configure(self._stream_provider)
         stream = self._stream_provider.get_stream()
+        n_batches = WorkerSharding.get_n_batches(len(self))
 
         i = 0
         eos = False
-        while i < len(self) and not eos:
+        while i < n_batches and not eos:
             batch = self._fetch_batch(stream)
             if len(batch) > 0:
                 yield YOLOXBatchConverter.convert(batch)
@@ -47,17 +50,7 @@ class StreamingDataset(IterableDataset):
 
     def _fetch_batch(self, stream: ClosableStream[T]) -> List[T]:
         """Fetches the next batch."""
-        batch = []
-
-        eos = False
-        while len(batch) < self._batch_size and not eos:
-            instance = stream.read()
-            if instance is not None:
-                batch.append(instance)
-            else:
-                eos = True
-
-        return batch
+        return stream.read_many(self._batch_size)
 
     def __len__(self):
         return self._n_batches
\ No newline at end of file
@@ -1,9 +1,11 @@
-from typing import TypeVar
+from typing import TypeVar, Optional
 
+from src.data.dataset.streams.providers.ranked_stream_provider import RankedStreamProvider
 from src.data.dataset.streams.providers.stream_provider import StreamProvider
 from src.models.streaming_evaluator import StreamingEvaluator
 from src.models.twod.yolo.x.streaming_dataset import StreamingDataset
 from yolox.exp import Exp as BaseExp
+from yolox.utils import get_rank, get_world_size
 from torch.utils.data import DataLoader
 
 # stream data type
@@ -14,16 +16,21 @@ class StreamingExp(BaseExp):
     """Experimental configurations for YOLOX."""
 
     def __init__(self, train_stream_provider: StreamProvider[T], val_stream_provider: StreamProvider[T],
-                 evaluator: StreamingEvaluator, freeze_backbone: bool = False, iou_thresh: float = 0.5):
+                 evaluator: StreamingEvaluator, freeze_backbone: bool = False, iou_thresh: float = 0.5,
+                 n_workers: int = 0):
         """
         Initializes an Exp instance.
 
         Args:
-            train_stream_provider (StreamProvider[T]): provider of training set streams
+            train_stream_provider (StreamProvider[T]): provider of training set streams, a RankedStreamProvider gives
+                each rank a disjoint shard of the training set in distributed training
             val_stream_provider (StreamProvider[T]): provider of validation set streams
             evaluator (StreamingEvaluator): evaluator for evaluating model
             freeze_backbone (bool): whether to freeze backbone while training
             iou_thresh (float): iou threshold for filtering predictions
+            n_workers (int): the number of data loader worker processes for training data, each streaming its own part
+                of the training set, which requires a RankedStreamProvider, defaults to 0 for loading in the main
+                process
         """
         super().__init__()
         self._train_stream_provider = train_stream_provider
@@ -36,7 +43,7 @@ class StreamingExp(BaseExp):
         self.test_size = (640, 640)
         self.max_epoch = 300
         self.eval_interval = 1
-        self.data_num_workers = 0
+        self.data_num_workers = n_workers
         self.tensorboard_writer = True
         self.save_history_ckpt = True
 
@@ -56,18 +63,31 @@ class StreamingExp(BaseExp):
         self.evaluator = evaluator
         self.iou_thresh = iou_thresh
 
+        self._train_loader: Optional[DataLoader] = None
+
     def get_data_loader(self, batch_size, is_distributed, no_aug=False, cache_img: str = None):
-        dataset = StreamingDataset(
-            stream_provider=self._train_stream_provider,
-            batch_size=28,
-            n_batches=267
-        )
-        return DataLoader(
-            dataset=dataset,
-            batch_size=None,
-            num_workers=0,
-            pin_memory=True,
-        )
+        if isinstance(self._train_stream_provider, RankedStreamProvider):
+            if is_distributed:
+                self._train_stream_provider.set_rank(get_rank(), get_world_size())
+            else:
+                self._train_stream_provider.set_rank(0, 1)
+
+        # the loader is reused across epochs, so persistent workers keep reading their streams where they left off
+        if self._train_loader is None:
+            dataset = StreamingDataset(
+                stream_provider=self._train_stream_provider,
+                batch_size=28,
+                n_batches=267
+            )
+            self._train_loader = DataLoader(
+                dataset=dataset,
+                batch_size=None,
+                num_workers=self.data_num_workers,
+                persistent_workers=self.data_num_workers > 0,
+                pin_memory=True,
+            )
+
+        return self._train_loader
 
     def get_eval_loader(self, batch_size, is_distributed, **kwargs):
         dataset = StreamingDataset(
@@ -82,5 +102,10 @@ class StreamingExp(BaseExp):
             pin_memory=True,
         )
 
+    def preprocess(self, inputs, targets, tsize):
+        # batches arrive as uint8 images cast to the training dtype, so they are scaled on the device
+        inputs = inputs.div_(255.0)
+        return super().preprocess(inputs, targets, tsize)
+
     def random_resize(self, data_loader, epoch, rank, is_distributed):
         return self.input_size
\ No newline at end of file
@@ -67,7 +67,7 @@ class StreamingTrainer(Trainer):
                 device=torch.device(self.device),
                 conf_thresh=self.exp.iou_thresh
             )
-            self.exp.evaluator.evaluate(predictor, epoch=self.epoch + 1)
+            self.exp.evaluator.evaluate(predictor, epoch=self.epoch + 1, full=self.epoch + 1 == self.max_epoch)
 
         if torch.distributed.is_initialized():
             synchronize()
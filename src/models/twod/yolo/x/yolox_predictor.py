@@ -1,9 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 import torch
 
 from ext.yolox.yolox.utils import postprocess
+from src.models.cpu_model_optimizer import CPUModelOptimizer
+from src.models.cpu_optimization_config import CPUOptimizationConfig
 from src.models.prediction import Prediction
 from src.models.predictor import Predictor
 
@@ -11,37 +13,62 @@ from src.models.predictor import Predictor
 class YOLOXPredictor(Predictor):
     """Predictor wrapper for YOLOX."""
 
-    def __init__(self, model: torch.nn.Module, device: torch.device, conf_thresh: float = 0.5):
+    def __init__(self, model: torch.nn.Module, device: torch.device, conf_thresh: float = 0.5,
+                 optimization: Optional[CPUOptimizationConfig] = None):
+        """
+        Initializes a YOLOXPredictor instance.
+
+        Args:
+            model (torch.nn.Module): the model to use for prediction
+            device (torch.device): the device to use for prediction
+            conf_thresh (float): the minimum confidence score for predictions to keep
+            optimization (Optional[CPUOptimizationConfig]): optional optimizations for inference on CPU, applied to
+                a copy of the model, defaults to None for eager inference
+        """
+        self._n_classes = len(model.head.cls_preds)
+
+        if optimization is not None:
+            if device.type != "cpu":
+                raise ValueError(f"CPU optimizations require a CPU device, got {device}")
+
+            model = CPUModelOptimizer.optimize(model, optimization)
+
         self._model = model
+        self._optimized = optimization is not None
         self._device = device
         self._conf_thresh = conf_thresh
 
-    @torch.no_grad()
     def predict(self, image: np.ndarray) -> List[Prediction]:
-        img_tensor = torch.from_numpy(image).float().permute(2, 0, 1).unsqueeze(0).to(self._device) / 255.0
-        outputs = self._model(img_tensor)
-
-        if isinstance(outputs, (list, tuple)):
-            outputs = outputs[0]
-
-        outputs = postprocess(outputs, num_classes=len(self._model.head.cls_preds), conf_thre=self._conf_thresh,
-                              nms_thre=0.5)
-
-        preds = []
-        if outputs[0] is not None:
-            for det in outputs[0].cpu().numpy():
-                print(f"det: {det}")
-                x1, y1, x2, y2, obj_conf, cls_conf, cls_id = det
-                score = obj_conf * cls_conf
-                preds.append(
-                    Prediction(
-                        x1=float(x1),
-                        y1=float(y1),
-                        x2=float(x2),
-                        y2=float(y2),
-                        conf=float(score),
-                        cls=int(cls_id)
-                    )
-                )
-
-        return preds
\ No newline at end of file
+        return self.predict_batch([image])[0]
+
+    def predict_batch(self, images: List[np.ndarray]) -> List[List[Prediction]]:
+        if not images:
+            return []
+
+        with torch.inference_mode() if self._optimized else torch.no_grad():
+            batch = torch.from_numpy(np.stack(images)).to(self._device)
+            batch = batch.permute(0, 3, 1, 2).float().div_(255.0)
+            outputs = self._model(batch)
+
+            if isinstance(outputs, (list, tuple)):
+                outputs = outputs[0]
+
+            outputs = postprocess(outputs, num_classes=self._n_classes, conf_thre=self._conf_thresh, nms_thre=0.5)
+
+        return [self._to_predictions(output) for output in outputs]
+
+    @staticmethod
+    def _to_predictions(output: Optional[torch.Tensor]) -> List[Prediction]:
+        """Converts the postprocessed detections for a single image to predictions."""
+        if output is None:
+            return []
+
+        dets = output.cpu()
+        boxes = dets[:, :4].tolist()
+        scores = (dets[:, 4] * dets[:, 5]).tolist()
+        labels = dets[:, 6].int().tolist()
+
+        return [
+            Prediction(x1=b[0], y1=b[1], x2=b[2], y2=b[3], conf=s, cls=c)
+            for b, s, c in zip(boxes, scores, labels)
+        ]
@@ -0,0 +1,51 @@
+from typing import TypeVar
+
+from torch.utils.data import get_worker_info
+
+from src.data.dataset.streams.providers.ranked_stream_provider import RankedStreamProvider
+from src.data.dataset.streams.providers.stream_provider import StreamProvider
+
+# stream data type
+T = TypeVar("T")
+
+
+class WorkerSharding:
+    """Splits the streams and batches of streaming datasets between the workers of a DataLoader."""
+
+    @staticmethod
+    def configure(stream_provider: StreamProvider[T]) -> None:
+        """
+        Makes the stream provider of a dataset provide a disjoint part of the stream to the current worker, if the
+        dataset is iterated in a DataLoader worker process.
+
+        Args:
+            stream_provider (StreamProvider[T]): the stream provider of the dataset
+        """
+        worker_info = get_worker_info()
+        if worker_info is None:
+            return
+
+        if not isinstance(stream_provider, RankedStreamProvider):
+            raise RuntimeError(
+                f"Streaming datasets need a RankedStreamProvider to be loaded by several workers, got "
+                f"{type(stream_provider).__name__}"
+            )
+
+        stream_provider.set_worker(worker_info.id, worker_info.num_workers)
+
+    @staticmethod
+    def get_n_batches(n_batches: int) -> int:
+        """
+        Returns the number of batches the current worker should yield, so all workers together yield n_batches.
+
+        Args:
+            n_batches (int): the total number of batches of the dataset
+
+        Returns:
+            int: the number of batches of the current worker, or all batches outside of worker processes
+        """
+        worker_info = get_worker_info()
+        if worker_info is None:
+            return n_batches
+
+        return n_batches // worker_info.num_workers + (1 if worker_info.id < n_batches % worker_info.num_workers else 0)
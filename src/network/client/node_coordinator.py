@@ -0,0 +1,97 @@
+import threading
+from collections import Counter
+from typing import List, Dict
+
+from src.data.dataclasses.catalog_shard import CatalogShard
+
+
+class NodeCoordinator:
+    """Coordinator partitioning the video catalog across data server nodes, reassigning shards of failed nodes."""
+
+    def __init__(self, addresses: List[str]):
+        """
+        Initializes a NodeCoordinator instance.
+
+        Args:
+            addresses (List[str]): the addresses of the data server nodes, each assigned one shard of the catalog
+        """
+        if not addresses:
+            raise ValueError("addresses cannot be empty")
+
+        self._addresses = list(addresses)
+        self._alive = list(addresses)
+        self._assignments: Dict[int, str] = dict(enumerate(addresses))
+        self._lock = threading.Lock()
+
+    def n_shards(self) -> int:
+        """
+        Returns the number of shards the catalog is partitioned into.
+
+        Returns:
+            int: the number of shards
+        """
+        return len(self._addresses)
+
+    def get_shard(self, index: int) -> CatalogShard:
+        """
+        Returns a shard of the catalog.
+
+        Args:
+            index (int): the index of the shard
+
+        Returns:
+            CatalogShard: the shard
+        """
+        return CatalogShard(index=index, count=self.n_shards())
+
+    def get_node(self, index: int) -> str:
+        """
+        Returns the address of the node currently assigned to a shard.
+
+        Args:
+            index (int): the index of the shard
+
+        Returns:
+            str: the address of the node
+        """
+        with self._lock:
+            if not self._alive:
+                raise ConnectionError("No data server nodes available")
+
+            return self._assignments[index]
+
+    def report_failure(self, address: str) -> None:
+        """
+        Reports a failed node, reassigning its shards to the least loaded nodes still alive.
+
+        Args:
+            address (str): the address of the failed node
+        """
+        with self._lock:
+            if address not in self._alive:
+                return
+
+            self._alive.remove(address)
+            if not self._alive:
+                return
+
+            load = Counter({node: 0 for node in self._alive})
+            load.update(node for node in self._assignments.values() if node in load)
+
+            for index, node in self._assignments.items():
+                if node == address:
+                    target = min(self._alive, key=lambda n: load[n])
+                    self._assignments[index] = target
+                    load[target] += 1
+
+            print(f"[NodeCoordinator] Node {address} failed, shards reassigned to {self._alive}")
+
+    def get_alive_nodes(self) -> List[str]:
+        """
+        Returns the addresses of the nodes that have not failed.
+
+        Returns:
+            List[str]: the addresses of the nodes
+        """
+        with self._lock:
+            return list(self._alive)
@@ -0,0 +1,92 @@
+import time
+from typing import Optional
+
+from src.network.client.network_client import NetworkClient
+from src.network.client.simple_network_client import SimpleNetworkClient
+from src.network.messages.requests.request import Request
+from src.network.messages.requests.resume_session_request import ResumeSessionRequest
+from src.network.messages.responses.response import Response
+from src.network.messages.responses.response_status import ResponseStatus
+from src.network.messages.responses.resume_session_response import ResumeSessionResponse
+
+
+class ResumableNetworkClient(NetworkClient):
+    """Network client that reconnects and resumes its server session when the connection is lost."""
+
+    def __init__(self, client: SimpleNetworkClient, max_retries: int = 5, retry_delay: float = 1.0):
+        """
+        Initializes a ResumableNetworkClient instance.
+
+        Args:
+            client (SimpleNetworkClient): the client used for the underlying connection
+            max_retries (int): the maximum number of reconnection attempts, defaults to 5
+            retry_delay (float): the number of seconds to wait before each reconnection attempt, defaults to 1
+        """
+        self._client = client
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+
+        self._server_ip: Optional[str] = None
+        self._token: Optional[str] = None
+
+    def connect(self, server_ip: str) -> None:
+        """
+        Connects to a server and starts a session.
+
+        Args:
+            server_ip (str): the ip address of the server
+        """
+        self._server_ip = server_ip
+        self._client.connect(server_ip)
+        self._resume()
+
+    def send_request(self, request: Request) -> Response:
+        try:
+            return self._client.send_request(request)
+        except ConnectionError as e:
+            print(f"[ResumableNetworkClient] Lost connection: {e}")
+            self._reconnect()
+
+        return self._client.send_request(request)
+
+    def disconnect(self) -> None:
+        """Disconnects from the server."""
+        self._client.disconnect()
+
+    def get_token(self) -> Optional[str]:
+        """
+        Returns the resumption token of the current session.
+
+        Returns:
+            Optional[str]: the resumption token, or None if not connected
+        """
+        return self._token
+
+    def _reconnect(self) -> None:
+        """Reconnects to the server and resumes the session."""
+        for attempt in range(1, self._max_retries + 1):
+            time.sleep(self._retry_delay)
+            try:
+                self._client.disconnect()
+                self._client.connect(self._server_ip)
+                self._resume()
+                return
+            except ConnectionError as e:
+                print(f"[ResumableNetworkClient] Reconnection attempt {attempt}/{self._max_retries} failed: {e}")
+
+        raise ConnectionError(f"Failed to reconnect to {self._server_ip} after {self._max_retries} attempts")
+
+    def _resume(self) -> None:
+        """Resumes the previous session if there is one, storing the token of the current session."""
+        response = self._client.send_request(ResumeSessionRequest(token=self._token))
+
+        if not isinstance(response, ResumeSessionResponse):
+            raise RuntimeError("Got unexpected response from server")
+
+        if response.status != ResponseStatus.SUCCESS:
+            raise RuntimeError("Could not resume session")
+
+        if self._token is not None and not response.resumed:
+            print("[ResumableNetworkClient] Previous session expired, streams will be restarted")
+
+        self._token = response.token
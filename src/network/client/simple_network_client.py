@@ -28,8 +28,9 @@ class SimpleNetworkClient(NetworkClient):
         self._writer = None
 
     def connect(self, server_ip: str) -> None:
+        host, _, port = server_ip.partition(":")
         try:
-            self._sock = socket.create_connection((server_ip, NETWORK_SERVER_PORT))
+            self._sock = socket.create_connection((host, int(port) if port else NETWORK_SERVER_PORT))
             self._reader = StreamMessageReader(self._sock.makefile("rb"), NETWORK_MSG_LEN_FORMAT)
             self._writer = StreamMessageWriter(self._sock.makefile("wb"), NETWORK_MSG_LEN_FORMAT)
             print(f"[SimpleNetworkClient] Connected to {server_ip}")
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from src.data.dataset.dataset_split import DatasetSplit
+from src.network.messages.requests.request import Request
+
+
+@dataclass(frozen=True)
+class GetAssembledBatchRequest(Request):
+    """
+    Request to get a batch of data assembled into model-ready arrays by the server.
+
+    Attributes:
+        split (DatasetSplit): the dataset split to get the data from
+        batch_size (int): the batch size
+    """
+    split: DatasetSplit
+    batch_size: int
+
+    def __repr__(self):
+        return f"GetAssembledBatchRequest(split={self.split}, batch_size={self.batch_size})"
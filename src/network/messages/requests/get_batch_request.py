@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from src.data.dataset.dataset_split import DatasetSplit
 from src.network.messages.requests.request import Request
@@ -12,9 +13,11 @@ class GetBatchRequest(Request):
     Attributes:
         split (DatasetSplit): the dataset split to get the data from
         batch_size (int): the batch size
+        timeout (Optional[float]): the max number of seconds to wait for the batch to fill, None for no timeout
     """
     split: DatasetSplit
     batch_size: int
+    timeout: Optional[float] = None
 
     def __repr__(self):
-        return f"GetBatchRequest(split={self.split}, batch_size={self.batch_size})"
\ No newline at end of file
+        return f"GetBatchRequest(split={self.split}, batch_size={self.batch_size}, timeout={self.timeout})"
\ No newline at end of file
@@ -0,0 +1,47 @@
+from typing import TypeVar, Generic
+
+from src.data.processing.batch_assembler import BatchAssembler
+from src.network.messages.requests.get_assembled_batch_request import GetAssembledBatchRequest
+from src.network.messages.requests.handlers.request_handler import RequestHandler
+from src.network.messages.responses.get_assembled_batch_response import GetAssembledBatchResponse
+from src.network.messages.responses.response import Response
+from src.network.messages.responses.response_status import ResponseStatus
+from src.network.server.session.session import Session
+
+T = TypeVar("T")
+
+
+class GetAssembledBatchHandler(Generic[T], RequestHandler[GetAssembledBatchRequest]):
+    """Handles GetAssembledBatchRequest instances."""
+
+    def __init__(self, session: Session[T], assembler: BatchAssembler):
+        """
+        Initializes a GetAssembledBatchHandler instance.
+
+        Args:
+            session (Session[T]): the session to get the stream from
+            assembler (BatchAssembler): assembler for packing instances into model-ready batches
+        """
+        self._session = session
+        self._assembler = assembler
+
+    def handle(self, request: GetAssembledBatchRequest) -> Response:
+        status = ResponseStatus.ERROR
+        batch = None
+
+        try:
+            stream = self._session.get_stream(request.split)
+            if stream is None:
+                raise RuntimeError(f"No stream available for split {request.split}")
+
+            instances = stream.read_many(request.batch_size)
+
+            if instances:
+                batch = self._assembler.process(instances)
+
+            status = ResponseStatus.SUCCESS
+
+        except (RuntimeError, ValueError) as e:
+            print(f"[GetAssembledBatchHandler] Failed to assemble batch: {e}")
+
+        return GetAssembledBatchResponse(status=status, batch=batch)
@@ -31,11 +31,7 @@ class GetBatchHandler(RequestHandler):
             if stream is None:
                 raise RuntimeError(f"No stream available for split {request.split}")
 
-            batch = []
-            instance = stream.read()
-            while instance is not None and len(batch) < request.batch_size:
-                batch.append(instance)
-                instance = stream.read()
+            batch = stream.read_many(request.batch_size, timeout=request.timeout)
 
             status = ResponseStatus.SUCCESS
 
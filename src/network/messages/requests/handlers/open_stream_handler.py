@@ -1,4 +1,6 @@
-from typing import TypeVar, Generic, Dict
+from typing import TypeVar, Generic, Dict, Optional
+
+from src.data.dataclasses.catalog_shard import CatalogShard
 
 from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
 from src.data.dataset.dataset_split import DatasetSplit
@@ -33,11 +35,22 @@ class OpenStreamHandler(Generic[T], RequestHandler[T]):
         response = OpenStreamResponse(ResponseStatus.ERROR)
 
         try:
-            stream = self._stream_factories.for_split(request.split).create_stream()
+            stream = self._stream_factories.for_split(request.split).create_stream(
+                encoding=request.encoding,
+                shard=self._resolve_shard(request)
+            )
             stream.run()
             self._session.set_stream(stream, request.split)
-            response = OpenStreamResponse(ResponseStatus.SUCCESS)
+            response = OpenStreamResponse(ResponseStatus.SUCCESS, encoding=request.encoding)
         except Exception as e:
             print(f"[OpenStreamHandler] Failed to create stream: {e}")
 
-        return response
\ No newline at end of file
+        return response
+
+    @staticmethod
+    def _resolve_shard(request: OpenStreamRequest) -> Optional[CatalogShard]:
+        """Returns the shard of the catalog to stream, splitting the requested shard disjointly between ranks."""
+        if request.world_size == 1:
+            return request.shard
+
+        return (request.shard or CatalogShard()).split(request.rank, request.world_size)
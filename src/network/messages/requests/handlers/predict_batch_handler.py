@@ -0,0 +1,35 @@
+from typing import Optional
+
+from src.models.serving.dynamic_batcher import DynamicBatcher
+from src.network.messages.requests.handlers.request_handler import RequestHandler
+from src.network.messages.requests.predict_batch_request import PredictBatchRequest
+from src.network.messages.responses.predict_batch_response import PredictBatchResponse
+from src.network.messages.responses.response import Response
+from src.network.messages.responses.response_status import ResponseStatus
+
+
+class PredictBatchHandler(RequestHandler[PredictBatchRequest]):
+    """Handles PredictBatchRequest instances."""
+
+    def __init__(self, batcher: DynamicBatcher, timeout: Optional[float] = None):
+        """
+        Initializes a PredictBatchHandler instance.
+
+        Args:
+            batcher (DynamicBatcher): the batcher shared by all sessions for running predictions
+            timeout (Optional[float]): the max number of seconds to wait for each image, None for no timeout
+        """
+        self._batcher = batcher
+        self._timeout = timeout
+
+    def handle(self, request: PredictBatchRequest) -> Response:
+        response = PredictBatchResponse(ResponseStatus.ERROR)
+
+        try:
+            futures = [self._batcher.submit(image) for image in request.images]
+            predictions = [future.result(timeout=self._timeout) for future in futures]
+            response = PredictBatchResponse(ResponseStatus.SUCCESS, predictions=predictions)
+        except Exception as e:
+            print(f"[PredictBatchHandler] Failed to make predictions: {e}")
+
+        return response
@@ -0,0 +1,34 @@
+from typing import Optional
+
+from src.models.serving.dynamic_batcher import DynamicBatcher
+from src.network.messages.requests.handlers.request_handler import RequestHandler
+from src.network.messages.requests.predict_request import PredictRequest
+from src.network.messages.responses.predict_response import PredictResponse
+from src.network.messages.responses.response import Response
+from src.network.messages.responses.response_status import ResponseStatus
+
+
+class PredictHandler(RequestHandler[PredictRequest]):
+    """Handles PredictRequest instances."""
+
+    def __init__(self, batcher: DynamicBatcher, timeout: Optional[float] = None):
+        """
+        Initializes a PredictHandler instance.
+
+        Args:
+            batcher (DynamicBatcher): the batcher shared by all sessions for running predictions
+            timeout (Optional[float]): the max number of seconds to wait for predictions, None for no timeout
+        """
+        self._batcher = batcher
+        self._timeout = timeout
+
+    def handle(self, request: PredictRequest) -> Response:
+        response = PredictResponse(ResponseStatus.ERROR)
+
+        try:
+            predictions = self._batcher.predict(request.image, timeout=self._timeout)
+            response = PredictResponse(ResponseStatus.SUCCESS, predictions=predictions)
+        except Exception as e:
+            print(f"[PredictHandler] Failed to make predictions: {e}")
+
+        return response
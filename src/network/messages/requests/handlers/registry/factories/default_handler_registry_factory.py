@@ -1,27 +1,39 @@
+from typing import Optional
+
+from src.data.processing.batch_assembler import BatchAssembler
 from src.network.messages.requests.close_stream_request import CloseStreamRequest
+from src.network.messages.requests.get_assembled_batch_request import GetAssembledBatchRequest
+from src.network.messages.requests.get_batch_request import GetBatchRequest
 from src.network.messages.requests.handlers.close_stream_handler import CloseStreamHandler
 from src.network.messages.requests.handlers.dataset_stream_factories import DatasetStreamFactories
+from src.network.messages.requests.handlers.get_assembled_batch_handler import GetAssembledBatchHandler
+from src.network.messages.requests.handlers.get_batch_handler import GetBatchHandler
 from src.network.messages.requests.handlers.open_stream_handler import OpenStreamHandler
 from src.network.messages.requests.handlers.read_stream_handler import ReadStreamHandler
+from src.network.messages.requests.handlers.resume_session_handler import ResumeSessionHandler
 from src.network.messages.requests.handlers.registry.factories.handler_registry_factory import HandlerRegistryFactory, T
 from src.network.messages.requests.handlers.registry.request_handler_registry import RequestHandlerRegistry
 from src.network.messages.requests.handlers.registry.simple_request_handler_registry import SimpleRequestHandlerRegistry
 from src.network.messages.requests.open_stream_request import OpenStreamRequest
 from src.network.messages.requests.read_stream_request import ReadStreamRequest
+from src.network.messages.requests.resume_session_request import ResumeSessionRequest
 from src.network.server.session.session import Session
+from src.network.server.session.session_registry import SessionRegistry
 
 
 class DefaultHandlerRegistryFactory(HandlerRegistryFactory):
     """Factory for creating request handler registries with all the default handlers."""
 
-    def __init__(self, stream_factories: DatasetStreamFactories):
+    def __init__(self, stream_factories: DatasetStreamFactories, session_registry: Optional[SessionRegistry] = None):
         """
         Initializes a DefaultHandlerRegistryFactory instance.
 
         Args:
             stream_factories (DatasetStreamFactories): factories for creating dataset streams
+            session_registry (Optional[SessionRegistry]): optional registry of detached sessions that can be resumed
         """
         self._stream_factories = stream_factories
+        self._session_registry = session_registry
 
     def create_registry(self, session: Session[T]) -> RequestHandlerRegistry:
         registry = SimpleRequestHandlerRegistry()
@@ -29,5 +41,10 @@ class DefaultHandlerRegistryFactory(HandlerRegistryFactory):
         registry.register(OpenStreamRequest, OpenStreamHandler(session=session, stream_factories=self._stream_factories))
         registry.register(ReadStreamRequest, ReadStreamHandler(session=session))
         registry.register(CloseStreamRequest, CloseStreamHandler(session=session))
+        registry.register(GetBatchRequest, GetBatchHandler(session=session))
+        registry.register(GetAssembledBatchRequest, GetAssembledBatchHandler(session=session, assembler=BatchAssembler()))
+        registry.register(
+            ResumeSessionRequest, ResumeSessionHandler(session=session, session_registry=self._session_registry)
+        )
 
         return registry
\ No newline at end of file
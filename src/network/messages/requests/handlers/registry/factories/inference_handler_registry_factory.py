@@ -0,0 +1,34 @@
+from typing import Optional
+
+from src.models.serving.dynamic_batcher import DynamicBatcher
+from src.network.messages.requests.handlers.predict_batch_handler import PredictBatchHandler
+from src.network.messages.requests.handlers.predict_handler import PredictHandler
+from src.network.messages.requests.handlers.registry.factories.handler_registry_factory import HandlerRegistryFactory, T
+from src.network.messages.requests.handlers.registry.request_handler_registry import RequestHandlerRegistry
+from src.network.messages.requests.handlers.registry.simple_request_handler_registry import SimpleRequestHandlerRegistry
+from src.network.messages.requests.predict_batch_request import PredictBatchRequest
+from src.network.messages.requests.predict_request import PredictRequest
+from src.network.server.session.session import Session
+
+
+class InferenceHandlerRegistryFactory(HandlerRegistryFactory):
+    """Factory for creating request handler registries for serving predictions."""
+
+    def __init__(self, batcher: DynamicBatcher, timeout: Optional[float] = None):
+        """
+        Initializes an InferenceHandlerRegistryFactory instance.
+
+        Args:
+            batcher (DynamicBatcher): the batcher shared by all sessions for running predictions
+            timeout (Optional[float]): the max number of seconds to wait for predictions, None for no timeout
+        """
+        self._batcher = batcher
+        self._timeout = timeout
+
+    def create_registry(self, session: Session[T]) -> RequestHandlerRegistry:
+        registry = SimpleRequestHandlerRegistry()
+
+        registry.register(PredictRequest, PredictHandler(batcher=self._batcher, timeout=self._timeout))
+        registry.register(PredictBatchRequest, PredictBatchHandler(batcher=self._batcher, timeout=self._timeout))
+
+        return registry
@@ -0,0 +1,49 @@
+from typing import TypeVar, Generic, Optional
+
+from src.network.messages.requests.handlers.request_handler import RequestHandler
+from src.network.messages.requests.resume_session_request import ResumeSessionRequest
+from src.network.messages.responses.response import Response
+from src.network.messages.responses.response_status import ResponseStatus
+from src.network.messages.responses.resume_session_response import ResumeSessionResponse
+from src.network.server.session.session import Session
+from src.network.server.session.session_registry import SessionRegistry
+
+T = TypeVar("T")
+
+
+class ResumeSessionHandler(Generic[T], RequestHandler[T]):
+    """Handles ResumeSessionRequest instances."""
+
+    def __init__(self, session: Session[T], session_registry: Optional[SessionRegistry[T]] = None):
+        """
+        Initializes a ResumeSessionHandler instance.
+
+        Args:
+            session (Session[T]): the session of the client
+            session_registry (Optional[SessionRegistry[T]]): optional registry of detached sessions,
+                sessions cannot be resumed if None
+        """
+        self._session = session
+        self._session_registry = session_registry
+
+    def handle(self, request: ResumeSessionRequest) -> Response:
+        response = ResumeSessionResponse(status=ResponseStatus.ERROR)
+
+        try:
+            resumed = False
+            if request.token is not None and self._session_registry is not None:
+                detached = self._session_registry.reattach(request.token)
+                if detached is not None:
+                    self._session.adopt(detached)
+                    resumed = True
+
+            response = ResumeSessionResponse(
+                status=ResponseStatus.SUCCESS,
+                token=self._session.get_token(),
+                resumed=resumed
+            )
+
+        except RuntimeError as e:
+            print(f"[ResumeSessionHandler] Failed to resume session: {e}")
+
+        return response
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
+from typing import Optional
 
+from src.data.dataclasses.catalog_shard import CatalogShard
+from src.data.dataclasses.frame_encoding import FrameEncoding
 from src.data.dataset.dataset_split import DatasetSplit
 from src.network.messages.requests.request import Request
 
@@ -11,8 +14,24 @@ class OpenStreamRequest(Request):
 
     Attributes:
         split (DatasetSplit): the dataset split to open stream for
+        encoding (Optional[FrameEncoding]): the requested frame encoding, None for the server default
+        shard (Optional[CatalogShard]): the shard of the catalog to stream, None for the whole catalog
+        rank (int): the rank of the requesting client in distributed training, defaults to 0
+        world_size (int): the total number of ranks in distributed training, defaults to 1
     """
     split: DatasetSplit
+    encoding: Optional[FrameEncoding] = None
+    shard: Optional[CatalogShard] = None
+    rank: int = 0
+    world_size: int = 1
+
+    def __post_init__(self):
+        if self.world_size < 1:
+            raise ValueError("world_size must be greater than 0")
+
+        if not 0 <= self.rank < self.world_size:
+            raise ValueError(f"rank must be in range [0, {self.world_size}), got {self.rank}")
 
     def __repr__(self):
-        return f"OpenStreamRequest(split={self.split})"
\ No newline at end of file
+        return (f"OpenStreamRequest(split={self.split}, encoding={self.encoding}, shard={self.shard}, "
+                f"rank={self.rank}, world_size={self.world_size})")
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from src.network.messages.requests.request import Request
+
+
+@dataclass(frozen=True)
+class PredictBatchRequest(Request):
+    """
+    Request to make object detection predictions for a batch of images.
+
+    Attributes:
+        images (List[np.ndarray]): the images to make predictions for, as (H, W, C) uint8 arrays
+    """
+    images: List[np.ndarray]
+
+    def __repr__(self):
+        return f"PredictBatchRequest(n_images={len(self.images)})"
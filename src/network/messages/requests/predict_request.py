@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.network.messages.requests.request import Request
+
+
+@dataclass(frozen=True)
+class PredictRequest(Request):
+    """
+    Request to make object detection predictions for an image.
+
+    Attributes:
+        image (np.ndarray): the image to make predictions for, as an (H, W, C) uint8 array
+    """
+    image: np.ndarray
+
+    def __repr__(self):
+        return f"PredictRequest(image={self.image.shape})"
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.network.messages.requests.request import Request
+
+
+@dataclass(frozen=True)
+class ResumeSessionRequest(Request):
+    """
+    Request to resume a previous session, or to get the resumption token of the current one.
+
+    Attributes:
+        token (Optional[str]): the resumption token of the session to resume, None to only get the current token
+    """
+    token: Optional[str] = None
+
+    def __repr__(self):
+        return f"ResumeSessionRequest(token={self.token})"
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.data.dataclasses.assembled_batch import AssembledBatch
+from src.network.messages.responses.response import Response
+from src.network.messages.responses.response_status import ResponseStatus
+
+
+@dataclass(frozen=True)
+class GetAssembledBatchResponse(Response):
+    """
+    A response to a request to get an assembled batch of data.
+
+    Attributes:
+        status (ResponseStatus): the status of the response
+        batch (Optional[AssembledBatch]): the assembled batch, or None if end of stream or error
+    """
+    status: ResponseStatus
+    batch: Optional[AssembledBatch]
+
+    def __repr__(self):
+        batch_size = len(self.batch) if self.batch is not None else 0
+        return f"GetAssembledBatchResponse(status={self.status}, batch_size={batch_size})"
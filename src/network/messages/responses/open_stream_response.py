@@ -1,5 +1,7 @@
 from dataclasses import dataclass
+from typing import Optional
 
+from src.data.dataclasses.frame_encoding import FrameEncoding
 from src.network.messages.responses.response import Response
 from src.network.messages.responses.response_status import ResponseStatus
 
@@ -11,8 +13,10 @@ class OpenStreamResponse(Response):
 
     Attributes:
         status (ResponseStatus): the status of the response
+        encoding (Optional[FrameEncoding]): the frame encoding used for the stream, None if the server default is used
     """
     status: ResponseStatus
+    encoding: Optional[FrameEncoding] = None
 
     def __repr__(self):
-        return f"OpenStreamResponse(status={self.status})"
\ No newline at end of file
+        return f"OpenStreamResponse(status={self.status}, encoding={self.encoding})"
\ No newline at end of file
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from src.models.prediction import Prediction
+from src.network.messages.responses.response import Response
+from src.network.messages.responses.response_status import ResponseStatus
+
+
+@dataclass(frozen=True)
+class PredictBatchResponse(Response):
+    """
+    Response to a PredictBatchRequest.
+
+    Attributes:
+        status (ResponseStatus): the status of the response
+        predictions (List[List[Prediction]]): the predictions for each image, in the order of the images, empty on
+            error
+    """
+    status: ResponseStatus
+    predictions: List[List[Prediction]] = field(default_factory=list)
+
+    def __repr__(self):
+        return f"PredictBatchResponse(status={self.status}, n_images={len(self.predictions)})"
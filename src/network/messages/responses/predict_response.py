@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from src.models.prediction import Prediction
+from src.network.messages.responses.response import Response
+from src.network.messages.responses.response_status import ResponseStatus
+
+
+@dataclass(frozen=True)
+class PredictResponse(Response):
+    """
+    Response to a PredictRequest.
+
+    Attributes:
+        status (ResponseStatus): the status of the response
+        predictions (List[Prediction]): the predictions for the image, empty on error
+    """
+    status: ResponseStatus
+    predictions: List[Prediction] = field(default_factory=list)
+
+    def __repr__(self):
+        return f"PredictResponse(status={self.status}, n_predictions={len(self.predictions)})"
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.network.messages.responses.response import Response
+from src.network.messages.responses.response_status import ResponseStatus
+
+
+@dataclass(frozen=True)
+class ResumeSessionResponse(Response):
+    """
+    Response to a request to resume a session.
+
+    Attributes:
+        status (ResponseStatus): the status of the response
+        token (Optional[str]): the resumption token of the session
+        resumed (bool): whether a previous session was resumed
+    """
+    status: ResponseStatus
+    token: Optional[str] = None
+    resumed: bool = False
+
+    def __repr__(self):
+        return f"ResumeSessionResponse(status={self.status}, resumed={self.resumed})"
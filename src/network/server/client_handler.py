@@ -1,6 +1,6 @@
 import struct
 from socket import socket
-from typing import TypeVar
+from typing import TypeVar, Optional
 
 from src.data.structures.atomic_bool import AtomicBool
 from src.network.messages.readers.stream_message_reader import StreamMessageReader
@@ -12,6 +12,7 @@ from src.network.messages.serialization.message_serializer import MessageSeriali
 from src.network.messages.writers.stream_message_writer import StreamMessageWriter
 from src.network.network_config import NETWORK_MSG_LEN_FORMAT
 from src.network.server.session.session import Session
+from src.network.server.session.session_registry import SessionRegistry
 from src.utils.logging import console
 
 T = TypeVar("T")
@@ -22,7 +23,7 @@ class ClientHandler:
 
     def __init__(self, client_socket: socket, serializer: MessageSerializer,
                  deserializer: MessageDeserializer[Request], handler_registry: RequestHandlerRegistry,
-                 session: Session[T]):
+                 session: Session[T], session_registry: Optional[SessionRegistry[T]] = None):
         """
         Initializes a ClientHandler instance.
 
@@ -32,6 +33,8 @@ class ClientHandler:
             deserializer (MessageDeserializer): the message deserializer
             handler_registry (RequestHandlerRegistry): the request handler registry
             session (Session[T]): the network session
+            session_registry (Optional[SessionRegistry[T]]): optional registry for keeping the session alive after
+                disconnection, the session is cleaned up immediately if None
         """
         self._socket = client_socket
         self._msg_reader = StreamMessageReader(self._socket.makefile('rb'), NETWORK_MSG_LEN_FORMAT)
@@ -41,6 +44,7 @@ class ClientHandler:
         self._deserializer = deserializer
         self._handler_registry = handler_registry
         self._session = session
+        self._session_registry = session_registry
 
         self._running = AtomicBool(False)
 
@@ -66,7 +70,10 @@ class ClientHandler:
             recv_raw_msg = self._read_next_msg()
 
         self._print(f"'{self._session.get_client_address()}' disconnected")
-        self._session.cleanup()
+        if self._session_registry is not None:
+            self._session_registry.detach(self._session)
+        else:
+            self._session.cleanup()
 
     def _read_next_msg(self) -> bytes:
         """Reads the next message in bytes."""
@@ -0,0 +1,104 @@
+import multiprocessing
+from multiprocessing.synchronize import Event
+from typing import Callable, List
+
+from src.network.messages.requests.handlers.dataset_stream_factories import DatasetStreamFactories
+from src.network.messages.requests.handlers.registry.factories.default_handler_registry_factory import \
+    DefaultHandlerRegistryFactory
+from src.network.messages.serialization.factories.pickle_deserializer_factory import PickleDeserializerFactory
+from src.network.messages.serialization.factories.pickle_serializer_factory import PickleSerializerFactory
+from src.network.network_config import NETWORK_SERVER_PORT
+from src.network.server.network_server import NetworkServer
+from src.network.server.session.factories.clean_session_factory import CleanSessionFactory
+from src.network.server.session.session_registry import SessionRegistry
+
+# seconds to wait for a node process to shut down before terminating it
+NODE_SHUTDOWN_TIMEOUT = 10.0
+
+
+def _run_node(stream_factories_provider: Callable[[], DatasetStreamFactories], port: int, stop_event: Event) -> None:
+    """Runs a single data server node until the stop event is set."""
+    session_registry = SessionRegistry()
+    server = NetworkServer(
+        serializer_factory=PickleSerializerFactory(),
+        deserializer_factory=PickleDeserializerFactory(),
+        session_factory=CleanSessionFactory(),
+        handler_factory=DefaultHandlerRegistryFactory(
+            stream_factories=stream_factories_provider(),
+            session_registry=session_registry
+        ),
+        session_registry=session_registry,
+        port=port
+    )
+
+    server.run()
+    stop_event.wait()
+    server.stop()
+
+
+class LocalCluster:
+    """Local stand-in for a cluster of data server nodes, running each node in its own process."""
+
+    def __init__(self, n_nodes: int, stream_factories_provider: Callable[[], DatasetStreamFactories],
+                 base_port: int = NETWORK_SERVER_PORT):
+        """
+        Initializes a LocalCluster instance.
+
+        Args:
+            n_nodes (int): the number of nodes to run
+            stream_factories_provider (Callable[[], DatasetStreamFactories]): picklable function creating the stream
+                factories of a node, called inside each node process
+            base_port (int): the port of the first node, the following nodes use the subsequent ports
+        """
+        if n_nodes < 1:
+            raise ValueError("n_nodes must be greater than 0")
+
+        self._n_nodes = n_nodes
+        self._provider = stream_factories_provider
+        self._base_port = base_port
+
+        self._stop_event = multiprocessing.Event()
+        self._processes: List[multiprocessing.Process] = []
+
+    def run(self) -> None:
+        """Starts all nodes."""
+        if self._processes:
+            raise RuntimeError("LocalCluster is already running")
+
+        self._stop_event.clear()
+        for index in range(self._n_nodes):
+            process = multiprocessing.Process(
+                target=_run_node,
+                args=(self._provider, self._base_port + index, self._stop_event),
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+
+    def get_addresses(self) -> List[str]:
+        """
+        Returns the addresses of the nodes.
+
+        Returns:
+            List[str]: the addresses of the nodes as 'ip:port'
+        """
+        return [f"127.0.0.1:{self._base_port + index}" for index in range(self._n_nodes)]
+
+    def kill(self, index: int) -> None:
+        """
+        Kills a node abruptly, simulating a node failure.
+
+        Args:
+            index (int): the index of the node to kill
+        """
+        self._processes[index].kill()
+
+    def stop(self) -> None:
+        """Stops all nodes."""
+        self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout=NODE_SHUTDOWN_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+
+        self._processes = []
@@ -1,5 +1,6 @@
 import threading
 import socket
+from typing import Optional
 
 from src.data.structures.atomic_bool import AtomicBool
 from src.network.messages.requests.handlers.registry.factories.handler_registry_factory import HandlerRegistryFactory
@@ -8,6 +9,7 @@ from src.network.messages.serialization.factories.serializer_factory import Seri
 from src.network.network_config import NETWORK_SERVER_PORT
 from src.network.server.client_handler import ClientHandler
 from src.network.server.session.factories.session_factory import SessionFactory
+from src.network.server.session.session_registry import SessionRegistry
 from src.utils.logging import console
 
 
@@ -15,7 +17,8 @@ class NetworkServer:
     """A network server listening for incoming requests."""
 
     def __init__(self, serializer_factory: SerializerFactory, deserializer_factory: DeserializerFactory,
-                 session_factory: SessionFactory, handler_factory: HandlerRegistryFactory):
+                 session_factory: SessionFactory, handler_factory: HandlerRegistryFactory,
+                 session_registry: Optional[SessionRegistry] = None, port: int = NETWORK_SERVER_PORT):
         """
         Initializes a NetworkServer instance.
 
@@ -24,11 +27,16 @@ class NetworkServer:
             deserializer_factory (DeserializerFactory): factory for message deserializers
             session_factory (SessionFactory): factory for network sessions
             handler_factory (HandlerRegistryFactory): factory for request handler registries
+            session_registry (Optional[SessionRegistry]): optional registry keeping sessions of disconnected clients
+                alive for resumption
+            port (int): the port to listen on
         """
         self._serializer_factory = serializer_factory
         self._deserializer_factory = deserializer_factory
         self._session_factory = session_factory
         self._handler_factory = handler_factory
+        self._session_registry = session_registry
+        self._port = port
 
         self._running = AtomicBool(False)
         self._listen_thread = None
@@ -49,12 +57,12 @@ class NetworkServer:
         """Listens to incoming requests."""
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            sock.bind(("0.0.0.0", NETWORK_SERVER_PORT))
+            sock.bind(("0.0.0.0", self._port))
             sock.listen()
             sock.settimeout(1.0)
             self._server_sock = sock
 
-            self._print(f"Listening on port [yellow]{NETWORK_SERVER_PORT}[/yellow]...")
+            self._print(f"Listening on port [yellow]{self._port}[/yellow]...")
             self._accept_clients()
 
     def _accept_clients(self) -> None:
@@ -84,7 +92,8 @@ class NetworkServer:
             serializer=self._serializer_factory.create_serializer(),
             deserializer=self._deserializer_factory.create_deserializer(),
             handler_registry=self._handler_factory.create_registry(session),
-            session=session
+            session=session,
+            session_registry=self._session_registry
         )
         threading.Thread(target=handler.handle, daemon=True).start()
 
@@ -101,6 +110,9 @@ class NetworkServer:
 
         if self._listen_thread:
             self._listen_thread.join()
+
+        if self._session_registry:
+            self._session_registry.stop()
         self._print("Server stopped.")
 
     def _print(self, message) -> None:
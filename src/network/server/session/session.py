@@ -1,3 +1,4 @@
+import uuid
 from typing import Dict, TypeVar, Generic, Optional
 
 from src.data.dataset.dataset_split import DatasetSplit
@@ -9,7 +10,8 @@ T = TypeVar("T")
 class Session(Generic[T]):
     """Interface for network sessions."""
 
-    def __init__(self, client_address: str, created_at: float, streams: Dict[DatasetSplit, Optional[ManagedStream[T]]]):
+    def __init__(self, client_address: str, created_at: float, streams: Dict[DatasetSplit, Optional[ManagedStream[T]]],
+                 token: Optional[str] = None):
         """
         Initializes a Session instance.
 
@@ -17,10 +19,12 @@ class Session(Generic[T]):
             client_address (str): the address of the client
             created_at (float): the time the session was created in UNIX format
             streams (Dict[DatasetSplit, ManagedStream[T]]): dictionary of dataset streams
+            token (Optional[str]): the resumption token of the session, generated if None
         """
         self._client_address = client_address
         self._created_at = created_at
         self._streams: Dict[DatasetSplit, Optional[ManagedStream[T]]] = streams
+        self._token = token if token is not None else uuid.uuid4().hex
 
     def get_client_address(self) -> str:
         """
@@ -40,6 +44,15 @@ class Session(Generic[T]):
         """
         return self._created_at
 
+    def get_token(self) -> str:
+        """
+        Returns the resumption token of the session.
+
+        Returns:
+            str: the resumption token
+        """
+        return self._token
+
     def get_stream(self, split: DatasetSplit) -> Optional[ManagedStream[T]]:
         """
         Returns the stream for the given split.
@@ -66,6 +79,20 @@ class Session(Generic[T]):
 
         self._streams[split] = stream
 
+    def adopt(self, other: "Session[T]") -> None:
+        """
+        Takes over the streams and resumption token of another session.
+
+        Args:
+            other (Session[T]): the session to take over
+        """
+        for split, stream in other._streams.items():
+            if stream is not None:
+                self.set_stream(stream, split)
+                other._streams[split] = None
+
+        self._token = other.get_token()
+
     def cleanup(self) -> None:
         """Cleans up resources."""
         for stream in self._streams.values():
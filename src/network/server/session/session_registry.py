@@ -0,0 +1,89 @@
+import threading
+from typing import TypeVar, Generic, Dict, Tuple, Optional
+
+from src.network.server.session.session import Session
+
+T = TypeVar("T")
+
+
+class SessionRegistry(Generic[T]):
+    """Registry keeping sessions of disconnected clients alive for a grace period, allowing them to be resumed."""
+
+    def __init__(self, grace_period: float = 300.0):
+        """
+        Initializes a SessionRegistry instance.
+
+        Args:
+            grace_period (float): the number of seconds to keep a detached session alive, defaults to 300
+        """
+        if grace_period < 0:
+            raise ValueError("grace_period cannot be negative")
+
+        self._grace_period = grace_period
+        self._detached: Dict[str, Tuple[Session[T], threading.Timer]] = {}
+        self._lock = threading.Lock()
+
+    def detach(self, session: Session[T]) -> None:
+        """
+        Detaches a session from its client, cleaning it up unless it is resumed within the grace period.
+
+        Args:
+            session (Session[T]): the session to detach
+        """
+        token = session.get_token()
+        timer = threading.Timer(self._grace_period, self._expire, args=(token,))
+        timer.daemon = True
+
+        with self._lock:
+            self._detached[token] = (session, timer)
+        timer.start()
+
+    def reattach(self, token: str) -> Optional[Session[T]]:
+        """
+        Reattaches a detached session.
+
+        Args:
+            token (str): the resumption token of the session
+
+        Returns:
+            Optional[Session[T]]: the detached session, or None if no session with the token is detached
+        """
+        with self._lock:
+            entry = self._detached.pop(token, None)
+
+        if entry is None:
+            return None
+
+        session, timer = entry
+        timer.cancel()
+        return session
+
+    def n_detached(self) -> int:
+        """
+        Returns the number of detached sessions.
+
+        Returns:
+            int: the number of detached sessions
+        """
+        with self._lock:
+            return len(self._detached)
+
+    def stop(self) -> None:
+        """Cleans up all detached sessions."""
+        with self._lock:
+            entries = list(self._detached.values())
+            self._detached.clear()
+
+        for session, timer in entries:
+            timer.cancel()
+            session.cleanup()
+
+    def _expire(self, token: str) -> None:
+        """Cleans up a detached session whose grace period has passed."""
+        with self._lock:
+            entry = self._detached.pop(token, None)
+
+        if entry is not None:
+            session, _ = entry
+            print(f"[SessionRegistry] Session of '{session.get_client_address()}' expired")
+            session.cleanup()
@@ -28,9 +28,7 @@ def run_train_stream():
     # act
     try:
         while True:
-            batch = []
-            while len(batch) < batch_size:
-                batch.append(stream.read())
+            batch = stream.read_many(batch_size)
             images, targets, _, _ = converter.convert(batch)
             for instance in batch:
                 print(f"[Test] Got frame {instance.index} from {instance.source.source_id}")
@@ -0,0 +1,68 @@
+import argparse
+import functools
+import os
+from typing import Dict
+
+import torch
+
+from src.data.dataset.dataset_split import DatasetSplit
+from src.data.dataset.streams.factories.network_dataset_stream_factory import NetworkDatasetStreamFactory
+from src.data.dataset.streams.providers.closing_stream_provider import ClosingStreamProvider
+from src.data.pipeline.pipeline import Pipeline
+from src.data.pipeline.preprocessor import Preprocessor
+from src.data.processing.bbox_denormalizer_processor import BBoxDenormalizerProcessor
+from src.models.predictor import Predictor
+from src.models.process_predictor import ProcessPredictor
+from src.models.streaming_evaluator import StreamingEvaluator
+from src.runners.inference_server_runner import create_faster_rcnn_predictor, create_yolox_predictor
+
+SERVER_IP = "10.0.0.1"
+
+CLASSES = ["tail_biting", "ear_biting", "belly_nosing", "tail_down"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluates several checkpoints against a single val stream.")
+    parser.add_argument("--model", choices=["faster_rcnn", "yolox"], required=True)
+    parser.add_argument("--ckpts", nargs="+", required=True, help="paths to the model checkpoints")
+    parser.add_argument("--output-dir", default="checkpoint_comparison")
+    parser.add_argument("--conf-thresh", type=float, default=0.3)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--processes", action="store_true", help="run each checkpoint in its own worker process")
+    args = parser.parse_args()
+
+    device = torch.device("cuda" if torch.cuda.is_available() and not args.processes else "cpu")
+    create_predictor = create_faster_rcnn_predictor if args.model == "faster_rcnn" else create_yolox_predictor
+
+    predictors: Dict[str, Predictor] = {}
+    for ckpt in args.ckpts:
+        name = os.path.splitext(os.path.basename(ckpt))[0]
+        if args.processes:
+            predictor = ProcessPredictor(functools.partial(create_predictor, ckpt, device, args.conf_thresh))
+            predictor.run()
+        else:
+            predictor = create_predictor(ckpt, device, args.conf_thresh)
+        predictors[name] = predictor
+
+    val_pipe = Pipeline(Preprocessor(BBoxDenormalizerProcessor()))
+    val_factory = NetworkDatasetStreamFactory(server_ip=SERVER_IP, split=DatasetSplit.VAL, pipeline=val_pipe)
+
+    evaluator = StreamingEvaluator(
+        stream_provider=ClosingStreamProvider(val_factory),
+        classes=CLASSES,
+        output_dir=args.output_dir,
+        batch_size=args.batch_size
+    )
+
+    try:
+        evaluator.evaluate_many(predictors)
+
+    finally:
+        evaluator.close()
+        for predictor in predictors.values():
+            if isinstance(predictor, ProcessPredictor):
+                predictor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import argparse
+import json
+import time
+from typing import Dict, List, Tuple
+
+import cv2
+import numpy as np
+import torch
+from rich.table import Table
+
+from src.models.cpu_optimization_config import CPUOptimizationConfig
+from src.models.evaluation_metrics import EvaluationMetrics
+from src.models.prediction import Prediction
+from src.models.predictor import Predictor
+from src.runners.inference_server_runner import create_faster_rcnn_predictor, create_yolox_predictor
+from src.utils.logging import console
+
+CLASSES = ["tail_biting", "ear_biting", "belly_nosing", "tail_down"]
+
+
+def load_frames(video_path: str, n_frames: int, stride: int) -> List[np.ndarray]:
+    """Reads a fixed set of frames from a video file, every stride-th frame from the start."""
+    capture = cv2.VideoCapture(video_path)
+    frames = []
+    index = 0
+    while len(frames) < n_frames:
+        ok, frame = capture.read()
+        if not ok:
+            break
+
+        if index % stride == 0:
+            frames.append(frame)
+        index += 1
+
+    capture.release()
+    if not frames:
+        raise ValueError(f"Could not read any frames from {video_path}")
+
+    return frames
+
+
+def run_predictor(predictor: Predictor, frames: List[np.ndarray], batch_size: int,
+                  n_warmup: int) -> Tuple[List[List[Prediction]], np.ndarray]:
+    """Runs a predictor over the frames after warming it up, returning the predictions and per-batch latencies."""
+    batches = [frames[i:i + batch_size] for i in range(0, len(frames), batch_size)]
+    for batch in batches[:n_warmup]:
+        predictor.predict_batch(batch)
+
+    predictions = []
+    latencies = []
+    for batch in batches:
+        start = time.perf_counter()
+        predictions.extend(predictor.predict_batch(batch))
+        latencies.append(time.perf_counter() - start)
+
+    return predictions, np.array(latencies)
+
+
+def to_array(predictions: List[Prediction], with_conf: bool) -> np.ndarray:
+    """Converts the predictions of a frame to [x1, y1, x2, y2, class_id(, score)] rows."""
+    rows = [[p.x1, p.y1, p.x2, p.y2, p.cls] + ([p.conf] if with_conf else []) for p in predictions]
+    return np.array(rows, dtype=np.float32).reshape(-1, 6 if with_conf else 5)
+
+
+def compare(reference: List[List[Prediction]], candidate: List[List[Prediction]], iou_thresh: float) -> Dict:
+    """Scores the candidate predictions against the reference predictions, treating the latter as ground truths."""
+    metrics = EvaluationMetrics(classes=CLASSES, iou_thresh=iou_thresh)
+    metrics.update([to_array(p, with_conf=True) for p in candidate], [to_array(p, with_conf=False) for p in reference])
+    result = metrics.compute()
+
+    return {
+        "mAP": float(result["mAP"]),
+        "macro_f1": float(result["macro_f1"]),
+        "mean_abs_detection_diff": float(np.mean([abs(len(r) - len(c)) for r, c in zip(reference, candidate)]))
+    }
+
+
+def summarize(latencies: np.ndarray, n_frames: int) -> Dict:
+    """Summarizes per-batch latencies in milliseconds and throughput in frames per second."""
+    return {
+        "mean_ms": float(latencies.mean() * 1000),
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p95_ms": float(np.percentile(latencies, 95) * 1000),
+        "fps": float(n_frames / latencies.sum())
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares the accuracy and latency of CPU-optimized and eager "
+                                                 "inference on a fixed set of frames.")
+    parser.add_argument("--model", choices=["faster_rcnn", "yolox"], required=True)
+    parser.add_argument("--ckpt", required=True, help="path to the model checkpoint")
+    parser.add_argument("--video", required=True, help="path to the video to read frames from")
+    parser.add_argument("--n-frames", type=int, default=100)
+    parser.add_argument("--stride", type=int, default=10, help="read every stride-th frame of the video")
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=3, help="number of batches to run before timing")
+    parser.add_argument("--conf-thresh", type=float, default=0.3)
+    parser.add_argument("--iou-thresh", type=float, default=0.5)
+    parser.add_argument("--threads", type=int, default=None, help="number of intra-op threads")
+    parser.add_argument("--no-jit", action="store_true")
+    parser.add_argument("--no-channels-last", action="store_true")
+    parser.add_argument("--no-quantize", action="store_true")
+    parser.add_argument("--output", default="cpu_inference_report.json")
+    args = parser.parse_args()
+
+    if args.threads is not None:
+        torch.set_num_threads(args.threads)
+
+    device = torch.device("cpu")
+    create_predictor = create_faster_rcnn_predictor if args.model == "faster_rcnn" else create_yolox_predictor
+    optimization = CPUOptimizationConfig(
+        jit=not args.no_jit, channels_last=not args.no_channels_last, quantize_linear=not args.no_quantize
+    )
+
+    frames = load_frames(args.video, args.n_frames, args.stride)
+    console.log(f"Loaded {len(frames)} frames of shape {frames[0].shape}")
+
+    eager_preds, eager_latencies = run_predictor(
+        create_predictor(args.ckpt, device, args.conf_thresh), frames, args.batch_size, args.warmup
+    )
+    optimized_preds, optimized_latencies = run_predictor(
+        create_predictor(args.ckpt, device, args.conf_thresh, optimization), frames, args.batch_size, args.warmup
+    )
+
+    report = {
+        "model": args.model,
+        "ckpt": args.ckpt,
+        "n_frames": len(frames),
+        "batch_size": args.batch_size,
+        "threads": torch.get_num_threads(),
+        "optimization": vars(optimization),
+        "eager": summarize(eager_latencies, len(frames)),
+        "optimized": summarize(optimized_latencies, len(frames)),
+        "agreement": compare(eager_preds, optimized_preds, args.iou_thresh)
+    }
+
+    table = Table(title="CPU Inference Benchmark")
+    table.add_column("Mode", justify="right", style="bold")
+    table.add_column("Mean (ms)", justify="right")
+    table.add_column("P50 (ms)", justify="right")
+    table.add_column("P95 (ms)", justify="right")
+    table.add_column("FPS", justify="right")
+    for mode in ["eager", "optimized"]:
+        stats = report[mode]
+        table.add_row(mode, f"{stats['mean_ms']:.1f}", f"{stats['p50_ms']:.1f}", f"{stats['p95_ms']:.1f}",
+                      f"{stats['fps']:.2f}")
+    console.print(table)
+
+    agreement = report["agreement"]
+    console.log(f"Optimized vs eager: mAP {agreement['mAP']:.4f}, macro F1 {agreement['macro_f1']:.4f}, "
+                f"speedup {report['optimized']['fps'] / report['eager']['fps']:.2f}x")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    console.log(f"Wrote report to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,15 @@ import math
 
 from torch.utils.data import DataLoader
 
+from src.data.dataclasses.catalog_shard import CatalogShard
 from src.data.dataset.dataset_split import DatasetSplit
 from src.data.dataset.streams.factories.network_dataset_stream_factory import NetworkDatasetStreamFactory
 from src.data.dataset.streams.providers.closing_stream_provider import ClosingStreamProvider
-from src.data.dataset.streams.providers.reusable_stream_provider import ReusableStreamProvider
+from src.data.dataset.streams.providers.ranked_stream_provider import RankedStreamProvider
 from src.data.pipeline.pipeline import Pipeline
 from src.data.pipeline.preprocessor import Preprocessor
 from src.data.processing.bbox_denormalizer_processor import BBoxDenormalizerProcessor
-from src.data.processing.zlib_decompressor import ZlibDecompressor
+from src.models.early_stopping_config import EarlyStoppingConfig
 from src.models.streaming_evaluator import StreamingEvaluator
 from src.models.twod.rcnn.faster.streaming_dataset import StreamingDataset
 from src.models.twod.rcnn.faster.trainer import Trainer
@@ -19,33 +20,49 @@ SERVER_IP = "10.0.0.1"
 
 BATCH_SIZE = 1
 
+# number of data loader worker processes, each streaming and preprocessing its own part of the training set
+N_LOADER_WORKERS = 4
+
 OUTPUT_DIR = "faster_rcnn_outputs"
 
+# shard of the val videos used for quick evaluations between full ones
+VAL_SUBSET_SHARD = CatalogShard(index=0, count=4)
+
 def collate_fn(batch):
     return tuple(zip(*batch))
 
 def main():
-    train_pipe = Pipeline(Preprocessor(ZlibDecompressor())).then(Preprocessor(BBoxDenormalizerProcessor()))
-    val_pipe = Pipeline(Preprocessor(ZlibDecompressor())).then(Preprocessor(BBoxDenormalizerProcessor()))
-    train_factory = NetworkDatasetStreamFactory(server_ip=SERVER_IP, split=DatasetSplit.TRAIN, pipeline=train_pipe)
+    train_pipe = Pipeline(Preprocessor(BBoxDenormalizerProcessor()))
+    val_pipe = Pipeline(Preprocessor(BBoxDenormalizerProcessor()))
     val_factory = NetworkDatasetStreamFactory(server_ip=SERVER_IP, split=DatasetSplit.VAL, pipeline=val_pipe)
 
-    train_provider = ReusableStreamProvider(train_factory.create_stream())
+    train_provider = RankedStreamProvider(
+        stream_factory_fn=lambda rank, world_size: NetworkDatasetStreamFactory(
+            server_ip=SERVER_IP, split=DatasetSplit.TRAIN, pipeline=train_pipe, rank=rank, world_size=world_size,
+            ordered=False
+        )
+    )
     val_provider = ClosingStreamProvider(val_factory)
+    val_subset_factory = NetworkDatasetStreamFactory(
+        server_ip=SERVER_IP, split=DatasetSplit.VAL, pipeline=val_pipe, shard=VAL_SUBSET_SHARD
+    )
 
     dataset = StreamingDataset(train_provider, n_batches=math.ceil(NORSVIN_TRAIN_SET_SIZE / BATCH_SIZE))
     dataloader = DataLoader(
         dataset=dataset,
         batch_size=BATCH_SIZE,
         collate_fn=collate_fn,
-        num_workers=0,
+        num_workers=N_LOADER_WORKERS,
+        persistent_workers=N_LOADER_WORKERS > 0,
         pin_memory=True
     )
 
     evaluator = StreamingEvaluator(
         stream_provider=val_provider,
         classes=["tail_biting", "ear_biting", "belly_nosing", "tail_down"],
-        output_dir=OUTPUT_DIR
+        output_dir=OUTPUT_DIR,
+        early_stopping=EarlyStoppingConfig(max_ci_width=0.05),
+        subset_stream_provider=ClosingStreamProvider(val_subset_factory)
     )
 
     trainer = Trainer(
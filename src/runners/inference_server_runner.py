@@ -0,0 +1,110 @@
+import argparse
+import time
+from typing import Optional
+
+import torch
+from torch.nn import Module
+from torchvision.models.detection import fasterrcnn_resnet50_fpn
+from torchvision.models.detection.faster_rcnn import FastRCNNPredictor
+
+from src.models.cpu_optimization_config import CPUOptimizationConfig
+from src.models.predictor import Predictor
+from src.models.serving.dynamic_batcher import DynamicBatcher
+from src.models.twod.rcnn.faster.faster_rcnn_predictor import FasterRCNNPredictor
+from src.network.messages.requests.handlers.registry.factories.inference_handler_registry_factory import \
+    InferenceHandlerRegistryFactory
+from src.network.messages.serialization.factories.pickle_deserializer_factory import PickleDeserializerFactory
+from src.network.messages.serialization.factories.pickle_serializer_factory import PickleSerializerFactory
+from src.network.network_config import NETWORK_SERVER_PORT
+from src.network.server.network_server import NetworkServer
+from src.network.server.session.factories.clean_session_factory import CleanSessionFactory
+from src.utils.logging import console
+
+# number of behavior classes
+N_CLASSES = 4
+
+# interval for logging serving statistics, in seconds
+STATS_INTERVAL = 30
+
+
+def create_faster_rcnn_predictor(ckpt_path: str, device: torch.device, conf_thresh: float,
+                                 optimization: Optional[CPUOptimizationConfig] = None) -> Predictor:
+    """Creates a Faster R-CNN predictor from a checkpoint written by the Faster R-CNN trainer."""
+    model = fasterrcnn_resnet50_fpn(weights=None, weights_backbone=None)
+    in_features = model.roi_heads.box_predictor.cls_score.in_features
+    model.roi_heads.box_predictor = FastRCNNPredictor(in_features, N_CLASSES + 1)
+    _load_weights(model, torch.load(ckpt_path, map_location=device)["model_state_dict"], device)
+
+    return FasterRCNNPredictor(model, device=device, conf_thresh=conf_thresh, class_shift=-1,
+                               optimization=optimization)
+
+
+def create_yolox_predictor(ckpt_path: str, device: torch.device, conf_thresh: float,
+                           optimization: Optional[CPUOptimizationConfig] = None) -> Predictor:
+    """Creates a YOLOX predictor from a checkpoint written by the YOLOX trainer, importing YOLOX only when used."""
+    from yolox.exp import Exp
+    from src.models.twod.yolo.x.yolox_predictor import YOLOXPredictor
+
+    exp = Exp()
+    exp.num_classes = N_CLASSES
+    exp.depth = 0.33
+    exp.width = 0.50
+    model = exp.get_model()
+    _load_weights(model, torch.load(ckpt_path, map_location=device)["model"], device)
+
+    return YOLOXPredictor(model, device=device, conf_thresh=conf_thresh, optimization=optimization)
+
+
+def _load_weights(model: Module, state_dict: dict, device: torch.device) -> None:
+    """Loads weights into a model and prepares it for inference."""
+    model.load_state_dict(state_dict)
+    model.to(device)
+    model.eval()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serves object detection predictions with dynamic batching.")
+    parser.add_argument("--model", choices=["faster_rcnn", "yolox"], required=True)
+    parser.add_argument("--ckpt", required=True, help="path to the model checkpoint")
+    parser.add_argument("--port", type=int, default=NETWORK_SERVER_PORT)
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    parser.add_argument("--max-queue-delay", type=float, default=0.01, help="max seconds to wait for a full batch")
+    parser.add_argument("--conf-thresh", type=float, default=0.3)
+    parser.add_argument("--cpu-optimize", action="store_true",
+                        help="trace the model and use channels last and int8 linear layers")
+    args = parser.parse_args()
+
+    device = torch.device("cpu")
+    create_predictor = create_faster_rcnn_predictor if args.model == "faster_rcnn" else create_yolox_predictor
+    optimization = CPUOptimizationConfig() if args.cpu_optimize else None
+    predictor = create_predictor(args.ckpt, device, args.conf_thresh, optimization)
+
+    batcher = DynamicBatcher(
+        predict_fn=predictor.predict_batch,
+        max_batch_size=args.max_batch_size,
+        max_queue_delay=args.max_queue_delay
+    )
+
+    server = NetworkServer(
+        serializer_factory=PickleSerializerFactory(),
+        deserializer_factory=PickleDeserializerFactory(),
+        session_factory=CleanSessionFactory(),
+        handler_factory=InferenceHandlerRegistryFactory(batcher=batcher),
+        port=args.port
+    )
+
+    try:
+        batcher.run()
+        server.run()
+        while True:
+            time.sleep(STATS_INTERVAL)
+            console.log(f"[bold]Latency[/bold] {batcher.get_latency_histogram()}")
+            console.log(f"[bold]Batch size[/bold] {batcher.get_batch_size_histogram()}")
+
+    except KeyboardInterrupt:
+        server.stop()
+        batcher.stop()
+
+
+if __name__ == "__main__":
+    main()
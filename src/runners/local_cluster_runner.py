@@ -0,0 +1,22 @@
+import time
+from functools import partial
+
+from src.network.server.local_cluster import LocalCluster
+from src.runners.server_runner import create_stream_factories
+
+
+def main():
+    cluster = LocalCluster(n_nodes=3, stream_factories_provider=partial(create_stream_factories, warm=False))
+
+    try:
+        cluster.run()
+        print(f"[LocalCluster] Nodes running at {cluster.get_addresses()}")
+        while True:
+            time.sleep(1)
+
+    except KeyboardInterrupt:
+        cluster.stop()
+
+
+if __name__ == "__main__":
+    main()
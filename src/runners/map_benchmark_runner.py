@@ -0,0 +1,101 @@
+import argparse
+import time
+from typing import List, Tuple
+
+import numpy as np
+from rich.table import Table
+
+from src.utils.calculators.metrics.map_calculator import MAPCalculator
+from src.utils.calculators.metrics.streaming_map_calculator import StreamingMAPCalculator, COCO_IOU_THRESHOLDS
+from src.utils.logging import console
+
+# number of behavior classes
+N_CLASSES = 4
+
+# size of the synthetic images, in pixels
+IMAGE_SIZE = 1000
+
+
+def generate_image(rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Generates predictions and ground truths for a synthetic image, with jittered and spurious predictions."""
+    n_gts = rng.integers(0, 8)
+    xy = rng.uniform(0, IMAGE_SIZE - 200, (n_gts, 2))
+    wh = rng.uniform(40, 200, (n_gts, 2))
+    gts = np.hstack([xy, xy + wh, rng.integers(0, N_CLASSES, (n_gts, 1))])
+
+    n_copies = rng.integers(0, 3, n_gts)
+    matched = np.repeat(gts, n_copies, axis=0)
+    matched[:, :4] += rng.normal(0, 12, (len(matched), 4))
+    relabel = rng.random(len(matched)) < 0.2
+    matched[relabel, 4] = rng.integers(0, N_CLASSES, relabel.sum())
+
+    n_spurious = rng.integers(0, 4)
+    xy = rng.uniform(0, IMAGE_SIZE - 200, (n_spurious, 2))
+    wh = rng.uniform(40, 200, (n_spurious, 2))
+    spurious = np.hstack([xy, xy + wh, rng.integers(0, N_CLASSES, (n_spurious, 1))])
+
+    boxes = np.vstack([matched, spurious])
+    preds = np.hstack([boxes, rng.random((len(boxes), 1))])
+
+    return preds, gts
+
+
+def run_library(images: List[Tuple[np.ndarray, np.ndarray]]) -> Tuple[np.ndarray, float]:
+    """Computes APs at the COCO thresholds with the mean_average_precision package, returning them and the time."""
+    start = time.perf_counter()
+
+    calculator = MAPCalculator(num_classes=N_CLASSES)
+    for preds, gts in images:
+        calculator.update(preds, gts)
+    result = calculator.metric.value(iou_thresholds=list(COCO_IOU_THRESHOLDS))
+
+    aps = np.array([[result[t][c]["ap"] for c in range(N_CLASSES)] for t in COCO_IOU_THRESHOLDS])
+    return aps, time.perf_counter() - start
+
+
+def run_streaming(images: List[Tuple[np.ndarray, np.ndarray]], batch_size: int) -> Tuple[np.ndarray, float]:
+    """Computes APs at the COCO thresholds with the StreamingMAPCalculator, returning them and the time."""
+    start = time.perf_counter()
+
+    calculator = StreamingMAPCalculator(num_classes=N_CLASSES, pixel_offset=1.0)
+    for i in range(0, len(images), batch_size):
+        batch = images[i:i + batch_size]
+        calculator.update_batch([preds for preds, _ in batch], [gts for _, gts in batch])
+    aps = calculator.compute_ap_matrix()
+
+    return aps, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the StreamingMAPCalculator against the library.")
+    parser.add_argument("--n-images", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    images = [generate_image(rng) for _ in range(args.n_images)]
+    n_preds = sum(len(preds) for preds, _ in images)
+    console.log(f"Generated {args.n_images} images with {n_preds} predictions")
+
+    library_aps, library_time = run_library(images)
+    streaming_aps, streaming_time = run_streaming(images, args.batch_size)
+
+    table = Table(title="mAP@[.5:.95] Benchmark")
+    table.add_column("Engine", justify="right", style="bold")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("mAP", justify="right")
+    table.add_column("mAP50", justify="right")
+
+    table.add_row("mean_average_precision", f"{library_time:.3f}", f"{library_aps.mean():.6f}",
+                  f"{library_aps[0].mean():.6f}")
+    table.add_row("StreamingMAPCalculator", f"{streaming_time:.3f}", f"{streaming_aps.mean():.6f}",
+                  f"{streaming_aps[0].mean():.6f}")
+    console.print(table)
+
+    console.log(f"Max AP difference: {np.abs(library_aps - streaming_aps).max():.2e}, "
+                f"speedup: {library_time / streaming_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
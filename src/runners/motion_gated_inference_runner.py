@@ -0,0 +1,59 @@
+import argparse
+import os
+import time
+
+import torch
+
+from src.data.dataset.entities.lazy_video_file import LazyVideoFile
+from src.data.loading.loaders.local_video_loader import LocalVideoLoader
+from src.data.streaming.streamers.video_file_streamer import VideoFileStreamer
+from src.models.cpu_optimization_config import CPUOptimizationConfig
+from src.models.motion_gated_inference import MotionGatedInference
+from src.runners.inference_server_runner import create_faster_rcnn_predictor, create_yolox_predictor
+from src.utils.logging import console
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs motion-gated detection over a pen video.")
+    parser.add_argument("--model", choices=["faster_rcnn", "yolox"], required=True)
+    parser.add_argument("--ckpt", required=True, help="path to the model checkpoint")
+    parser.add_argument("--video", required=True, help="path to the video file")
+    parser.add_argument("--conf-thresh", type=float, default=0.3)
+    parser.add_argument("--motion-thresh", type=float, default=0.02,
+                        help="min mean absolute difference of downscaled frames, from 0 to 1, for running the model")
+    parser.add_argument("--max-staleness", type=int, default=30,
+                        help="max number of frames to reuse detections for before running the model")
+    parser.add_argument("--cpu-optimize", action="store_true",
+                        help="trace the model and use channels last and int8 linear layers")
+    args = parser.parse_args()
+
+    device = torch.device("cpu")
+    create_predictor = create_faster_rcnn_predictor if args.model == "faster_rcnn" else create_yolox_predictor
+    optimization = CPUOptimizationConfig() if args.cpu_optimize else None
+    predictor = create_predictor(args.ckpt, device, args.conf_thresh, optimization)
+
+    gate = MotionGatedInference(predictor, motion_thresh=args.motion_thresh, max_staleness=args.max_staleness)
+    video = LazyVideoFile(args.video, os.path.splitext(os.path.basename(args.video))[0], LocalVideoLoader())
+    streamer = VideoFileStreamer(video, gate)
+
+    start = time.perf_counter()
+    try:
+        streamer.start_streaming()
+        streamer.wait_for_completion()
+
+    except KeyboardInterrupt:
+        streamer.stop_streaming()
+
+    elapsed = time.perf_counter() - start
+    n_frames = gate.get_n_frames()
+    n_inferences = gate.get_n_inferences()
+    console.log(
+        f"[bold]Frames[/bold] {n_frames} | [bold]Inferences[/bold] {n_inferences} "
+        f"| [bold]Inference rate[/bold] {gate.get_inference_rate():.1%} "
+        f"| [bold]Throughput[/bold] {n_frames / elapsed:.1f} fps "
+        f"| [bold]Mean inference[/bold] {1000 * gate.get_inference_time() / max(n_inferences, 1):.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
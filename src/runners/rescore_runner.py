@@ -0,0 +1,34 @@
+import argparse
+import time
+
+from src.models.evaluation_metrics import EvaluationMetrics
+from src.models.prediction_filter import PredictionFilter
+from src.models.prediction_store import PredictionStore
+from src.utils.logging import console
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recomputes evaluation metrics from a saved prediction store.")
+    parser.add_argument("--store", type=str, required=True, help="directory of the prediction store")
+    parser.add_argument("--iou-thresh", type=float, default=0.5)
+    parser.add_argument("--conf-thresh", type=float, default=0.0)
+    parser.add_argument("--nms-iou", type=float, default=None, help="iou threshold for nms, no nms if not given")
+    parser.add_argument("--batch-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+
+    store = PredictionStore(args.store)
+    prediction_filter = PredictionFilter(conf_thresh=args.conf_thresh, nms_iou=args.nms_iou)
+    metrics = EvaluationMetrics(classes=store.get_classes(), iou_thresh=args.iou_thresh)
+
+    for preds, gts in store.iter_batches(args.batch_size):
+        metrics.update([frame_preds[prediction_filter.filter(frame_preds)] for frame_preds in preds], gts)
+
+    metrics.report()
+
+    console.log(f"Re-scored {len(store)} frames in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ from src.data.dataset.selectors.factories.random_string_selector_factory import
 from src.data.dataset.streams.factories.dock_stream_factory import DockStreamFactory
 from src.data.dataset.streams.factories.pool_stream_factory import PoolStreamFactory
 from src.data.dataset.streams.managed.factories.gcs_stream_factory import GCSStreamFactory
+from src.data.dataset.streams.managed.factories.shared_stream_factory import SharedStreamFactory
+from src.data.dataset.streams.managed.factories.warm_stream_factory import WarmStreamFactory
 from src.data.pipeline.factories.norsvin_eval_pipeline_factory import NorsvinEvalPipelineFactory
 from src.data.pipeline.factories.norsvin_train_pipeline_factory import NorsvinTrainPipelineFactory
 from src.network.messages.requests.handlers.dataset_stream_factories import DatasetStreamFactories
@@ -15,6 +17,7 @@ from src.network.messages.serialization.factories.pickle_deserializer_factory im
 from src.network.messages.serialization.factories.pickle_serializer_factory import PickleSerializerFactory
 from src.network.server.network_server import NetworkServer
 from src.network.server.session.factories.clean_session_factory import CleanSessionFactory
+from src.network.server.session.session_registry import SessionRegistry
 from src.utils.norsvin_behavior_class import NorsvinBehaviorClass
 
 from src.data.dataclasses.annotated_frame import AnnotatedFrame
@@ -29,7 +32,8 @@ def is_annotated(instance: AnnotatedFrame) -> bool:
     return len(instance.annotations) > 0
 
 
-def main():
+def create_stream_factories(warm: bool = True) -> DatasetStreamFactories:
+    """Creates the dataset stream factories served by a data server, optionally keeping train streams warm."""
     gcs_creds = GCSCredentials(bucket_name=TestBucket.BUCKET_NAME, service_account_path=TestBucket.SERVICE_ACCOUNT_FILE)
     split_ratios = NORSVIN_SPLIT_RATIOS
 
@@ -67,29 +71,38 @@ def main():
         pipeline_factory=NorsvinEvalPipelineFactory()
     )
 
-    stream_factories = DatasetStreamFactories(
-        train_factory=train_stream_factory,
-        val_factory=val_stream_factory,
-        test_factory=test_stream_factory
+    return DatasetStreamFactories(
+        train_factory=WarmStreamFactory(train_stream_factory, n_warm=1) if warm else train_stream_factory,
+        val_factory=SharedStreamFactory(val_stream_factory, lag_window=1000),
+        test_factory=SharedStreamFactory(test_stream_factory, lag_window=1000)
     )
 
+
+def main():
+    stream_factories = create_stream_factories(warm=True)
+    train_stream_factory = stream_factories.train_factory
+
     session_factory = CleanSessionFactory()
-    handler_factory = DefaultHandlerRegistryFactory(stream_factories=stream_factories)
+    session_registry = SessionRegistry(grace_period=300)
+    handler_factory = DefaultHandlerRegistryFactory(stream_factories=stream_factories, session_registry=session_registry)
 
     server = NetworkServer(
         serializer_factory=PickleSerializerFactory(),
         deserializer_factory=PickleDeserializerFactory(),
         session_factory=session_factory,
-        handler_factory=handler_factory
+        handler_factory=handler_factory,
+        session_registry=session_registry
     )
 
     try:
+        train_stream_factory.run()
         server.run()
         while True:
             time.sleep(1)
 
     except KeyboardInterrupt:
         server.stop()
+        train_stream_factory.stop()
 
 
 if __name__ == "__main__":
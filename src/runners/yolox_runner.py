@@ -1,13 +1,14 @@
 import traceback
 
 from src.data.dataset.streams.factories.network_dataset_stream_factory import NetworkDatasetStreamFactory
+from src.data.dataclasses.catalog_shard import CatalogShard
 from src.data.dataset.dataset_split import DatasetSplit
 from src.data.dataset.streams.providers.closing_stream_provider import ClosingStreamProvider
-from src.data.dataset.streams.providers.reusable_stream_provider import ReusableStreamProvider
+from src.data.dataset.streams.providers.ranked_stream_provider import RankedStreamProvider
 from src.data.pipeline.pipeline import Pipeline
 from src.data.pipeline.preprocessor import Preprocessor
 from src.data.processing.bbox_denormalizer_processor import BBoxDenormalizerProcessor
-from src.data.processing.zlib_decompressor import ZlibDecompressor
+from src.models.early_stopping_config import EarlyStoppingConfig
 from src.models.streaming_evaluator import StreamingEvaluator
 from src.models.twod.yolo.x.streaming_trainer import StreamingTrainer
 from src.models.twod.yolo.x.streaming_exp import StreamingExp
@@ -15,22 +16,36 @@ import argparse
 
 SERVER_IP = "10.0.0.1"
 
+# shard of the val videos used for quick evaluations between full ones
+VAL_SUBSET_SHARD = CatalogShard(index=0, count=4)
 
-def main():
-    train_pipeline = Pipeline(Preprocessor(ZlibDecompressor())).then(Preprocessor(BBoxDenormalizerProcessor()))
-    train_factory = NetworkDatasetStreamFactory(server_ip=SERVER_IP, split=DatasetSplit.TRAIN, pipeline=train_pipeline)
 
-    train_pipeline = Pipeline(Preprocessor(ZlibDecompressor())).then(Preprocessor(BBoxDenormalizerProcessor()))
-    val_factory = NetworkDatasetStreamFactory(server_ip=SERVER_IP, split=DatasetSplit.VAL, pipeline=train_pipeline)
+def main():
+    val_pipeline = Pipeline(Preprocessor(BBoxDenormalizerProcessor()))
+    val_factory = NetworkDatasetStreamFactory(server_ip=SERVER_IP, split=DatasetSplit.VAL, pipeline=val_pipeline)
 
-    train_provider = ReusableStreamProvider(stream=train_factory.create_stream())
+    train_provider = RankedStreamProvider(
+        stream_factory_fn=lambda rank, world_size: NetworkDatasetStreamFactory(
+            server_ip=SERVER_IP,
+            split=DatasetSplit.TRAIN,
+            pipeline=Pipeline(Preprocessor(BBoxDenormalizerProcessor())),
+            rank=rank,
+            world_size=world_size,
+            ordered=False
+        )
+    )
     val_provider = ClosingStreamProvider(stream_factory=val_factory)
+    val_subset_factory = NetworkDatasetStreamFactory(
+        server_ip=SERVER_IP, split=DatasetSplit.VAL, pipeline=val_pipeline, shard=VAL_SUBSET_SHARD
+    )
 
     evaluator = StreamingEvaluator(
         stream_provider=val_provider,
         classes=["tail_biting", "ear_biting", "belly_nosing", "tail_down"],
         output_dir="YOLOX_outputs/streaming_yolox",
-        nms=False
+        nms=False,
+        early_stopping=EarlyStoppingConfig(max_ci_width=0.05),
+        subset_stream_provider=ClosingStreamProvider(stream_factory=val_subset_factory)
     )
 
     exp = StreamingExp(
@@ -38,7 +53,8 @@ def main():
         val_stream_provider=val_provider,
         evaluator=evaluator,
         freeze_backbone=True,
-        iou_thresh=0.3
+        iou_thresh=0.3,
+        n_workers=4
     )
 
     args = argparse.Namespace(
@@ -0,0 +1,238 @@
+from typing import List, Sequence, Dict, Tuple, Optional
+
+import numpy as np
+
+from src.data.structures.growable_array import GrowableArray
+from src.utils.calculators.metrics.box_matcher import BoxMatcher
+from src.utils.calculators.metrics.confusion_calculator import ConfusionCalculator
+from src.utils.calculators.metrics.streaming_map_calculator import StreamingMAPCalculator
+
+# max number of bootstrap resamples to evaluate at once, bounding memory use
+RESAMPLE_CHUNK_SIZE = 64
+
+
+class BootstrapMetricsEstimator:
+    """
+    Estimates macro F1 and mAP with bootstrap confidence intervals over a stream of frames grouped into videos.
+
+    Frames of the same video are strongly correlated, so whole videos are resampled. Videos are stratified by the class
+    they have the most ground truths of, and resampled within their stratum, keeping the class mix of the resamples
+    close to the one of the evaluated videos. Only per-video confusion matrices and ground truth counts, and the
+    scores, classes and true positive flags of the predictions, are kept, so estimating is cheap enough to repeat
+    while streaming.
+    """
+
+    def __init__(self, num_classes: int, iou_thresh: float = 0.5, n_resamples: int = 200, confidence: float = 0.95,
+                 seed: Optional[int] = None):
+        """
+        Initializes a BootstrapMetricsEstimator instance.
+
+        Args:
+            num_classes (int): the number of classes, excluding the background
+            iou_thresh (float): the iou threshold for matching predictions to ground truths, defaults to 0.5
+            n_resamples (int): the number of bootstrap resamples, defaults to 200
+            confidence (float): the confidence level of the intervals, defaults to 0.95
+            seed (Optional[int]): optional seed for the resampling
+        """
+        if num_classes < 1:
+            raise ValueError("num_classes must be greater than 0")
+
+        if n_resamples < 1:
+            raise ValueError("n_resamples must be greater than 0")
+
+        if not 0 < confidence < 1:
+            raise ValueError(f"confidence must be in range (0, 1), got {confidence}")
+
+        self._num_classes = num_classes
+        self._iou_thresh = iou_thresh
+        self._n_resamples = n_resamples
+        self._confidence = confidence
+        self._seed = seed
+        self._map_calculator = StreamingMAPCalculator(num_classes=num_classes, iou_thresholds=[iou_thresh])
+
+        self._video_indices: Dict[str, int] = {}
+        self._conf_mats = GrowableArray(row_shape=(num_classes + 1, num_classes + 1), dtype=np.int64, capacity=64)
+        self._gt_counts = GrowableArray(row_shape=(num_classes,), dtype=np.int64, capacity=64)
+
+        self._scores = GrowableArray(dtype=np.float64)
+        self._classes = GrowableArray(dtype=np.int64)
+        self._tps = GrowableArray(dtype=bool)
+        self._videos = GrowableArray(dtype=np.int64)
+
+    def update(self, video_ids: Sequence[str], preds: List[np.ndarray], gts: List[np.ndarray]) -> None:
+        """
+        Updates the estimator with a batch of frames.
+
+        Args:
+            video_ids (Sequence[str]): the id of the video of each frame
+            preds (List[np.ndarray]): predictions for each frame, of shape (N, 6) → [x1, y1, x2, y2, class_id, score]
+            gts (List[np.ndarray]): ground truths for each frame, of shape (M, 5) → [x1, y1, x2, y2, class_id]
+        """
+        if not len(video_ids) == len(preds) == len(gts):
+            raise ValueError("Got different numbers of video ids, predictions and ground truths")
+
+        frame_videos = np.array([self._get_video_index(video_id) for video_id in video_ids], dtype=np.int64)
+
+        pred_offsets = np.cumsum([0] + [len(p) for p in preds])
+        gt_offsets = np.cumsum([0] + [len(g) for g in gts])
+        all_preds = np.concatenate([np.asarray(p, dtype=np.float64).reshape(-1, 6) for p in preds], axis=0)
+        all_gts = np.concatenate([np.asarray(g, dtype=np.float64).reshape(-1, 5) for g in gts], axis=0)
+        pred_videos = np.repeat(frame_videos, np.diff(pred_offsets))
+        gt_videos = np.repeat(frame_videos, np.diff(gt_offsets))
+
+        gt_cls = all_gts[:, 4].astype(np.int64)
+        valid = (gt_cls >= 0) & (gt_cls < self._num_classes)
+        np.add.at(self._gt_counts.view(), (gt_videos[valid], gt_cls[valid]), 1)
+
+        self._update_confusion(all_preds, pred_offsets, pred_videos, all_gts, gt_offsets, gt_videos)
+
+        scores, classes, tps, images = self._map_calculator.match_batch(preds, gts)
+        self._scores.extend(scores)
+        self._classes.extend(classes)
+        self._tps.extend(tps[:, 0])
+        self._videos.extend(frame_videos[images])
+
+    def estimate(self) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Estimates the metrics from the accumulated frames.
+
+        Returns:
+            Dict[str, Tuple[float, float, float]]: the point estimate and the lower and upper confidence bounds of the
+                macro F1 under "macro_f1" and of the mAP under "mAP"
+        """
+        n_videos = self.get_n_videos()
+        if n_videos == 0:
+            raise RuntimeError("Cannot estimate metrics without any frames")
+
+        weights = np.vstack([np.ones((1, n_videos)), self._resample_weights()])
+
+        macro_f1 = np.concatenate([self._macro_f1(chunk) for chunk in self._chunks(weights)])
+        map_score = np.concatenate([self._map(chunk) for chunk in self._chunks(weights)])
+
+        return {
+            "macro_f1": self._interval(macro_f1),
+            "mAP": self._interval(map_score)
+        }
+
+    def get_n_videos(self) -> int:
+        """
+        Returns the number of videos seen.
+
+        Returns:
+            int: the number of videos
+        """
+        return len(self._video_indices)
+
+    def reset(self) -> None:
+        """Clears the accumulated frames."""
+        self._video_indices.clear()
+        self._conf_mats.clear()
+        self._gt_counts.clear()
+        self._scores.clear()
+        self._classes.clear()
+        self._tps.clear()
+        self._videos.clear()
+
+    def _get_video_index(self, video_id: str) -> int:
+        """Returns the index of a video, adding empty statistics for it the first time it is seen."""
+        if video_id not in self._video_indices:
+            self._video_indices[video_id] = len(self._video_indices)
+            self._conf_mats.extend(np.zeros((1, self._num_classes + 1, self._num_classes + 1), dtype=np.int64))
+            self._gt_counts.extend(np.zeros((1, self._num_classes), dtype=np.int64))
+
+        return self._video_indices[video_id]
+
+    def _update_confusion(self, preds: np.ndarray, pred_offsets: np.ndarray, pred_videos: np.ndarray, gts: np.ndarray,
+                          gt_offsets: np.ndarray, gt_videos: np.ndarray) -> None:
+        """Adds the confusion matrices of the videos of a batch to the per-video confusion matrices."""
+        matches = BoxMatcher.match(
+            pred_boxes=preds[:, :4],
+            pred_offsets=pred_offsets,
+            gt_boxes=gts[:, :4],
+            gt_offsets=gt_offsets,
+            iou_thresh=self._iou_thresh
+        )
+
+        conf_mats = self._conf_mats.view()
+        for video in np.unique(np.concatenate([pred_videos, gt_videos])):
+            pred_mask = pred_videos == video
+            gt_mask = gt_videos == video
+
+            # matches are always within a frame, so only need to be renumbered within the video
+            gt_positions = np.cumsum(gt_mask) - 1
+            video_matches = matches[pred_mask]
+            video_matches = np.where(video_matches >= 0, gt_positions[video_matches], -1)
+
+            conf_mats[video] += ConfusionCalculator.calculate_from_matches(
+                pred_classes=preds[pred_mask, 4],
+                gt_classes=gts[gt_mask, 4],
+                matches=video_matches,
+                num_classes=self._num_classes + 1
+            ).astype(np.int64)
+
+    def _resample_weights(self) -> np.ndarray:
+        """Returns the number of times each video is drawn in each stratified resample, of shape (n_resamples, n)."""
+        gt_counts = self._gt_counts.view()
+        strata = np.where(gt_counts.sum(axis=1) > 0, gt_counts.argmax(axis=1), self._num_classes)
+
+        rng = np.random.default_rng(self._seed)
+        weights = np.zeros((self._n_resamples, len(strata)), dtype=np.float64)
+        for stratum in np.unique(strata):
+            members = np.flatnonzero(strata == stratum)
+            weights[:, members] = rng.multinomial(len(members), np.full(len(members), 1 / len(members)),
+                                                  size=self._n_resamples)
+
+        return weights
+
+    def _macro_f1(self, weights: np.ndarray) -> np.ndarray:
+        """Returns the macro F1 of each resample, given the weights of the videos."""
+        conf_mats = np.einsum("bv,vij->bij", weights, self._conf_mats.view())
+
+        classes = np.arange(self._num_classes)
+        tp = conf_mats[:, classes, classes]
+        fp = conf_mats[:, :, classes].sum(axis=1) - tp
+        fn = conf_mats[:, classes, :].sum(axis=2) - tp
+
+        denom = 2 * tp + fp + fn
+        f1 = np.divide(2 * tp, denom, out=np.zeros_like(tp), where=denom > 0)
+        return f1.mean(axis=1)
+
+    def _map(self, weights: np.ndarray) -> np.ndarray:
+        """Returns the mAP of each resample, given the weights of the videos."""
+        scores, classes, tps, videos = self._scores.view(), self._classes.view(), self._tps.view(), self._videos.view()
+        n_gts = weights @ self._gt_counts.view()
+
+        aps = np.zeros((len(weights), self._num_classes), dtype=np.float64)
+        for cls in range(self._num_classes):
+            mask = classes == cls
+            if not mask.any():
+                continue
+
+            order = np.argsort(-scores[mask], kind="stable")
+            det_weights = weights[:, videos[mask][order]]
+
+            tp_cum = np.cumsum(det_weights * tps[mask][order], axis=1)
+            det_cum = np.cumsum(det_weights, axis=1)
+
+            recall = tp_cum / np.maximum(n_gts[:, cls], 1)[:, None]
+            precision = np.divide(tp_cum, det_cum, out=np.zeros_like(tp_cum), where=det_cum > 0)
+
+            n_rows = len(weights)
+            recall = np.hstack([np.zeros((n_rows, 1)), recall, np.ones((n_rows, 1))])
+            precision = np.hstack([np.zeros((n_rows, 1)), precision, np.zeros((n_rows, 1))])
+            precision = np.flip(np.maximum.accumulate(np.flip(precision, axis=1), axis=1), axis=1)
+
+            aps[:, cls] = np.sum((recall[:, 1:] - recall[:, :-1]) * precision[:, 1:], axis=1)
+
+        return aps.mean(axis=1)
+
+    def _interval(self, values: np.ndarray) -> Tuple[float, float, float]:
+        """Returns the point estimate in the first value and the percentile interval of the resamples after it."""
+        alpha = (1 - self._confidence) / 2
+        low, high = np.quantile(values[1:], [alpha, 1 - alpha])
+        return float(values[0]), float(low), float(high)
+
+    @staticmethod
+    def _chunks(weights: np.ndarray) -> List[np.ndarray]:
+        """Splits resample weights into chunks of at most RESAMPLE_CHUNK_SIZE resamples."""
+        return [weights[i:i + RESAMPLE_CHUNK_SIZE] for i in range(0, len(weights), RESAMPLE_CHUNK_SIZE)]
@@ -0,0 +1,88 @@
+from typing import Tuple
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from src.utils.calculators.metrics.iou_calculator import IoUCalculator
+
+
+class BoxMatcher:
+    """
+    Matches predicted boxes one-to-one with ground truth boxes for many frames at once.
+
+    The matching maximizes the total iou in each frame, keeping only matches with an iou of at least the threshold.
+    Frames where every box overlaps at most one box of the other kind have a unique optimal matching, which is found
+    directly. The Hungarian algorithm is only run for frames where some box overlaps several others.
+    """
+
+    @staticmethod
+    def match(pred_boxes: np.ndarray, pred_offsets: np.ndarray, gt_boxes: np.ndarray, gt_offsets: np.ndarray,
+              iou_thresh: float) -> np.ndarray:
+        """
+        Matches predictions to ground truths within each frame.
+
+        Args:
+            pred_boxes (np.ndarray): the predicted boxes of all frames, of shape (N, 4) in format [x1, y1, x2, y2]
+            pred_offsets (np.ndarray): the index of the first prediction of each frame, followed by N, of shape (F + 1,)
+            gt_boxes (np.ndarray): the ground truth boxes of all frames, of shape (M, 4) in format [x1, y1, x2, y2]
+            gt_offsets (np.ndarray): the index of the first ground truth of each frame, followed by M, of shape (F + 1,)
+            iou_thresh (float): the minimum iou for a match
+
+        Returns:
+            np.ndarray: the index of the ground truth matched with each prediction, or -1 if unmatched, of shape (N,)
+        """
+        if iou_thresh <= 0:
+            raise ValueError("iou_thresh must be greater than 0")
+
+        if len(pred_offsets) != len(gt_offsets):
+            raise ValueError("pred_offsets and gt_offsets must cover the same number of frames")
+
+        n_frames = len(pred_offsets) - 1
+        matches = np.full(len(pred_boxes), -1, dtype=np.int64)
+        if len(pred_boxes) == 0 or len(gt_boxes) == 0:
+            return matches
+
+        pred_frames = np.repeat(np.arange(n_frames), np.diff(pred_offsets))
+        gt_frames = np.repeat(np.arange(n_frames), np.diff(gt_offsets))
+
+        pair_preds, pair_gts = BoxMatcher._frame_pairs(pred_frames, gt_offsets)
+        ious = IoUCalculator.calculate_pairs(pred_boxes[pair_preds], gt_boxes[pair_gts])
+        overlapping = ious > 0
+
+        # frames are ambiguous if a box overlaps more than one box of the other kind
+        pred_degrees = np.bincount(pair_preds[overlapping], minlength=len(pred_boxes))
+        gt_degrees = np.bincount(pair_gts[overlapping], minlength=len(gt_boxes))
+        ambiguous = np.zeros(n_frames, dtype=bool)
+        ambiguous[pred_frames[pred_degrees > 1]] = True
+        ambiguous[gt_frames[gt_degrees > 1]] = True
+
+        direct = (ious >= iou_thresh) & ~ambiguous[pred_frames[pair_preds]]
+        matches[pair_preds[direct]] = pair_gts[direct]
+
+        for frame in np.flatnonzero(ambiguous):
+            BoxMatcher._assign(pred_boxes, pred_offsets[frame], pred_offsets[frame + 1], gt_boxes,
+                               gt_offsets[frame], gt_offsets[frame + 1], iou_thresh, matches)
+
+        return matches
+
+    @staticmethod
+    def _frame_pairs(pred_frames: np.ndarray, gt_offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the prediction and ground truth indices of every prediction-ground truth pair in the same frame."""
+        gt_counts = np.diff(gt_offsets)[pred_frames]
+        n_pairs = int(gt_counts.sum())
+
+        pair_preds = np.repeat(np.arange(len(pred_frames)), gt_counts)
+        pair_starts = np.repeat(np.cumsum(gt_counts) - gt_counts, gt_counts)
+        pair_gts = np.repeat(gt_offsets[:-1][pred_frames], gt_counts) + np.arange(n_pairs) - pair_starts
+
+        return pair_preds, pair_gts
+
+    @staticmethod
+    def _assign(pred_boxes: np.ndarray, pred_start: int, pred_end: int, gt_boxes: np.ndarray, gt_start: int,
+                gt_end: int, iou_thresh: float, matches: np.ndarray) -> None:
+        """Matches the predictions of a single frame using the Hungarian algorithm, writing to the matches array."""
+        ious = IoUCalculator.calculate(pred_boxes[pred_start:pred_end], gt_boxes[gt_start:gt_end])
+        pred_indices, gt_indices = linear_sum_assignment(1.0 - ious)
+
+        keep = ious[pred_indices, gt_indices] >= iou_thresh
+        matches[pred_start + pred_indices[keep]] = gt_start + gt_indices[keep]
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Union
 
 import numpy as np
 
@@ -7,17 +7,60 @@ class ConfusionCalculator:
     """Calculates confusion matrices."""
 
     @staticmethod
-    def calculate(predictions: List[int], targets: List[int], num_classes: int) -> np.ndarray:
+    def calculate(predictions: Union[List[int], np.ndarray], targets: Union[List[int], np.ndarray],
+                  num_classes: int) -> np.ndarray:
         """
         Computes a confusion matrix given predictions and targets.
 
         Args:
-            predictions (List[int]): the predictions
-            targets (List[int]): the targets
+            predictions (Union[List[int], np.ndarray]): the predictions
+            targets (Union[List[int], np.ndarray]): the targets
             num_classes (int): the number of classes
+
+        Returns:
+            np.ndarray: the confusion matrix of shape (num_classes, num_classes), indexed by [target, prediction]
+        """
+        predictions = np.asarray(predictions, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+
+        if np.any(predictions >= num_classes) or np.any(targets >= num_classes):
+            raise IndexError(f"Class indices must be smaller than num_classes {num_classes}")
+
+        counts = np.bincount(targets * num_classes + predictions, minlength=num_classes * num_classes)
+        return counts.reshape(num_classes, num_classes)
+
+    @staticmethod
+    def calculate_from_matches(pred_classes: np.ndarray, gt_classes: np.ndarray, matches: np.ndarray,
+                               num_classes: int) -> np.ndarray:
+        """
+        Computes a confusion matrix for matched detections, with the last class being the background.
+
+        Unmatched predictions are counted as background targets, and unmatched ground truths as background
+        predictions.
+
+        Args:
+            pred_classes (np.ndarray): the class of each prediction, of shape (N,)
+            gt_classes (np.ndarray): the class of each ground truth, of shape (M,)
+            matches (np.ndarray): the index of the ground truth matched with each prediction, or -1 if unmatched,
+                of shape (N,)
+            num_classes (int): the number of classes, including the background
+
+        Returns:
+            np.ndarray: the confusion matrix of shape (num_classes, num_classes), indexed by [target, prediction]
         """
-        A = np.zeros(shape=(num_classes, num_classes), dtype=int)
-        for gt, pred in zip(targets, predictions):
-            A[gt][pred] += 1
+        background = num_classes - 1
+        pred_classes = np.asarray(pred_classes, dtype=np.int64)
+        gt_classes = np.asarray(gt_classes, dtype=np.int64)
+
+        matched = matches >= 0
+        pred_targets = np.full(len(pred_classes), background, dtype=np.int64)
+        pred_targets[matched] = gt_classes[matches[matched]]
+
+        gt_matched = np.zeros(len(gt_classes), dtype=bool)
+        gt_matched[matches[matched]] = True
+        missed = gt_classes[~gt_matched]
+
+        predictions = np.concatenate([pred_classes, np.full(len(missed), background, dtype=np.int64)])
+        targets = np.concatenate([pred_targets, missed])
 
-        return A
\ No newline at end of file
+        return ConfusionCalculator.calculate(predictions, targets, num_classes)
@@ -4,13 +4,15 @@ class IoUCalculator:
     """Calculates IoU between predictions and ground truths."""
 
     @staticmethod
-    def calculate(pred_boxes: np.ndarray, gt_boxes: np.ndarray) -> np.ndarray:
+    def calculate(pred_boxes: np.ndarray, gt_boxes: np.ndarray, pixel_offset: float = 0.0) -> np.ndarray:
         """
         Compute IoU matrix between predicted boxes and ground truth boxes.
 
         Args:
             pred_boxes (np.ndarray): shape (N, 4) in format [x1, y1, x2, y2]
             gt_boxes (np.ndarray): shape (M, 4) in format [x1, y1, x2, y2]
+            pixel_offset (float): offset added to box widths and heights, 1 for the inclusive pixel coordinates of
+                PASCAL VOC, defaults to 0
 
         Returns:
             np.ndarray: IoU matrix of shape (N, M)
@@ -19,19 +21,50 @@ class IoUCalculator:
             return np.zeros((len(pred_boxes), len(gt_boxes)))
 
         # Areas
-        pred_areas = (pred_boxes[:, 2] - pred_boxes[:, 0]) * (pred_boxes[:, 3] - pred_boxes[:, 1])
-        gt_areas = (gt_boxes[:, 2] - gt_boxes[:, 0]) * (gt_boxes[:, 3] - gt_boxes[:, 1])
+        pred_areas = (pred_boxes[:, 2] - pred_boxes[:, 0] + pixel_offset) * \
+                     (pred_boxes[:, 3] - pred_boxes[:, 1] + pixel_offset)
+        gt_areas = (gt_boxes[:, 2] - gt_boxes[:, 0] + pixel_offset) * (gt_boxes[:, 3] - gt_boxes[:, 1] + pixel_offset)
 
         # Intersections
         inter_x1 = np.maximum(pred_boxes[:, None, 0], gt_boxes[:, 0])
         inter_y1 = np.maximum(pred_boxes[:, None, 1], gt_boxes[:, 1])
         inter_x2 = np.minimum(pred_boxes[:, None, 2], gt_boxes[:, 2])
         inter_y2 = np.minimum(pred_boxes[:, None, 3], gt_boxes[:, 3])
-        inter_area = np.maximum(0, inter_x2 - inter_x1) * np.maximum(0, inter_y2 - inter_y1)
+        inter_w = np.maximum(0, inter_x2 - inter_x1 + pixel_offset)
+        inter_h = np.maximum(0, inter_y2 - inter_y1 + pixel_offset)
+        inter_area = inter_w * inter_h
 
         # Unions
         union_area = pred_areas[:, None] + gt_areas - inter_area
 
         # IoU
         iou = inter_area / np.clip(union_area, a_min=1e-6, a_max=None)
-        return iou
\ No newline at end of file
+        return iou
+
+    @staticmethod
+    def calculate_pairs(pred_boxes: np.ndarray, gt_boxes: np.ndarray, pixel_offset: float = 0.0) -> np.ndarray:
+        """
+        Compute IoU between each predicted box and the ground truth box in the same row.
+
+        Args:
+            pred_boxes (np.ndarray): shape (N, 4) in format [x1, y1, x2, y2]
+            gt_boxes (np.ndarray): shape (N, 4) in format [x1, y1, x2, y2]
+            pixel_offset (float): offset added to box widths and heights, 1 for the inclusive pixel coordinates of
+                PASCAL VOC, defaults to 0
+
+        Returns:
+            np.ndarray: IoU array of shape (N,)
+        """
+        pred_areas = (pred_boxes[:, 2] - pred_boxes[:, 0] + pixel_offset) * \
+                     (pred_boxes[:, 3] - pred_boxes[:, 1] + pixel_offset)
+        gt_areas = (gt_boxes[:, 2] - gt_boxes[:, 0] + pixel_offset) * (gt_boxes[:, 3] - gt_boxes[:, 1] + pixel_offset)
+
+        inter_w = np.maximum(0, np.minimum(pred_boxes[:, 2], gt_boxes[:, 2]) -
+                             np.maximum(pred_boxes[:, 0], gt_boxes[:, 0]) + pixel_offset)
+        inter_h = np.maximum(0, np.minimum(pred_boxes[:, 3], gt_boxes[:, 3]) -
+                             np.maximum(pred_boxes[:, 1], gt_boxes[:, 1]) + pixel_offset)
+        inter_area = inter_w * inter_h
+
+        union_area = pred_areas + gt_areas - inter_area
+
+        return inter_area / np.clip(union_area, a_min=1e-6, a_max=None)
@@ -0,0 +1,209 @@
+from typing import List, Sequence, Dict, Any, Tuple
+
+import numpy as np
+
+from src.data.structures.growable_array import GrowableArray
+from src.utils.calculators.metrics.iou_calculator import IoUCalculator
+
+# the COCO iou thresholds, 0.5:0.05:0.95
+COCO_IOU_THRESHOLDS = tuple(round(0.5 + 0.05 * i, 2) for i in range(10))
+
+
+class StreamingMAPCalculator:
+    """
+    Accumulates average precision over a stream of images, for several iou thresholds at once.
+
+    Predictions are matched greedily to ground truths like in PASCAL VOC, in order of descending confidence, each
+    to the same-class ground truth it overlaps the most, counting as a true positive if the iou is above the
+    threshold and the ground truth is not matched already. Matching is done per batch when updating, so only the
+    scores, classes and true positive flags of the predictions are kept.
+    """
+
+    def __init__(self, num_classes: int, iou_thresholds: Sequence[float] = COCO_IOU_THRESHOLDS,
+                 pixel_offset: float = 0.0):
+        """
+        Initializes a StreamingMAPCalculator instance.
+
+        Args:
+            num_classes (int): the number of classes
+            iou_thresholds (Sequence[float]): the iou thresholds to compute average precision for, defaults to the
+                COCO thresholds
+            pixel_offset (float): offset added to box widths and heights when computing ious, 1 for the inclusive
+                pixel coordinates of PASCAL VOC and the mean_average_precision package, defaults to 0
+        """
+        if num_classes < 1:
+            raise ValueError("num_classes must be greater than 0")
+
+        if len(iou_thresholds) == 0:
+            raise ValueError("iou_thresholds must not be empty")
+
+        self.num_classes = num_classes
+        self.iou_thresholds = tuple(iou_thresholds)
+        self._thresholds = np.asarray(self.iou_thresholds, dtype=np.float64)
+        self._pixel_offset = pixel_offset
+
+        self._scores = GrowableArray(dtype=np.float64)
+        self._classes = GrowableArray(dtype=np.int64)
+        self._tps = GrowableArray(row_shape=(len(self.iou_thresholds),), dtype=bool)
+        self._n_gts = np.zeros(num_classes, dtype=np.int64)
+
+    def update(self, preds: np.ndarray, gts: np.ndarray) -> None:
+        """
+        Updates the metric with the predictions and ground truths of a single image.
+
+        Args:
+            preds (np.ndarray): shape (N, 6) → [x1, y1, x2, y2, class_id, score]
+            gts (np.ndarray): shape (M, 5) → [x1, y1, x2, y2, class_id]
+        """
+        self.update_batch([preds], [gts])
+
+    def update_batch(self, preds: List[np.ndarray], gts: List[np.ndarray]) -> None:
+        """
+        Updates the metric with the predictions and ground truths of a batch of images, matching the whole batch at
+        once.
+
+        Args:
+            preds (List[np.ndarray]): predictions for each image, of shape (N, 6) → [x1, y1, x2, y2, class_id, score]
+            gts (List[np.ndarray]): ground truths for each image, of shape (M, 5) → [x1, y1, x2, y2, class_id]
+        """
+        scores, classes, tps, _ = self.match_batch(preds, gts)
+
+        gt_cls = self._concat(gts, 5)[0][:, 4].astype(np.int64)
+        gt_valid = (gt_cls >= 0) & (gt_cls < self.num_classes)
+        self._n_gts += np.bincount(gt_cls[gt_valid], minlength=self.num_classes)
+
+        self._scores.extend(scores)
+        self._classes.extend(classes)
+        self._tps.extend(tps)
+
+    def match_batch(self, preds: List[np.ndarray], gts: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray,
+                                                                                    np.ndarray, np.ndarray]:
+        """
+        Matches the predictions of a batch of images to their ground truths without updating the metric.
+
+        Args:
+            preds (List[np.ndarray]): predictions for each image, of shape (N, 6) → [x1, y1, x2, y2, class_id, score]
+            gts (List[np.ndarray]): ground truths for each image, of shape (M, 5) → [x1, y1, x2, y2, class_id]
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: the scores, classes, (N, n_thresholds) true
+                positive flags and image indices of the predictions with a valid class
+        """
+        if len(preds) != len(gts):
+            raise ValueError(f"Got predictions for {len(preds)} images but ground truths for {len(gts)}")
+
+        pred_arr, pred_imgs = self._concat(preds, 6)
+        gt_arr, gt_imgs = self._concat(gts, 5)
+        gt_cls = gt_arr[:, 4].astype(np.int64)
+
+        pred_cls = pred_arr[:, 4].astype(np.int64)
+        pred_valid = (pred_cls >= 0) & (pred_cls < self.num_classes)
+        pred_arr, pred_imgs, pred_cls = pred_arr[pred_valid], pred_imgs[pred_valid], pred_cls[pred_valid]
+
+        scores = pred_arr[:, 5]
+        if len(pred_arr) == 0:
+            return scores, pred_cls, np.zeros((0, len(self.iou_thresholds)), dtype=bool), pred_imgs
+
+        tps = self._match(pred_arr[:, :4], pred_imgs, pred_cls, scores, gt_arr[:, :4], gt_imgs, gt_cls)
+
+        return scores, pred_cls, tps, pred_imgs
+
+    def compute(self) -> Dict[str, Any]:
+        """
+        Computes the average precision for every class and iou threshold from the accumulated predictions.
+
+        Returns:
+            Dict[str, Any]: the mAP and per-class AP averaged over all iou thresholds, under "mAP" and
+                "per_class_ap", and the mAP and per-class AP for each threshold under "per_threshold"
+        """
+        aps = self.compute_ap_matrix()
+        per_threshold = {
+            t: {"mAP": float(aps[i].mean()), "per_class_ap": dict(enumerate(aps[i].tolist()))}
+            for i, t in enumerate(self.iou_thresholds)
+        }
+
+        return {
+            "mAP": float(aps.mean()),
+            "per_class_ap": dict(enumerate(aps.mean(axis=0).tolist())),
+            "per_threshold": per_threshold
+        }
+
+    def compute_ap_matrix(self) -> np.ndarray:
+        """
+        Computes the average precision for every class and iou threshold from the accumulated predictions.
+
+        Returns:
+            np.ndarray: the average precisions, of shape (n_thresholds, num_classes)
+        """
+        scores, classes, tps = self._scores.view(), self._classes.view(), self._tps.view()
+
+        aps = np.zeros((len(self.iou_thresholds), self.num_classes), dtype=np.float64)
+        for cls in range(self.num_classes):
+            mask = classes == cls
+            if mask.any():
+                order = np.argsort(-scores[mask], kind="stable")
+                aps[:, cls] = self._average_precision(tps[mask][order], self._n_gts[cls])
+
+        return aps
+
+    def reset(self) -> None:
+        """Clears the stored predictions and GTs."""
+        self._scores.clear()
+        self._classes.clear()
+        self._tps.clear()
+        self._n_gts[:] = 0
+
+    def _match(self, pred_boxes: np.ndarray, pred_imgs: np.ndarray, pred_cls: np.ndarray, scores: np.ndarray,
+               gt_boxes: np.ndarray, gt_imgs: np.ndarray, gt_cls: np.ndarray) -> np.ndarray:
+        """Returns the (N, n_thresholds) true positive flags of the predictions of a batch."""
+        n_preds = len(pred_boxes)
+        tps = np.zeros((n_preds, len(self.iou_thresholds)), dtype=bool)
+        if len(gt_boxes) == 0:
+            return tps
+
+        # only ground truths of the same image and class are candidates
+        ious = IoUCalculator.calculate(pred_boxes=pred_boxes, gt_boxes=gt_boxes, pixel_offset=self._pixel_offset)
+        candidates = (pred_imgs[:, None] == gt_imgs[None, :]) & (pred_cls[:, None] == gt_cls[None, :])
+        ious = np.where(candidates, ious, -1.0)
+
+        best_gt = ious.argmax(axis=1)
+        best_iou = ious[np.arange(n_preds), best_gt]
+        hits = (best_iou[:, None] > self._thresholds[None, :]) & (best_iou[:, None] >= 0)
+
+        # a hit is a true positive only if it is the most confident hit on its ground truth
+        order = np.lexsort((-scores, best_gt))
+        sorted_gt = best_gt[order]
+        sorted_hits = hits[order]
+
+        cum_hits = np.cumsum(sorted_hits, axis=0)
+        group_starts = np.flatnonzero(np.r_[True, sorted_gt[1:] != sorted_gt[:-1]])
+        hits_before_group = np.vstack([np.zeros((1, hits.shape[1]), dtype=cum_hits.dtype), cum_hits])[group_starts]
+        group_sizes = np.diff(np.r_[group_starts, n_preds])
+        cum_hits -= np.repeat(hits_before_group, group_sizes, axis=0)
+
+        tps[order] = sorted_hits & (cum_hits == 1)
+        return tps
+
+    @staticmethod
+    def _average_precision(tps: np.ndarray, n_gts: int) -> np.ndarray:
+        """Returns the all-point interpolated average precision for each column of confidence-sorted TP flags."""
+        tp_cum = np.cumsum(tps, axis=0, dtype=np.float64)
+        n_dets = np.arange(1, len(tps) + 1, dtype=np.float64)[:, None]
+
+        recall = tp_cum / max(n_gts, 1)
+        precision = tp_cum / n_dets
+
+        n_cols = tps.shape[1]
+        recall = np.vstack([np.zeros((1, n_cols)), recall, np.ones((1, n_cols))])
+        precision = np.vstack([np.zeros((1, n_cols)), precision, np.zeros((1, n_cols))])
+        precision = np.flip(np.maximum.accumulate(np.flip(precision, axis=0), axis=0), axis=0)
+
+        return np.sum((recall[1:] - recall[:-1]) * precision[1:], axis=0)
+
+    @staticmethod
+    def _concat(arrays: List[np.ndarray], n_cols: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Concatenates per-image arrays, returning the rows and the index of the image of each row."""
+        arrays = [np.asarray(a, dtype=np.float64)[:, :n_cols] if len(a) else np.zeros((0, n_cols)) for a in arrays]
+        counts = [len(a) for a in arrays]
+
+        return np.concatenate(arrays, axis=0), np.repeat(np.arange(len(arrays)), counts)
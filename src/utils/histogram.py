@@ -0,0 +1,110 @@
+import bisect
+import math
+import threading
+from typing import List
+
+
+class Histogram:
+    """Thread-safe histogram counting recorded values into buckets with fixed upper bounds."""
+
+    def __init__(self, bounds: List[float]):
+        """
+        Initializes a Histogram instance.
+
+        Args:
+            bounds (List[float]): the inclusive upper bounds of the buckets in increasing order, values above the last
+                bound are counted in an overflow bucket
+        """
+        if not bounds:
+            raise ValueError("bounds must not be empty")
+
+        if any(a >= b for a, b in zip(bounds, bounds[1:])):
+            raise ValueError("bounds must be strictly increasing")
+
+        self._bounds = list(bounds)
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+
+        self._lock = threading.Lock()
+
+    def record(self, value: float) -> None:
+        """
+        Records a value.
+
+        Args:
+            value (float): the value to record
+        """
+        with self._lock:
+            self._counts[bisect.bisect_left(self._bounds, value)] += 1
+            self._sum += value
+
+    def get_bounds(self) -> List[float]:
+        """
+        Returns the upper bounds of the buckets.
+
+        Returns:
+            List[float]: the upper bounds, excluding the overflow bucket
+        """
+        return list(self._bounds)
+
+    def get_counts(self) -> List[int]:
+        """
+        Returns the number of values recorded in each bucket.
+
+        Returns:
+            List[int]: the counts per bucket, with the overflow bucket last
+        """
+        with self._lock:
+            return list(self._counts)
+
+    def count(self) -> int:
+        """
+        Returns the total number of recorded values.
+
+        Returns:
+            int: the number of recorded values
+        """
+        with self._lock:
+            return sum(self._counts)
+
+    def mean(self) -> float:
+        """
+        Returns the mean of the recorded values.
+
+        Returns:
+            float: the mean, or 0.0 if no value is recorded
+        """
+        with self._lock:
+            n = sum(self._counts)
+            return self._sum / n if n > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Returns an upper estimate of a percentile, being the upper bound of the bucket the percentile falls in.
+
+        Args:
+            q (float): the percentile in range [0, 100]
+
+        Returns:
+            float: the upper bound of the bucket, inf for the overflow bucket, or 0.0 if no value is recorded
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f"q must be in range [0, 100], got {q}")
+
+        with self._lock:
+            n = sum(self._counts)
+            if n == 0:
+                return 0.0
+
+            rank = max(1, math.ceil(n * q / 100))
+            seen = 0
+            for bound, count in zip(self._bounds + [math.inf], self._counts):
+                seen += count
+                if seen >= rank:
+                    return bound
+
+            return math.inf
+
+    def __repr__(self) -> str:
+        return (f"Histogram(n={self.count()}, mean={self.mean():.4g}, p50={self.percentile(50):.4g}, "
+                f"p99={self.percentile(99):.4g})")
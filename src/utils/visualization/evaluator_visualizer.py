@@ -0,0 +1,57 @@
+from typing import List
+
+import cv2
+import numpy as np
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.models.prediction import Prediction
+
+# color of ground truth boxes
+GT_COLOR = (0, 255, 0)
+
+# color of predicted boxes
+PRED_COLOR = (0, 0, 255)
+
+
+class EvaluatorVisualizer:
+    """Draws predictions and ground truths on images."""
+
+    @staticmethod
+    def save_image(image: np.ndarray, predictions: List[Prediction], ground_truths: List[AnnotatedBBox],
+                   class_names: List[str], save_path: str) -> None:
+        """
+        Draws predictions and ground truths on a copy of an image and saves it.
+
+        Args:
+            image (np.ndarray): the image to draw on, which is left unchanged
+            predictions (List[Prediction]): the predictions to draw
+            ground_truths (List[AnnotatedBBox]): the ground truths to draw
+            class_names (List[str]): the class names in order
+            save_path (str): the path to save the image to
+        """
+        canvas = np.ascontiguousarray(image).copy()
+
+        for gt in ground_truths:
+            x1, y1 = int(gt.bbox.x), int(gt.bbox.y)
+            x2, y2 = int(gt.bbox.x + gt.bbox.width), int(gt.bbox.y + gt.bbox.height)
+            label = EvaluatorVisualizer._get_name(gt.cls.value, class_names)
+            EvaluatorVisualizer._draw_box(canvas, x1, y1, x2, y2, label, GT_COLOR)
+
+        for pred in predictions:
+            label = f"{EvaluatorVisualizer._get_name(pred.cls, class_names)} {pred.conf:.2f}"
+            EvaluatorVisualizer._draw_box(canvas, int(pred.x1), int(pred.y1), int(pred.x2), int(pred.y2), label,
+                                          PRED_COLOR)
+
+        if not cv2.imwrite(save_path, canvas):
+            raise RuntimeError(f"Failed to write image to {save_path}")
+
+    @staticmethod
+    def _draw_box(canvas: np.ndarray, x1: int, y1: int, x2: int, y2: int, label: str, color: tuple) -> None:
+        """Draws a labeled box on the canvas."""
+        cv2.rectangle(canvas, (x1, y1), (x2, y2), color, 2)
+        cv2.putText(canvas, label, (x1, max(y1 - 4, 10)), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1, cv2.LINE_AA)
+
+    @staticmethod
+    def _get_name(cls: int, class_names: List[str]) -> str:
+        """Returns the name of a class index."""
+        return class_names[cls] if 0 <= cls < len(class_names) else f"class_{cls}"
@@ -0,0 +1,33 @@
+from collections import defaultdict
+from typing import List, Dict
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.models.prediction import Prediction
+from src.utils.visualization.samplers.visualization_sampler import VisualizationSampler
+
+
+class ClassQuotaSampler(VisualizationSampler):
+    """Samples frames until every class present in them has been visualized a maximum number of times."""
+
+    def __init__(self, max_per_class: int):
+        """
+        Initializes a ClassQuotaSampler instance.
+
+        Args:
+            max_per_class (int): the max number of sampled frames containing each class
+        """
+        if max_per_class < 1:
+            raise ValueError("max_per_class must be greater than 0")
+
+        self._max_per_class = max_per_class
+        self._counts: Dict[int, int] = defaultdict(int)
+
+    def sample(self, predictions: List[Prediction], ground_truths: List[AnnotatedBBox], has_errors: bool) -> bool:
+        classes = {pred.cls for pred in predictions} | {gt.cls.value for gt in ground_truths}
+
+        sampled = any(self._counts[cls] < self._max_per_class for cls in classes)
+        if sampled:
+            for cls in classes:
+                self._counts[cls] += 1
+
+        return sampled
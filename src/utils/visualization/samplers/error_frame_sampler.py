@@ -0,0 +1,12 @@
+from typing import List
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.models.prediction import Prediction
+from src.utils.visualization.samplers.visualization_sampler import VisualizationSampler
+
+
+class ErrorFrameSampler(VisualizationSampler):
+    """Samples frames with false positives, false negatives or misclassifications."""
+
+    def sample(self, predictions: List[Prediction], ground_truths: List[AnnotatedBBox], has_errors: bool) -> bool:
+        return has_errors
@@ -0,0 +1,31 @@
+from typing import List
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.models.prediction import Prediction
+from src.utils.visualization.samplers.visualization_sampler import VisualizationSampler
+
+
+class EveryNthFrameSampler(VisualizationSampler):
+    """Samples every nth frame with predictions or ground truths."""
+
+    def __init__(self, n: int = 1):
+        """
+        Initializes an EveryNthFrameSampler instance.
+
+        Args:
+            n (int): the sampling interval, defaults to 1 for every frame
+        """
+        if n < 1:
+            raise ValueError("n must be greater than 0")
+
+        self._n = n
+        self._count = 0
+
+    def sample(self, predictions: List[Prediction], ground_truths: List[AnnotatedBBox], has_errors: bool) -> bool:
+        if not predictions and not ground_truths:
+            return False
+
+        sampled = self._count % self._n == 0
+        self._count += 1
+
+        return sampled
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.models.prediction import Prediction
+
+
+class VisualizationSampler(ABC):
+    """Interface for deciding which evaluated frames to visualize."""
+
+    @abstractmethod
+    def sample(self, predictions: List[Prediction], ground_truths: List[AnnotatedBBox], has_errors: bool) -> bool:
+        """
+        Decides whether to visualize a frame, called once for every evaluated frame in order.
+
+        Args:
+            predictions (List[Prediction]): the predictions for the frame
+            ground_truths (List[AnnotatedBBox]): the ground truths of the frame
+            has_errors (bool): whether the frame has false positives, false negatives or misclassifications
+
+        Returns:
+            bool: True if the frame should be visualized, False otherwise
+        """
+        raise NotImplementedError
@@ -0,0 +1,155 @@
+import os
+import queue
+import threading
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.data.structures.atomic_bool import AtomicBool
+from src.models.prediction import Prediction
+from src.utils.visualization.evaluator_visualizer import EvaluatorVisualizer
+
+# timeout for worker loop iterations, in seconds
+WORKER_LOOP_TIMEOUT = 0.1
+
+
+class VisualizationWriter:
+    """Renders and saves visualizations on a pool of background threads, dropping images when the pool falls behind."""
+
+    def __init__(self, class_names: List[str], n_workers: int = 2, max_pending: int = 64):
+        """
+        Initializes a VisualizationWriter instance.
+
+        Args:
+            class_names (List[str]): the class names in order
+            n_workers (int): the number of writer threads, defaults to 2
+            max_pending (int): the max number of images waiting to be written before new ones are dropped,
+                defaults to 64
+        """
+        if n_workers < 1:
+            raise ValueError("n_workers must be greater than 0")
+
+        if max_pending < 1:
+            raise ValueError("max_pending must be greater than 0")
+
+        self._class_names = class_names
+        self._n_workers = n_workers
+        self._queue: queue.Queue[Tuple[np.ndarray, List[Prediction], List[AnnotatedBBox], str]] = \
+            queue.Queue(maxsize=max_pending)
+
+        self._dirs_lock = threading.Lock()
+        self._created_dirs: Set[str] = set()
+
+        self._counts_lock = threading.Lock()
+        self._n_written = 0
+        self._n_dropped = 0
+
+        self._threads: List[threading.Thread] = []
+        self._run_lock = threading.Lock()
+        self._running = AtomicBool(False)
+
+    def run(self) -> None:
+        """Runs the writer threads."""
+        with self._run_lock:
+            if self._running:
+                raise RuntimeError("VisualizationWriter is already running")
+
+            self._running.set(True)
+            self._threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(self._n_workers)]
+            for thread in self._threads:
+                thread.start()
+
+    def submit(self, image: np.ndarray, predictions: List[Prediction], ground_truths: List[AnnotatedBBox],
+               save_path: str) -> bool:
+        """
+        Submits an image to be visualized and saved without blocking.
+
+        Args:
+            image (np.ndarray): the image to draw on, which must not be modified afterwards
+            predictions (List[Prediction]): the predictions to draw
+            ground_truths (List[AnnotatedBBox]): the ground truths to draw
+            save_path (str): the path to save the image to
+
+        Returns:
+            bool: True if the image was queued, False if it was dropped because too many images are pending
+        """
+        if not self._running:
+            raise RuntimeError("VisualizationWriter is not running")
+
+        try:
+            self._queue.put_nowait((image, predictions, ground_truths, save_path))
+            return True
+        except queue.Full:
+            with self._counts_lock:
+                self._n_dropped += 1
+            return False
+
+    def flush(self) -> None:
+        """Blocks until all queued images have been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Writes the queued images and stops the writer threads."""
+        with self._run_lock:
+            if not self._running:
+                return
+
+            self.flush()
+            self._running.set(False)
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
+
+    def get_n_written(self) -> int:
+        """
+        Returns the number of images written.
+
+        Returns:
+            int: the number of images written
+        """
+        with self._counts_lock:
+            return self._n_written
+
+    def get_n_dropped(self) -> int:
+        """
+        Returns the number of images dropped because too many images were pending.
+
+        Returns:
+            int: the number of images dropped
+        """
+        with self._counts_lock:
+            return self._n_dropped
+
+    def _worker(self) -> None:
+        """Worker function rendering and saving queued images."""
+        while self._running:
+            try:
+                image, predictions, ground_truths, save_path = self._queue.get(timeout=WORKER_LOOP_TIMEOUT)
+            except queue.Empty:
+                continue
+
+            try:
+                self._ensure_dir(os.path.dirname(save_path))
+                EvaluatorVisualizer.save_image(
+                    image=image,
+                    predictions=predictions,
+                    ground_truths=ground_truths,
+                    class_names=self._class_names,
+                    save_path=save_path
+                )
+                with self._counts_lock:
+                    self._n_written += 1
+
+            except Exception as e:
+                print(f"[VisualizationWriter] Failed to save {save_path}: {e}")
+
+            finally:
+                self._queue.task_done()
+
+    def _ensure_dir(self, path: str) -> None:
+        """Creates a directory the first time it is seen."""
+        with self._dirs_lock:
+            if path not in self._created_dirs:
+                os.makedirs(path, exist_ok=True)
+                self._created_dirs.add(path)
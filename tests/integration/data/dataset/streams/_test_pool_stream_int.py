@@ -215,7 +215,7 @@ def test_norsvin_train_stream():
                         break
 
                     img_tensor = sample["img"]
-                    img_np = (img_tensor.permute(1, 2, 0).numpy() * 255).astype(np.uint8).copy()
+                    img_np = img_tensor.permute(1, 2, 0).numpy().copy()
 
                     height, width = img_np.shape[:2]
                     bboxes = sample["instances"]["bboxes"]
@@ -287,7 +287,7 @@ def test_norsvin_train_stream():
                     if saved_count >= max_images:
                         break
 
-                    img_np = (img_tensor.permute(1, 2, 0).cpu().numpy() * 255).astype(np.uint8).copy()
+                    img_np = img_tensor.permute(1, 2, 0).cpu().numpy().copy()
                     height, width = img_np.shape[:2]
                     boxes = target["boxes"]
                     labels = target["labels"]
@@ -363,7 +363,7 @@ def test_norsvin_train_stream():
                     target = targets[j]
                     height, width, _ = img_info[j].tolist()
 
-                    img_np = (img_tensor.permute(1, 2, 0).cpu().numpy() * 255).astype(np.uint8).copy()
+                    img_np = img_tensor.permute(1, 2, 0).cpu().numpy().copy()
 
                     print(f"[Image {saved_count}] Detected {len(target)} boxes")
 
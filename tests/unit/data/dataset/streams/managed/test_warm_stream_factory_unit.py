@@ -0,0 +1,80 @@
+import time
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.data.dataclasses.frame_codec import FrameCodec
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.dataset.streams.managed.factories.manged_stream_factory import ManagedStreamFactory
+from src.data.dataset.streams.managed.factories.warm_stream_factory import WarmStreamFactory
+
+
+def wait_for_warm_streams(factory: WarmStreamFactory, n: int, encoding: Optional[FrameEncoding] = None) -> None:
+    """Waits until the factory has the given number of warm streams."""
+    deadline = time.time() + 2
+    while factory.n_warm_streams(encoding) < n and time.time() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def stream_factory():
+    """Fixture to provide a mock managed stream factory creating a new mock stream per call."""
+    factory = MagicMock(spec=ManagedStreamFactory)
+    factory.create_stream.side_effect = lambda encoding=None, shard=None: MagicMock()
+    return factory
+
+
+@pytest.mark.unit
+def test_create_stream_hands_out_running_stream_and_warms_replacement(stream_factory):
+    """Tests that create_stream() hands out an already running stream and warms a replacement in the background."""
+    # arrange
+    factory = WarmStreamFactory(stream_factory, n_warm=2)
+    factory.run()
+    wait_for_warm_streams(factory, 2)
+
+    # act
+    stream = factory.create_stream()
+    stream.run()
+    wait_for_warm_streams(factory, 2)
+
+    # assert
+    stream._stream.run.assert_called_once()
+    assert factory.n_warm_streams() == 2
+    assert stream_factory.create_stream.call_count == 3
+    factory.stop()
+
+
+@pytest.mark.unit
+def test_create_stream_falls_back_for_encodings_without_warm_streams(stream_factory):
+    """Tests that create_stream() builds a new stream when no warm stream exists for the requested encoding."""
+    # arrange
+    factory = WarmStreamFactory(stream_factory, n_warm=1)
+    factory.run()
+    wait_for_warm_streams(factory, 1)
+    encoding = FrameEncoding(FrameCodec.RAW)
+
+    # act
+    factory.create_stream(encoding=encoding)
+
+    # assert
+    stream_factory.create_stream.assert_called_with(encoding=encoding, shard=None)
+    assert factory.n_warm_streams() == 1
+    factory.stop()
+
+
+@pytest.mark.unit
+def test_stop_stops_warm_streams(stream_factory):
+    """Tests that stop() stops every warm stream that was not handed out."""
+    # arrange
+    factory = WarmStreamFactory(stream_factory, n_warm=1)
+    factory.run()
+    wait_for_warm_streams(factory, 1)
+    warm_stream = factory._warm_streams[None][0]
+
+    # act
+    factory.stop()
+
+    # assert
+    warm_stream._stream.stop.assert_called_once()
+    assert factory.n_warm_streams() == 0
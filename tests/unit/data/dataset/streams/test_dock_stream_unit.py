@@ -131,3 +131,43 @@ def test_release_unblocks_inner_queue(data1):
 
     # assert
     assert span.get() >= sleep_time
+
+
+@pytest.mark.unit
+def test_read_many_reads_across_docks(data1, data2):
+    """Tests that read_many() reads the input data sequentially across docks."""
+    # arrange
+    stream = DockStream[str](buffer_size=2, dock_size=10)
+
+    for data in (data1, data2):
+        entry = stream.get_consumer()
+        for s in data:
+            entry.consume(s)
+
+    # act
+    batch1 = stream.read_many(8)
+    batch2 = stream.read_many(8, timeout=0.1)
+
+    # assert
+    assert batch1 == data1[:-1] + data2[:2]
+    assert batch2 == data2[2:-1]
+
+
+@pytest.mark.unit
+def test_read_many_returns_empty_at_end_of_stream(data1):
+    """Tests that read_many() returns the remaining data, and then an empty list once the stream is closed."""
+    # arrange
+    stream = DockStream[str]()
+
+    entry = stream.get_consumer()
+    for s in data1:
+        entry.consume(s)
+    stream.close()
+
+    # act
+    batch1 = stream.read_many(10)
+    batch2 = stream.read_many(10)
+
+    # assert
+    assert batch1 == data1[:-1]
+    assert batch2 == []
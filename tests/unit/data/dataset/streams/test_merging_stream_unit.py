@@ -0,0 +1,68 @@
+from typing import Optional, List
+
+import pytest
+
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.data.dataset.streams.merging_stream import MergingStream
+
+
+class ListStream(ClosableStream[str]):
+    """Stream reading from a list."""
+
+    def __init__(self, items: List[str], fail: bool = False):
+        self._items = list(items)
+        self._fail = fail
+        self.closed = False
+
+    def read(self) -> Optional[str]:
+        if not self._items:
+            if self._fail:
+                raise RuntimeError("stream failed")
+            return None
+        return self._items.pop(0)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def read_all(stream: MergingStream[str]) -> List[str]:
+    """Reads a stream until it ends."""
+    items = []
+    item = stream.read()
+    while item is not None:
+        items.append(item)
+        item = stream.read()
+    return items
+
+
+@pytest.mark.unit
+def test_read_merges_all_streams_until_every_stream_ends():
+    """Tests that read() returns the instances of every merged stream, and None once all streams have ended."""
+    # arrange
+    streams = [ListStream([f"a{i}" for i in range(20)]), ListStream([f"b{i}" for i in range(5)]), ListStream([])]
+    stream = MergingStream(streams, buffer_size=2)
+
+    # act
+    stream.run()
+    items = read_all(stream)
+    stream.close()
+
+    # assert
+    assert sorted(items) == sorted([f"a{i}" for i in range(20)] + [f"b{i}" for i in range(5)])
+    assert all(s.closed for s in streams)
+
+
+@pytest.mark.unit
+def test_failed_stream_ends_without_stopping_others():
+    """Tests that a failing stream is treated as ended while the other streams keep being merged."""
+    # arrange
+    streams = [ListStream(["a0", "a1"], fail=True), ListStream(["b0", "b1", "b2"])]
+    stream = MergingStream(streams)
+
+    # act
+    stream.run()
+    items = read_all(stream)
+    stream.close()
+
+    # assert
+    assert sorted(items) == ["a0", "a1", "b0", "b1", "b2"]
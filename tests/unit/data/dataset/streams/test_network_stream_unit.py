@@ -49,4 +49,20 @@ def test_read_returns_unexpected_batch_type_raises(client, batch):
 
     # act & assert
     with pytest.raises(RuntimeError):
-        stream.read()
\ No newline at end of file
+        stream.read()
+
+@pytest.mark.unit
+def test_read_many_fetches_batch_in_one_request(client, batch):
+    """Tests that read_many() fetches the whole batch with a single request after opening the stream."""
+    # arrange
+    stream = NetworkStream[str](client=client, split=DatasetSplit.TRAIN, data_type=str)
+
+    # act
+    received = stream.read_many(8, timeout=1.0)
+
+    # assert
+    assert received == batch
+    assert client.send_request.call_count == 2
+    request = client.send_request.call_args.args[0]
+    assert request.batch_size == 8
+    assert request.timeout == 1.0
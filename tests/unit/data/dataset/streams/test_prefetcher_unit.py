@@ -1,9 +1,47 @@
+import random
 import time
+from typing import Optional
 from unittest.mock import MagicMock
 
 import pytest
 
+from src.data.dataset.streams.closable_stream import ClosableStream
 from src.data.dataset.streams.prefetcher import Prefetcher
+from src.data.processing.processor import Processor
+
+
+class CountingStream(ClosableStream[int]):
+    """Stream counting up to a limit."""
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._next = 0
+
+    def read(self) -> Optional[int]:
+        if self._next >= self._limit:
+            return None
+        self._next += 1
+        return self._next - 1
+
+    def close(self) -> None:
+        pass
+
+
+class JitterProcessor(Processor[int, int]):
+    """Processor sleeping for a random short time before passing data through."""
+
+    def process(self, data: int) -> int:
+        time.sleep(random.uniform(0, 0.005))
+        return data
+
+
+class FailingProcessor(Processor[int, int]):
+    """Processor failing on multiples of 7, passing other data through."""
+
+    def process(self, data: int) -> int:
+        if data % 7 == 0:
+            raise ValueError(f"Could not process {data}")
+        return data
 
 
 @pytest.fixture
@@ -79,4 +117,89 @@ def test_prefetching_halts_when_full_queue(stream):
     # assert
     assert stream.read.call_count == 3
 
-    prefetcher.stop()
\ No newline at end of file
+    prefetcher.stop()
+
+@pytest.mark.unit
+def test_fetch_size_reads_many_from_stream():
+    """Tests that the prefetcher fetches with read_many() when the fetch size is greater than one."""
+    # arrange
+    batches = [["a", "b", "c"], ["d"]]
+    stream = MagicMock()
+    stream.read_many.side_effect = lambda n: batches.pop(0) if batches else []
+    prefetcher = Prefetcher[str](stream=stream, buffer_size=10, fetch_size=3)
+
+    # act
+    prefetcher.run()
+    batch = prefetcher.read_many(10)
+    prefetcher.close()
+
+    # assert
+    assert batch == ["a", "b", "c", "d"]
+    stream.read.assert_not_called()
+
+
+@pytest.mark.unit
+def test_ordered_workers_keep_stream_order():
+    """Tests that multiple workers in ordered mode output items in the order they were read from the stream."""
+    # arrange
+    prefetcher = Prefetcher[int](stream=CountingStream(100), buffer_size=8, n_workers=4, processor=JitterProcessor())
+
+    # act
+    prefetcher.run()
+    items = prefetcher.read_many(200)
+    prefetcher.close()
+
+    # assert
+    assert items == list(range(100))
+
+
+@pytest.mark.unit
+def test_unordered_workers_output_every_item():
+    """Tests that multiple workers in unordered mode output every item of the stream exactly once."""
+    # arrange
+    prefetcher = Prefetcher[int](stream=CountingStream(100), buffer_size=8, n_workers=4, ordered=False,
+                                 processor=JitterProcessor())
+
+    # act
+    prefetcher.run()
+    items = prefetcher.read_many(100)
+    prefetcher.close()
+
+    # assert
+    assert sorted(items) == list(range(100))
+
+
+@pytest.mark.unit
+def test_starvation_time_is_recorded_when_buffer_is_empty():
+    """Tests that the time spent waiting on an empty buffer is recorded as starvation time."""
+    # arrange
+    stream = MagicMock()
+    stream.read.side_effect = lambda: time.sleep(0.05) or "item"
+    prefetcher = Prefetcher[str](stream=stream, buffer_size=1)
+
+    # act
+    prefetcher.run()
+    prefetcher.read()
+    prefetcher.close()
+
+    # assert
+    assert prefetcher.get_starvation_time() > 0.02
+    assert prefetcher.get_queue_depth() <= 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("ordered", [True, False])
+def test_items_failing_to_process_are_skipped(ordered):
+    """Tests that items failing to process are skipped without stalling the workers or the order of other items."""
+    # arrange
+    prefetcher = Prefetcher[int](stream=CountingStream(100), buffer_size=4, n_workers=4, ordered=ordered,
+                                 processor=FailingProcessor())
+
+    # act
+    prefetcher.run()
+    items = prefetcher.read_many(200, timeout=5)
+    prefetcher.close()
+
+    # assert
+    expected = [i for i in range(100) if i % 7 != 0]
+    assert (items if ordered else sorted(items)) == expected
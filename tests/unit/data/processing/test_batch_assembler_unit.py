@@ -0,0 +1,130 @@
+import zlib
+
+import numpy as np
+import pytest
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.bbox import BBox
+from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
+from src.data.dataclasses.source_metadata import SourceMetadata
+from src.data.processing.batch_assembler import BatchAssembler
+from tests.utils.dummy_annotation_label import DummyAnnotationLabel
+from tests.utils.generators.dummy_frame_generator import DummyFrameGenerator
+
+
+@pytest.fixture
+def source():
+    """Fixture to provide source metadata."""
+    return SourceMetadata(source_id="video", frame_resolution=(40, 20))
+
+
+@pytest.fixture
+def frames(source):
+    """Fixture to provide a list of annotated frames with varying number of annotations."""
+    return [
+        AnnotatedFrame(
+            source=source,
+            index=0,
+            frame=DummyFrameGenerator.generate(40, 20),
+            annotations=[
+                AnnotatedBBox(cls=DummyAnnotationLabel.DEBUGGING, bbox=BBox(0.25, 0.5, 0.5, 0.25)),
+                AnnotatedBBox(cls=DummyAnnotationLabel.CODING, bbox=BBox(0.0, 0.0, 0.1, 0.1))
+            ]
+        ),
+        AnnotatedFrame(source=source, index=1, frame=DummyFrameGenerator.generate(40, 20), annotations=[])
+    ]
+
+
+@pytest.mark.unit
+def test_images_are_packed_into_contiguous_nchw_array(frames):
+    """Tests that the images of the batch are packed into a single contiguous uint8 NCHW array."""
+    # arrange
+    assembler = BatchAssembler()
+
+    # act
+    batch = assembler.process(frames)
+
+    # assert
+    assert batch.images.shape == (2, 3, 20, 40)
+    assert batch.images.dtype == np.uint8
+    assert batch.images.flags["C_CONTIGUOUS"]
+    for i, frame in enumerate(frames):
+        np.testing.assert_array_equal(batch.images[i], frame.frame.transpose(2, 0, 1))
+
+
+@pytest.mark.unit
+def test_targets_are_denormalized_and_padded(frames):
+    """Tests that the targets are converted to pixel [cls, cx, cy, w, h] rows and padded with -1."""
+    # arrange
+    assembler = BatchAssembler()
+
+    # act
+    batch = assembler.process(frames)
+
+    # assert
+    assert batch.targets.shape == (2, 2, 5)
+    np.testing.assert_allclose(batch.targets[0, 0], [1, 20.0, 12.5, 20.0, 5.0])
+    np.testing.assert_allclose(batch.targets[0, 1], [0, 2.0, 1.0, 4.0, 2.0])
+    assert np.all(batch.targets[1] == -1.0)
+
+
+@pytest.mark.unit
+def test_compressed_frames_are_decompressed_into_batch(frames):
+    """Tests that compressed frames are decompressed straight into the batch."""
+    # arrange
+    assembler = BatchAssembler()
+    compressed = [
+        CompressedAnnotatedFrame(
+            source=f.source,
+            index=f.index,
+            frame=zlib.compress(f.frame),
+            shape=f.frame.shape,
+            dtype=str(f.frame.dtype),
+            annotations=f.annotations
+        )
+        for f in frames
+    ]
+
+    # act
+    batch = assembler.process(compressed)
+
+    # assert
+    np.testing.assert_array_equal(batch.images, assembler.process(frames).images)
+
+
+@pytest.mark.unit
+def test_mismatching_frame_shapes_raises(frames, source):
+    """Tests that assembling frames of different shapes raises."""
+    # arrange
+    assembler = BatchAssembler()
+    frames.append(AnnotatedFrame(source=source, index=2, frame=DummyFrameGenerator.generate(10, 10), annotations=[]))
+
+    # act & assert
+    with pytest.raises(ValueError):
+        assembler.process(frames)
+
+
+@pytest.mark.unit
+def test_parallel_decoding_matches_serial_decoding(frames):
+    """Tests that decoding frames on multiple threads assembles the same batch as decoding them serially."""
+    # arrange
+    assembler = BatchAssembler(n_workers=4)
+    compressed = [
+        CompressedAnnotatedFrame(
+            source=f.source,
+            index=f.index,
+            frame=zlib.compress(f.frame),
+            shape=f.frame.shape,
+            dtype=str(f.frame.dtype),
+            annotations=f.annotations
+        )
+        for f in frames * 8
+    ]
+
+    # act
+    batch = assembler.process(compressed)
+    assembler.close()
+
+    # assert
+    np.testing.assert_array_equal(batch.images, BatchAssembler().process(frames * 8).images)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.compressed_annotated_frame import CompressedAnnotatedFrame
+from src.data.dataclasses.frame_codec import FrameCodec
+from src.data.dataclasses.frame_encoding import FrameEncoding
+from src.data.dataclasses.source_metadata import SourceMetadata
+from src.data.processing.frame_decoder import FrameDecoder
+from src.data.processing.frame_encoder import FrameEncoder
+from tests.utils.generators.dummy_frame_generator import DummyFrameGenerator
+
+
+@pytest.fixture
+def source():
+    """Fixture to provide source metadata."""
+    return SourceMetadata(source_id="video", frame_resolution=(64, 32))
+
+
+@pytest.fixture
+def frame(source):
+    """Fixture to provide an annotated frame with a smooth gradient image."""
+    gradient = np.linspace(0, 255, 64, dtype=np.uint8)
+    image = np.ascontiguousarray(np.broadcast_to(gradient[None, :, None], (32, 64, 3)))
+    return AnnotatedFrame(source=source, index=3, frame=image, annotations=[])
+
+
+@pytest.mark.unit
+def test_raw_encoding_passes_frame_through(frame):
+    """Tests that the raw codec returns the frame untouched, skipping compression entirely."""
+    # arrange
+    encoder = FrameEncoder(FrameEncoding(FrameCodec.RAW))
+
+    # act
+    encoded = encoder.process(frame)
+
+    # assert
+    assert encoded is frame
+
+
+@pytest.mark.unit
+def test_zlib_encoding_is_lossless(source):
+    """Tests that frames encoded with zlib at a chosen level are restored exactly by the decoder."""
+    # arrange
+    frame = AnnotatedFrame(source=source, index=0, frame=DummyFrameGenerator.generate(64, 32), annotations=[])
+    encoder = FrameEncoder(FrameEncoding(FrameCodec.ZLIB, level=1))
+    decoder = FrameDecoder()
+
+    # act
+    encoded = encoder.process(frame)
+    decoded = decoder.process(encoded)
+
+    # assert
+    assert isinstance(encoded, CompressedAnnotatedFrame)
+    assert encoded.codec == FrameCodec.ZLIB
+    np.testing.assert_array_equal(decoded.frame, frame.frame)
+    assert decoded.index == frame.index
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("codec", [FrameCodec.JPEG, FrameCodec.WEBP])
+def test_lossy_encoding_restores_approximate_frame(frame, codec):
+    """Tests that frames encoded with a lossy codec are decoded to the original shape with small error."""
+    # arrange
+    encoder = FrameEncoder(FrameEncoding(codec, level=95))
+    decoder = FrameDecoder()
+
+    # act
+    encoded = encoder.process(frame)
+    decoded = decoder.process(encoded)
+
+    # assert
+    assert encoded.codec == codec
+    assert decoded.frame.shape == frame.frame.shape
+    assert np.abs(decoded.frame.astype(np.int16) - frame.frame.astype(np.int16)).mean() < 4
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("codec, level", [(FrameCodec.ZLIB, 10), (FrameCodec.JPEG, 101), (FrameCodec.RAW, 1)])
+def test_invalid_level_raises(codec, level):
+    """Tests that an encoding with a level outside the range of its codec raises a ValueError."""
+    # act & assert
+    with pytest.raises(ValueError):
+        FrameEncoding(codec, level=level)
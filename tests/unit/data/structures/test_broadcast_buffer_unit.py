@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+import time
+
+from src.data.structures.broadcast_buffer import BroadcastBuffer
+
+
+@pytest.fixture
+def data():
+    """Fixture to provide test data."""
+    return [f"string{i}" for i in range(100)]
+
+
+@pytest.mark.unit
+def test_every_reader_sees_every_item_in_order(data):
+    """Tests that each subscribed reader reads every written item in order through its own cursor."""
+    # arrange
+    buffer = BroadcastBuffer[str](lag_window=len(data))
+    cursors = [buffer.subscribe() for _ in range(3)]
+    for s in data:
+        buffer.write(s)
+    buffer.close()
+
+    # act
+    results = [[buffer.read(c) for _ in range(len(data) + 1)] for c in cursors]
+
+    # assert
+    for result in results:
+        assert result == data + [None]
+
+
+@pytest.mark.unit
+def test_write_blocks_when_slowest_reader_lags_a_full_window(data):
+    """Tests that writing blocks while the slowest reader is a full lag window behind, and resumes when it reads."""
+    # arrange
+    buffer = BroadcastBuffer[str](lag_window=10)
+    slow = buffer.subscribe()
+    for s in data[:10]:
+        buffer.write(s)
+
+    written = threading.Event()
+    t = threading.Thread(target=lambda: (buffer.write(data[10]), written.set()))
+
+    # act
+    t.start()
+    time.sleep(0.1)
+    blocked = not written.is_set()
+    first = buffer.read(slow)
+    t.join(timeout=1)
+
+    # assert
+    assert blocked
+    assert first == data[0]
+    assert written.is_set()
+
+
+@pytest.mark.unit
+def test_unsubscribing_slow_reader_releases_writer(data):
+    """Tests that unsubscribing the slowest reader lets the writer evict items it was holding back."""
+    # arrange
+    buffer = BroadcastBuffer[str](lag_window=10)
+    slow = buffer.subscribe()
+    fast = buffer.subscribe()
+    for s in data[:10]:
+        buffer.write(s)
+    for _ in range(10):
+        buffer.read(fast)
+
+    # act
+    buffer.unsubscribe(slow)
+    written = buffer.write(data[10])
+
+    # assert
+    assert written
+    assert buffer.read(fast) == data[10]
+    assert not buffer.is_pristine()
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from src.data.structures.growable_array import GrowableArray
+
+
+@pytest.mark.unit
+def test_extend_grows_beyond_capacity_and_keeps_rows():
+    """Tests that extending past the capacity grows the array without losing earlier rows."""
+    # arrange
+    array = GrowableArray(row_shape=(2,), dtype=np.int64, capacity=2)
+    rows = np.arange(14).reshape(7, 2)
+
+    # act
+    array.extend(rows[:3])
+    array.extend(rows[3:])
+
+    # assert
+    assert len(array) == 7
+    np.testing.assert_array_equal(array.view(), rows)
+
+
+@pytest.mark.unit
+def test_clear_empties_array():
+    """Tests that clearing the array removes all rows."""
+    # arrange
+    array = GrowableArray()
+    array.extend(np.ones(5))
+
+    # act
+    array.clear()
+
+    # assert
+    assert len(array) == 0
+    assert array.view().shape == (0,)
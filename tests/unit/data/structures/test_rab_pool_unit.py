@@ -208,3 +208,37 @@ def test_thread_safety(data):
     # assert
     assert instances.qsize() == len(data)
     assert sorted(list(instances.queue)) == sorted(data)
+
+
+@pytest.mark.unit
+def test_get_many_returns_distinct_items():
+    """Tests that get_many() returns the requested number of distinct items from the pool."""
+    # arrange
+    pool = RABPool[int](maxsize=100)
+    for i in range(50):
+        pool.put(i)
+
+    # act
+    items = pool.get_many(20)
+
+    # assert
+    assert len(items) == 20
+    assert len(set(items)) == 20
+    assert len(pool) == 30
+
+
+@pytest.mark.unit
+def test_get_many_returns_partial_batch_on_timeout():
+    """Tests that get_many() returns the items ready when the timeout expires."""
+    # arrange
+    pool = RABPool[int](maxsize=100, min_ready=2)
+    for i in range(5):
+        pool.put(i)
+
+    # act
+    items = pool.get_many(10, timeout=0.2)
+
+    # assert
+    assert len(items) == 4
+    assert len(set(items)) == 4
+    assert len(pool) == 1
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+import torch
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.bbox import BBox
+from src.data.dataclasses.source_metadata import SourceMetadata
+from src.models.converters.batch_packer import BatchPacker
+from tests.utils.dummy_annotation_label import DummyAnnotationLabel
+from tests.utils.generators.dummy_frame_generator import DummyFrameGenerator
+
+
+@pytest.fixture
+def frames():
+    """Fixture to provide a list of annotated frames with varying number of annotations."""
+    source = SourceMetadata(source_id="video", frame_resolution=(40, 20))
+    return [
+        AnnotatedFrame(
+            source=source,
+            index=0,
+            frame=DummyFrameGenerator.generate(40, 20),
+            annotations=[
+                AnnotatedBBox(cls=DummyAnnotationLabel.DEBUGGING, bbox=BBox(0.2, 0.4, 0.4, 0.2)),
+                AnnotatedBBox(cls=DummyAnnotationLabel.CODING, bbox=BBox(0.0, 0.0, 0.0, 0.1))
+            ]
+        ),
+        AnnotatedFrame(source=source, index=1, frame=DummyFrameGenerator.generate(40, 20), annotations=[]),
+        AnnotatedFrame(
+            source=source,
+            index=2,
+            frame=DummyFrameGenerator.generate(40, 20),
+            annotations=[AnnotatedBBox(cls=DummyAnnotationLabel.CODING, bbox=BBox(0.5, 0.5, 0.2, 0.2))]
+        )
+    ]
+
+
+@pytest.mark.unit
+def test_images_are_packed_into_one_uint8_nchw_tensor(frames):
+    """Tests that the images of a batch are packed into one uint8 NCHW tensor."""
+    # act
+    images = BatchPacker.pack_images(frames)
+
+    # assert
+    assert images.shape == (3, 3, 20, 40)
+    assert images.dtype == torch.uint8
+    for i, frame in enumerate(frames):
+        np.testing.assert_array_equal(images[i].numpy(), frame.frame.transpose(2, 0, 1))
+
+
+@pytest.mark.unit
+def test_boxes_are_packed_with_offsets_and_padded(frames):
+    """Tests that the boxes of a batch are packed into [cls, cx, cy, w, h] rows with per-frame offsets."""
+    # act
+    boxes, offsets = BatchPacker.pack_boxes(frames)
+    padded = BatchPacker.pad_boxes(boxes, offsets)
+
+    # assert
+    np.testing.assert_array_equal(offsets, [0, 2, 2, 3])
+    np.testing.assert_allclose(boxes, [[1, 0.4, 0.5, 0.4, 0.2], [0, 0.0, 0.05, 0.0, 0.1], [0, 0.6, 0.6, 0.2, 0.2]],
+                               rtol=1e-6)
+    assert padded.shape == (3, 2, 5)
+    np.testing.assert_array_equal(padded[0], boxes[:2])
+    assert (padded[1] == -1).all()
+    np.testing.assert_array_equal(padded[2, 0], boxes[2])
+    assert (padded[2, 1] == -1).all()
+
+
+@pytest.mark.unit
+def test_filtering_boxes_updates_offsets(frames):
+    """Tests that filtering packed boxes keeps the offsets of each frame consistent."""
+    # arrange
+    boxes, offsets = BatchPacker.pack_boxes(frames)
+
+    # act
+    kept, kept_offsets = BatchPacker.filter_boxes(boxes, offsets, boxes[:, 3] > 0)
+
+    # assert
+    np.testing.assert_array_equal(kept_offsets, [0, 1, 1, 2])
+    np.testing.assert_array_equal(kept, boxes[[0, 2]])
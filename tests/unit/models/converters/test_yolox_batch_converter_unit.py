@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+import torch
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.bbox import BBox
+from src.data.dataclasses.source_metadata import SourceMetadata
+from src.models.converters.yolox_batch_converter import YOLOXBatchConverter
+from tests.utils.dummy_annotation_label import DummyAnnotationLabel
+from tests.utils.generators.dummy_frame_generator import DummyFrameGenerator
+
+
+@pytest.mark.unit
+def test_convert_gives_uint8_images_and_padded_targets():
+    """Tests that converting a batch gives uint8 images, padded targets, image info and image ids."""
+    # arrange
+    source = SourceMetadata(source_id="video", frame_resolution=(40, 20))
+    frames = [
+        AnnotatedFrame(source=source, index=0, frame=DummyFrameGenerator.generate(40, 20), annotations=[]),
+        AnnotatedFrame(
+            source=source,
+            index=1,
+            frame=DummyFrameGenerator.generate(40, 20),
+            annotations=[AnnotatedBBox(cls=DummyAnnotationLabel.DEBUGGING, bbox=BBox(10, 4, 20, 8))]
+        )
+    ]
+
+    # act
+    images, targets, img_info, img_ids = YOLOXBatchConverter.convert(frames)
+
+    # assert
+    assert images.dtype == torch.uint8
+    assert images.shape == (2, 3, 20, 40)
+    assert targets.shape == (2, 1, 5)
+    assert (targets[0] == -1).all()
+    np.testing.assert_allclose(targets[1, 0].numpy(), [1, 20, 8, 20, 8])
+    assert img_info.tolist() == [[20, 40, 1.0], [20, 40, 1.0]]
+    assert img_ids.tolist() == [0, 1]
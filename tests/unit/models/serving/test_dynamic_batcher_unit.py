@@ -0,0 +1,82 @@
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.models.prediction import Prediction
+from src.models.serving.dynamic_batcher import DynamicBatcher
+
+
+def predict_fn(images):
+    """Batch prediction function returning one prediction holding the image value per image."""
+    return [[Prediction(x1=0, y1=0, x2=1, y2=1, conf=1.0, cls=int(image[0, 0, 0]))] for image in images]
+
+
+@pytest.fixture
+def images():
+    """Fixture to provide a list of images with distinct values."""
+    return [np.full((4, 4, 3), i, dtype=np.uint8) for i in range(16)]
+
+
+@pytest.mark.unit
+def test_concurrent_requests_are_coalesced_into_batches(images):
+    """Tests that requests submitted concurrently are coalesced into batches bounded by the max batch size."""
+    # arrange
+    fn = MagicMock(side_effect=predict_fn)
+    batcher = DynamicBatcher(predict_fn=fn, max_batch_size=8, max_queue_delay=0.5)
+    barrier = threading.Barrier(len(images))
+    results = [None] * len(images)
+
+    def request(i):
+        barrier.wait()
+        results[i] = batcher.predict(images[i])
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(len(images))]
+
+    # act
+    batcher.run()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.stop()
+
+    # assert
+    assert [r[0].cls for r in results] == list(range(len(images)))
+    assert all(len(call.args[0]) <= 8 for call in fn.call_args_list)
+    assert fn.call_count < len(images)
+    assert batcher.get_batch_size_histogram().count() == fn.call_count
+    assert batcher.get_latency_histogram().count() == len(images)
+
+
+@pytest.mark.unit
+def test_single_request_runs_after_max_queue_delay(images):
+    """Tests that a lone request is run as a batch of one once the max queue delay has passed."""
+    # arrange
+    batcher = DynamicBatcher(predict_fn=predict_fn, max_batch_size=8, max_queue_delay=0.01)
+
+    # act
+    batcher.run()
+    predictions = batcher.predict(images[3], timeout=2.0)
+    batcher.stop()
+
+    # assert
+    assert predictions[0].cls == 3
+    assert batcher.get_batch_size_histogram().get_counts()[0] == 1
+
+
+@pytest.mark.unit
+def test_failing_prediction_fails_every_request_in_batch(images):
+    """Tests that an error from the prediction function is raised for the requests of the batch."""
+    # arrange
+    batcher = DynamicBatcher(predict_fn=MagicMock(side_effect=RuntimeError("model failed")), max_queue_delay=0.0)
+
+    # act
+    batcher.run()
+    future = batcher.submit(images[0])
+
+    # assert
+    with pytest.raises(RuntimeError, match="model failed"):
+        future.result(timeout=2.0)
+    batcher.stop()
@@ -0,0 +1,45 @@
+import os
+
+import pytest
+import torch
+
+from src.models.checkpoint_writer import CheckpointWriter
+
+
+@pytest.fixture
+def writer(tmp_path):
+    """Fixture to provide a running CheckpointWriter keeping the last two checkpoints."""
+    checkpoint_writer = CheckpointWriter(output_dir=str(tmp_path), keep_last=2)
+    checkpoint_writer.run()
+    yield checkpoint_writer
+    checkpoint_writer.close()
+
+
+@pytest.mark.unit
+def test_submit_snapshots_state_before_it_changes(tmp_path, writer):
+    """Tests that a checkpoint holds the state at the time it was submitted, even if it changes afterwards."""
+    # arrange
+    weights = torch.zeros(3)
+
+    # act
+    writer.submit({"epoch": 1, "model_state_dict": {"weights": weights}}, "epoch1.pth")
+    weights += 1
+    writer.flush()
+
+    # assert
+    ckpt = torch.load(os.path.join(tmp_path, "epoch1.pth"))
+    assert ckpt["epoch"] == 1
+    assert torch.equal(ckpt["model_state_dict"]["weights"], torch.zeros(3))
+
+
+@pytest.mark.unit
+def test_keeps_last_checkpoints_and_links_latest(tmp_path, writer):
+    """Tests that only the most recent checkpoints are kept, and the latest one is available as last_ckpt.pth."""
+    # act
+    for epoch in range(1, 5):
+        writer.submit({"epoch": epoch}, f"epoch{epoch}.pth")
+    writer.flush()
+
+    # assert
+    assert sorted(os.listdir(tmp_path)) == ["epoch3.pth", "epoch4.pth", "last_ckpt.pth"]
+    assert torch.load(os.path.join(tmp_path, "last_ckpt.pth"))["epoch"] == 4
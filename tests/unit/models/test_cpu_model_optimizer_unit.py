@@ -0,0 +1,62 @@
+import pytest
+import torch
+
+from src.models.cpu_model_optimizer import CPUModelOptimizer
+from src.models.cpu_optimization_config import CPUOptimizationConfig
+from src.models.optimized_module import OptimizedModule
+
+
+class DummyModel(torch.nn.Module):
+    """Dummy model with a convolution and a linear layer."""
+
+    def __init__(self):
+        super().__init__()
+        self.conv = torch.nn.Conv2d(3, 4, kernel_size=3, padding=1)
+        self.fc = torch.nn.Linear(4, 2)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self.fc(self.conv(x).mean(dim=(2, 3)))
+
+
+@pytest.fixture
+def model():
+    """Fixture to provide a dummy model in eval mode."""
+    torch.manual_seed(0)
+    return DummyModel().eval()
+
+
+@pytest.mark.unit
+def test_optimized_copy_matches_eager_model(model):
+    """Tests that the optimized copy of a model gives nearly the same outputs and leaves the model unchanged."""
+    # arrange
+    x = torch.rand(2, 3, 16, 16)
+    expected = model(x)
+
+    # act
+    optimized = CPUModelOptimizer.optimize(model, CPUOptimizationConfig())
+    with torch.inference_mode():
+        actual = optimized(x)
+
+    # assert
+    assert isinstance(optimized, OptimizedModule)
+    assert isinstance(model.fc, torch.nn.Linear)
+    torch.testing.assert_close(actual, expected.detach(), atol=0.05, rtol=0.05)
+
+
+@pytest.mark.unit
+def test_module_is_traced_once_per_input_shape(model, monkeypatch):
+    """Tests that the optimized module traces the wrapped module once for each input shape."""
+    # arrange
+    optimized = OptimizedModule(model)
+    traced_shapes = []
+    trace = torch.jit.trace
+    monkeypatch.setattr(torch.jit, "trace", lambda module, x, **kwargs: traced_shapes.append(x.shape) or
+                        trace(module, x, **kwargs))
+
+    # act
+    with torch.inference_mode():
+        for shape in [(1, 3, 8, 8), (1, 3, 8, 8), (2, 3, 8, 8), (1, 3, 8, 8)]:
+            optimized(torch.rand(shape))
+
+    # assert
+    assert traced_shapes == [(1, 3, 8, 8), (2, 3, 8, 8)]
@@ -0,0 +1,57 @@
+import pytest
+import torch
+
+from src.models.device_prefetcher import DevicePrefetcher
+
+
+def failing_loader():
+    """Loader yielding a single batch before failing."""
+    yield torch.zeros(2)
+    raise RuntimeError("loader failed")
+
+
+@pytest.mark.unit
+def test_yields_all_batches_in_order():
+    """Tests that the prefetcher yields every batch of the loader in order, with its structure kept."""
+    # arrange
+    loader = [((torch.full((3,), i),), [{"labels": torch.tensor([i])}]) for i in range(5)]
+    prefetcher = DevicePrefetcher(loader, device=torch.device("cpu"))
+
+    # act
+    batches = list(prefetcher)
+
+    # assert
+    assert len(batches) == 5
+    for i, (images, targets) in enumerate(batches):
+        assert isinstance(images, tuple)
+        assert torch.equal(images[0], torch.full((3,), i))
+        assert targets[0]["labels"].item() == i
+
+
+@pytest.mark.unit
+def test_raises_errors_of_loader():
+    """Tests that an error raised by the loader is raised to the consumer after the batches before it."""
+    # arrange
+    prefetcher = DevicePrefetcher(failing_loader(), device=torch.device("cpu"))
+    batches = []
+
+    # act & assert
+    with pytest.raises(RuntimeError):
+        for batch in prefetcher:
+            batches.append(batch)
+
+    assert len(batches) == 1
+
+
+@pytest.mark.unit
+def test_stopping_early_does_not_block():
+    """Tests that the consumer can stop iterating before the loader is exhausted."""
+    # arrange
+    loader = [torch.tensor([i]) for i in range(100)]
+    prefetcher = DevicePrefetcher(loader, device=torch.device("cpu"), depth=1)
+
+    # act
+    first = next(iter(prefetcher))
+
+    # assert
+    assert first.item() == 0
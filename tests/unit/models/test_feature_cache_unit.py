@@ -0,0 +1,50 @@
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+import torch
+
+from src.models.feature_cache import FeatureCache
+
+
+@pytest.fixture
+def features():
+    """Fixture to provide the feature maps of a frame."""
+    return OrderedDict([("0", torch.rand(4, 8, 8)), ("pool", torch.rand(4, 2, 2))])
+
+
+@pytest.mark.unit
+def test_cached_features_survive_reopening(tmp_path, features):
+    """Tests that flushed features are read back from a reopened cache."""
+    # arrange
+    cache = FeatureCache(str(tmp_path))
+    cache.put("video/0", features, image_size=(30, 32), padded_size=(32, 32))
+    cache.close()
+
+    # act
+    cached = FeatureCache(str(tmp_path)).get("video/0")
+
+    # assert
+    assert list(cached.features) == ["0", "pool"]
+    for name, level in features.items():
+        np.testing.assert_allclose(cached.features[name], level.numpy(), atol=1e-3)
+    assert cached.image_size == (30, 32)
+    assert cached.padded_size == (32, 32)
+
+
+@pytest.mark.unit
+def test_frames_beyond_max_bytes_are_not_cached(tmp_path, features):
+    """Tests that frames which would exceed the max size of the cache are not cached."""
+    # arrange
+    frame_bytes = sum(level.numel() for level in features.values()) * 2
+    cache = FeatureCache(str(tmp_path), max_bytes=frame_bytes)
+
+    # act
+    first = cache.put("video/0", features, image_size=(32, 32), padded_size=(32, 32))
+    second = cache.put("video/1", features, image_size=(32, 32), padded_size=(32, 32))
+
+    # assert
+    assert first and not second
+    assert "video/0" in cache
+    assert cache.get("video/1") is None
+    cache.close()
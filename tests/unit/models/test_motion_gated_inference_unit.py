@@ -0,0 +1,79 @@
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from src.data.dataclasses.frame import Frame
+from src.data.dataclasses.source_metadata import SourceMetadata
+from src.data.pipeline.consumer import Consumer
+from src.models.gated_prediction import GatedPrediction
+from src.models.motion_gated_inference import MotionGatedInference
+from src.models.prediction import Prediction
+from src.models.predictor import Predictor
+
+
+class CountingPredictor(Predictor):
+    """Dummy predictor predicting a single box, labelled with the number of calls so far."""
+
+    def __init__(self):
+        self.n_calls = 0
+
+    def predict(self, image: np.ndarray) -> List[Prediction]:
+        self.n_calls += 1
+        return [Prediction(x1=0, y1=0, x2=1, y2=1, conf=1.0, cls=self.n_calls)]
+
+
+class CollectingConsumer(Consumer[GatedPrediction]):
+    """Dummy consumer collecting everything it consumes."""
+
+    def __init__(self):
+        self.items = []
+
+    def consume(self, data: Optional[GatedPrediction]) -> bool:
+        self.items.append(data)
+        return True
+
+
+def make_frame(index: int, value: int, source_id: str = "video") -> Frame:
+    """Creates a frame of uniform pixel value."""
+    return Frame(SourceMetadata(source_id, (32, 16)), index, np.full((16, 32, 3), value, dtype=np.uint8))
+
+
+@pytest.mark.unit
+def test_predictions_are_propagated_until_motion():
+    """Tests that the predictor only runs on frames that differ from the last inferred frame."""
+    # arrange
+    predictor = CountingPredictor()
+    consumer = CollectingConsumer()
+    gate = MotionGatedInference(predictor, consumer, motion_thresh=0.1, max_staleness=100)
+    values = [0, 5, 10, 100, 105, 0]
+
+    # act
+    for i, value in enumerate(values):
+        gate.consume(make_frame(i, value))
+    gate.consume(None)
+
+    # assert
+    assert [item.inferred for item in consumer.items[:-1]] == [True, False, False, True, False, True]
+    assert [item.predictions[0].cls for item in consumer.items[:-1]] == [1, 1, 1, 2, 2, 3]
+    assert consumer.items[-1] is None
+    assert gate.get_inference_rate() == pytest.approx(3 / 6)
+
+
+@pytest.mark.unit
+def test_predictor_runs_at_max_staleness_and_on_new_sources():
+    """Tests that the predictor runs after max_staleness propagated frames and on the first frame of each source."""
+    # arrange
+    predictor = CountingPredictor()
+    consumer = CollectingConsumer()
+    gate = MotionGatedInference(predictor, consumer, motion_thresh=0.1, max_staleness=2)
+    frames = [make_frame(i, 0) for i in range(5)] + [make_frame(0, 0, source_id="other")]
+
+    # act
+    for frame in frames:
+        gate.consume(frame)
+
+    # assert
+    assert [item.inferred for item in consumer.items] == [True, False, False, True, False, True]
+    assert gate.get_n_frames() == 6
+    assert gate.get_n_inferences() == 3
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from src.models.prediction_filter import PredictionFilter
+
+
+@pytest.mark.unit
+def test_filter_drops_low_confidence_predictions():
+    """Tests that predictions below the confidence threshold are dropped."""
+    # arrange
+    preds = np.array([[0, 0, 10, 10, 0, 0.2], [20, 20, 30, 30, 1, 0.8]])
+    prediction_filter = PredictionFilter(conf_thresh=0.5)
+
+    # act
+    keep = prediction_filter.filter(preds)
+
+    # assert
+    np.testing.assert_array_equal(keep, [1])
+
+
+@pytest.mark.unit
+def test_filter_suppresses_overlaps_per_class():
+    """Tests that nms suppresses overlapping predictions of the same class only."""
+    # arrange
+    preds = np.array([
+        [0, 0, 10, 10, 0, 0.6],
+        [0, 0, 10, 11, 0, 0.9],
+        [0, 0, 10, 10, 1, 0.7]
+    ])
+    prediction_filter = PredictionFilter(nms_iou=0.5)
+
+    # act
+    keep = prediction_filter.filter(preds)
+
+    # assert
+    np.testing.assert_array_equal(keep, [1, 2])
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from src.models.prediction_store import PredictionStore
+from src.models.prediction_store_writer import PredictionStoreWriter
+
+
+@pytest.fixture
+def frames():
+    """Fixture to provide predictions and ground truths for three frames, the second without any boxes."""
+    preds = [
+        np.array([[0, 0, 10, 10, 1, 0.9], [5, 5, 20, 20, 0, 0.3]], dtype=np.float32),
+        np.zeros((0, 6), dtype=np.float32),
+        np.array([[1, 2, 3, 4, 2, 0.5]], dtype=np.float32)
+    ]
+    gts = [
+        np.array([[0, 0, 10, 10, 1]], dtype=np.float32),
+        np.zeros((0, 5), dtype=np.float32),
+        np.array([[1, 2, 3, 4, 2], [6, 6, 9, 9, 0]], dtype=np.float32)
+    ]
+    return preds, gts
+
+
+@pytest.mark.unit
+def test_written_store_returns_frames_by_position(tmp_path, frames):
+    """Tests that a written store returns the predictions, ground truths and key of each frame."""
+    # arrange
+    preds, gts = frames
+    writer = PredictionStoreWriter(path=str(tmp_path / "store"), classes=["a", "b", "c"])
+
+    # act
+    writer.append(["video_1", "video_1"], [3, 4], preds[:2], gts[:2])
+    writer.append(["video_2"], [0], preds[2:], gts[2:])
+    writer.close()
+    store = PredictionStore(str(tmp_path / "store"))
+
+    # assert
+    assert len(store) == 3
+    assert store.get_classes() == ["a", "b", "c"]
+    assert store.get_frame_key(2) == ("video_2", 0)
+    for i in range(3):
+        frame_preds, frame_gts = store.get_frame(i)
+        np.testing.assert_array_equal(frame_preds, preds[i])
+        np.testing.assert_array_equal(frame_gts, gts[i])
+
+
+@pytest.mark.unit
+def test_iter_batches_splits_frames(tmp_path, frames):
+    """Tests that iterating over batches yields every frame once, in order."""
+    # arrange
+    preds, gts = frames
+    writer = PredictionStoreWriter(path=str(tmp_path / "store"), classes=["a", "b", "c"])
+    writer.append(["video_1"] * 3, [0, 1, 2], preds, gts)
+    store = writer.close()
+
+    # act
+    batches = list(store.iter_batches(batch_size=2))
+
+    # assert
+    assert [len(batch_preds) for batch_preds, _ in batches] == [2, 1]
+    all_preds = [p for batch_preds, _ in batches for p in batch_preds]
+    all_gts = [g for _, batch_gts in batches for g in batch_gts]
+    for i in range(3):
+        np.testing.assert_array_equal(all_preds[i], preds[i])
+        np.testing.assert_array_equal(all_gts[i], gts[i])
+
+
+@pytest.mark.unit
+def test_close_replaces_existing_store(tmp_path, frames):
+    """Tests that closing a writer replaces a store previously written to the same path."""
+    # arrange
+    preds, gts = frames
+    path = str(tmp_path / "store")
+    first = PredictionStoreWriter(path=path, classes=["a", "b", "c"])
+    first.append(["video_1"] * 3, [0, 1, 2], preds, gts)
+    first.close()
+    second = PredictionStoreWriter(path=path, classes=["a", "b", "c"])
+    second.append(["video_2"], [7], preds[:1], gts[:1])
+
+    # act
+    store = second.close()
+
+    # assert
+    assert len(store) == 1
+    assert store.get_frame_key(0) == ("video_2", 7)
+    assert not (tmp_path / "store.tmp").exists()
@@ -0,0 +1,55 @@
+from typing import List
+
+import numpy as np
+import pytest
+
+from src.models.prediction import Prediction
+from src.models.predictor import Predictor
+from src.models.process_predictor import ProcessPredictor
+
+
+class ShapePredictor(Predictor):
+    """Dummy predictor predicting a box covering the whole image."""
+
+    def predict(self, image: np.ndarray) -> List[Prediction]:
+        if image.size == 0:
+            raise ValueError("Got empty image")
+
+        return [Prediction(x1=0, y1=0, x2=image.shape[1], y2=image.shape[0], conf=1.0, cls=0)]
+
+
+def create_shape_predictor() -> Predictor:
+    """Creates a ShapePredictor, picklable for the worker process."""
+    return ShapePredictor()
+
+
+@pytest.fixture
+def predictor():
+    """Fixture to provide a running ProcessPredictor."""
+    process_predictor = ProcessPredictor(create_shape_predictor)
+    process_predictor.run()
+    yield process_predictor
+    process_predictor.close()
+
+
+@pytest.mark.unit
+def test_predict_batch_returns_predictions_from_worker(predictor):
+    """Tests that batch predictions are made by the predictor in the worker process."""
+    # arrange
+    images = [np.zeros((10, 20, 3)), np.zeros((30, 40, 3))]
+
+    # act
+    predictions = predictor.predict_batch(images)
+
+    # assert
+    assert [(p[0].x2, p[0].y2) for p in predictions] == [(20, 10), (40, 30)]
+
+
+@pytest.mark.unit
+def test_predict_raises_runtime_error_when_worker_fails(predictor):
+    """Tests that an error in the worker process is raised as a RuntimeError and the worker keeps serving."""
+    # act & assert
+    with pytest.raises(RuntimeError):
+        predictor.predict(np.zeros((0, 0, 3)))
+
+    assert len(predictor.predict(np.zeros((5, 5, 3)))) == 1
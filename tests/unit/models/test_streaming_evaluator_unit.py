@@ -8,7 +8,9 @@ from src.data.dataclasses.bbox import BBox
 from src.data.dataclasses.source_metadata import SourceMetadata
 from src.data.dataset.streams.providers.stream_provider import StreamProvider
 from src.data.dataset.streams.stream import Stream
+from src.models.early_stopping_config import EarlyStoppingConfig
 from src.models.prediction import Prediction
+from src.models.prediction_store import PredictionStore
 from src.models.predictor import Predictor
 from src.models.streaming_evaluator import StreamingEvaluator
 from tests.utils.dummy_annotation_label import DummyAnnotationLabel
@@ -71,4 +73,92 @@ def test_streaming_evaluator_produces_correct_confusion_matrix():
     predictor = DummyPredictor()
 
     # act
-    evaluator.evaluate(predictor)
\ No newline at end of file
+    evaluator.evaluate(predictor)
+
+class CountingStreamProvider(DummyStreamProvider):
+    """Dummy StreamProvider counting the number of streams provided."""
+
+    def __init__(self):
+        self.n_streams = 0
+
+    def get_stream(self) -> Stream[AnnotatedFrame]:
+        self.n_streams += 1
+        return super().get_stream()
+
+
+def test_evaluate_many_reads_stream_once_and_saves_predictions_per_model(tmp_path):
+    """Tests that evaluating several predictors reads one stream and saves the predictions of each predictor."""
+    # arrange
+    provider = CountingStreamProvider()
+    evaluator = StreamingEvaluator(
+        stream_provider=provider,
+        classes=["CODING", "DEBUGGING", "BACKGROUND"],
+        output_dir=str(tmp_path)
+    )
+
+    # act
+    evaluator.evaluate_many({"first": DummyPredictor(), "second": DummyPredictor()}, epoch=3)
+    evaluator.close()
+
+    # assert
+    assert provider.n_streams == 1
+    for name in ["first", "second"]:
+        store = PredictionStore(str(tmp_path / "predictions" / name / "epoch_3"))
+        assert len(store) == 1
+        assert len(store.get_frame(0)[0]) == 3
+        assert (tmp_path / "tensorboard" / name).is_dir()
+
+
+class ManyVideosStream(Stream[AnnotatedFrame]):
+    """Dummy stream of frames from several videos, counting the frames read."""
+
+    def __init__(self, n_frames: int, frames_per_video: int):
+        self.n_frames = n_frames
+        self.frames_per_video = frames_per_video
+        self.n_read = 0
+
+    def read(self) -> Optional[AnnotatedFrame]:
+        if self.n_read >= self.n_frames:
+            return None
+
+        frame = AnnotatedFrame(
+            source=SourceMetadata(source_id=f"video_{self.n_read // self.frames_per_video}",
+                                  frame_resolution=(640, 640)),
+            index=self.n_read % self.frames_per_video,
+            frame=DummyFrameGenerator.generate(640, 640),
+            annotations=[AnnotatedBBox(cls=DummyAnnotationLabel.CODING, bbox=BBox(x=20, y=30, width=40, height=60))]
+        )
+        self.n_read += 1
+
+        return frame
+
+
+class ManyVideosStreamProvider(StreamProvider[AnnotatedFrame]):
+    """Dummy StreamProvider for ManyVideosStream streams."""
+
+    def __init__(self):
+        self.stream = ManyVideosStream(n_frames=64, frames_per_video=4)
+
+    def get_stream(self) -> Stream[AnnotatedFrame]:
+        return self.stream
+
+
+def test_quick_evaluation_stops_once_intervals_are_narrow(tmp_path):
+    """Tests that a quick evaluation stops reading the stream once the confidence intervals are narrow enough."""
+    # arrange
+    provider = ManyVideosStreamProvider()
+    evaluator = StreamingEvaluator(
+        stream_provider=provider,
+        classes=["CODING", "DEBUGGING", "BACKGROUND"],
+        output_dir=str(tmp_path),
+        batch_size=4,
+        save_predictions=False,
+        early_stopping=EarlyStoppingConfig(max_ci_width=1.0, min_videos=3, check_interval=1, n_resamples=20)
+    )
+
+    # act
+    evaluator.evaluate(DummyPredictor(), epoch=1, full=False)
+    evaluator.close()
+
+    # assert
+    assert provider.stream.n_read == 12
@@ -0,0 +1,70 @@
+import pytest
+import torch
+from torchvision.models.detection import FasterRCNN
+from torchvision.models.detection.backbone_utils import resnet_fpn_backbone
+
+from src.models.feature_cache import FeatureCache
+from src.models.twod.rcnn.faster.cached_backbone_model import CachedBackboneModel
+from src.models.twod.rcnn.faster.streaming_dataset import FRAME_KEY
+
+
+@pytest.fixture
+def model():
+    """Fixture to provide a small Faster R-CNN model in training mode."""
+    torch.manual_seed(0)
+    backbone = resnet_fpn_backbone(backbone_name="resnet18", weights=None, trainable_layers=0)
+    model = FasterRCNN(backbone, num_classes=3, min_size=64, max_size=64)
+    return model.train()
+
+
+@pytest.fixture
+def batch():
+    """Fixture to provide a batch of images and targets."""
+    images = [torch.rand(3, 48, 64)]
+    targets = [{
+        "boxes": torch.tensor([[4.0, 6.0, 30.0, 40.0]]),
+        "labels": torch.tensor([1]),
+        FRAME_KEY: "video/0"
+    }]
+    return images, targets
+
+
+@pytest.mark.unit
+def test_losses_match_full_forward_pass(tmp_path, model, batch):
+    """Tests that the losses computed through the cache match those of the full model."""
+    # arrange
+    images, targets = batch
+    cached_model = CachedBackboneModel(model, FeatureCache(str(tmp_path)))
+
+    # act
+    torch.manual_seed(1)
+    expected = model(images, targets)
+    torch.manual_seed(1)
+    first = cached_model.compute_losses(images, targets)
+    torch.manual_seed(1)
+    second = cached_model.compute_losses(images, targets)
+
+    # assert
+    for name, loss in expected.items():
+        assert first[name].item() == pytest.approx(loss.item(), rel=1e-5)
+        assert second[name].item() == pytest.approx(loss.item(), rel=1e-2)
+
+
+@pytest.mark.unit
+def test_backbone_runs_once_per_frame(tmp_path, model, batch):
+    """Tests that the backbone only runs for frames missing from the cache."""
+    # arrange
+    images, targets = batch
+    cache = FeatureCache(str(tmp_path))
+    cached_model = CachedBackboneModel(model, cache)
+    calls = []
+    model.backbone.register_forward_hook(lambda *_: calls.append(1))
+
+    # act
+    for _ in range(3):
+        cached_model.compute_losses(images, targets)
+
+    # assert
+    assert len(calls) == 1
+    assert "video/0" in cache
+    cache.close()
@@ -0,0 +1,118 @@
+from typing import List, Dict
+
+import numpy as np
+import pytest
+import torch
+from torchvision.models.detection import FasterRCNN
+from torchvision.models.detection.backbone_utils import resnet_fpn_backbone
+
+from src.models.cpu_optimization_config import CPUOptimizationConfig
+from src.models.twod.rcnn.faster.faster_rcnn_predictor import FasterRCNNPredictor
+
+
+class DummyModel(torch.nn.Module):
+    """Dummy detection model returning fixed outputs, scaled by the mean of each image."""
+
+    def __init__(self):
+        super().__init__()
+        self.n_calls = 0
+
+    def forward(self, images: List[torch.Tensor]) -> List[Dict[str, torch.Tensor]]:
+        self.n_calls += 1
+        return [
+            {
+                "boxes": torch.tensor([[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0]]) * image.mean(),
+                "scores": torch.tensor([0.9, 0.2]),
+                "labels": torch.tensor([1, 2])
+            }
+            for image in images
+        ]
+
+
+@pytest.fixture
+def images():
+    """Fixture to provide a batch of random images."""
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, (8, 8, 3), dtype=np.uint8) for _ in range(3)]
+
+
+@pytest.mark.unit
+def test_predict_batch_runs_single_forward_pass_and_thresholds(images):
+    """Tests that predict_batch runs the whole batch in one forward pass and keeps only confident predictions."""
+    # arrange
+    model = DummyModel()
+    predictor = FasterRCNNPredictor(model, device=torch.device("cpu"), conf_thresh=0.5, class_shift=-1)
+
+    # act
+    predictions = predictor.predict_batch(images)
+
+    # assert
+    assert model.n_calls == 1
+    assert len(predictions) == len(images)
+    for image_predictions in predictions:
+        assert len(image_predictions) == 1
+        assert image_predictions[0].cls == 0
+        assert image_predictions[0].conf == pytest.approx(0.9)
+
+
+@pytest.mark.unit
+def test_predict_batch_matches_predict(images):
+    """Tests that predict_batch gives the same predictions as predicting each image separately."""
+    # arrange
+    predictor = FasterRCNNPredictor(DummyModel(), device=torch.device("cpu"), conf_thresh=0.1)
+
+    # act
+    batched = predictor.predict_batch(images)
+    single = [predictor.predict(image) for image in images]
+
+    # assert
+    for batch_preds, single_preds in zip(batched, single):
+        assert len(batch_preds) == len(single_preds) == 2
+        for b, s in zip(batch_preds, single_preds):
+            assert (b.x1, b.y1, b.x2, b.y2) == pytest.approx((s.x1, s.y1, s.x2, s.y2))
+            assert b.cls == s.cls
+
+
+@pytest.mark.unit
+def test_predict_batch_of_no_images_returns_empty_list():
+    """Tests that predict_batch returns an empty list for an empty batch."""
+    # arrange
+    model = DummyModel()
+    predictor = FasterRCNNPredictor(model, device=torch.device("cpu"))
+
+    # act
+    predictions = predictor.predict_batch([])
+
+    # assert
+    assert predictions == []
+    assert model.n_calls == 0
+
+
+@pytest.mark.unit
+def test_optimized_predictor_matches_eager_predictor(images):
+    """Tests that the CPU-optimized predictor gives nearly the same predictions as the eager predictor."""
+    # arrange
+    torch.manual_seed(0)
+    backbone = resnet_fpn_backbone(backbone_name="resnet18", weights=None, trainable_layers=0)
+    model = FasterRCNN(backbone, num_classes=3, min_size=64, max_size=64, box_score_thresh=0.0).eval()
+    eager = FasterRCNNPredictor(model, device=torch.device("cpu"), conf_thresh=0.0)
+    optimized = FasterRCNNPredictor(model, device=torch.device("cpu"), conf_thresh=0.0,
+                                    optimization=CPUOptimizationConfig())
+
+    # act
+    expected = eager.predict_batch(images)
+    actual = optimized.predict_batch(images)
+
+    # assert
+    for expected_preds, actual_preds in zip(expected, actual):
+        assert len(actual_preds) > 0
+        assert actual_preds[0].cls == expected_preds[0].cls
+        assert actual_preds[0].conf == pytest.approx(expected_preds[0].conf, abs=0.05)
+
+
+@pytest.mark.unit
+def test_optimization_requires_cpu_device():
+    """Tests that CPU optimizations are rejected for other devices."""
+    # act & assert
+    with pytest.raises(ValueError):
+        FasterRCNNPredictor(DummyModel(), device=torch.device("cuda"), optimization=CPUOptimizationConfig())
@@ -0,0 +1,82 @@
+from typing import Optional
+
+import numpy as np
+import pytest
+from torch.utils.data import DataLoader
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.data.dataclasses.annotated_frame import AnnotatedFrame
+from src.data.dataclasses.bbox import BBox
+from src.data.dataclasses.source_metadata import SourceMetadata
+from src.data.dataset.streams.closable_stream import ClosableStream
+from src.data.dataset.streams.factories.stream_factory import ClosableStreamFactory
+from src.data.dataset.streams.providers.ranked_stream_provider import RankedStreamProvider
+from src.data.dataset.streams.providers.reusable_stream_provider import ReusableStreamProvider
+from src.models.twod.rcnn.faster.streaming_dataset import StreamingDataset
+from tests.utils.dummy_annotation_label import DummyAnnotationLabel
+
+
+class ShardStream(ClosableStream[AnnotatedFrame]):
+    """Dummy stream of the frames with indices in one shard, frame i belonging to shard i % world_size."""
+
+    def __init__(self, rank: int, world_size: int, n_frames: int):
+        self._indices = iter(range(rank, n_frames, world_size))
+
+    def read(self) -> Optional[AnnotatedFrame]:
+        index = next(self._indices, None)
+        if index is None:
+            return None
+
+        return AnnotatedFrame(
+            source=SourceMetadata(source_id="video", frame_resolution=(4, 4)),
+            index=index,
+            frame=np.zeros((4, 4, 3), dtype=np.uint8),
+            annotations=[AnnotatedBBox(cls=DummyAnnotationLabel.CODING, bbox=BBox(x=index, y=0, width=1, height=1))]
+        )
+
+    def close(self) -> None:
+        pass
+
+
+class ShardStreamFactory(ClosableStreamFactory[AnnotatedFrame]):
+    """Dummy factory of ShardStream streams."""
+
+    def __init__(self, rank: int, world_size: int, n_frames: int = 12):
+        self._rank = rank
+        self._world_size = world_size
+        self._n_frames = n_frames
+
+    def create_stream(self) -> ClosableStream[AnnotatedFrame]:
+        return ShardStream(self._rank, self._world_size, self._n_frames)
+
+
+def collate_fn(batch):
+    """Collates a batch of images and targets into a tuple of images and a tuple of targets."""
+    return tuple(zip(*batch))
+
+
+@pytest.mark.unit
+def test_workers_stream_disjoint_shards():
+    """Tests that each data loader worker streams its own shard, together yielding every frame once."""
+    # arrange
+    dataset = StreamingDataset(RankedStreamProvider(ShardStreamFactory), n_batches=12)
+    loader = DataLoader(dataset, batch_size=1, collate_fn=collate_fn, num_workers=2)
+
+    # act
+    indices = [int(targets[0]["boxes"][0, 0]) for _, targets in loader]
+
+    # assert
+    assert len(indices) == 12
+    assert sorted(indices) == list(range(12))
+
+
+@pytest.mark.unit
+def test_workers_require_ranked_stream_provider():
+    """Tests that loading with several workers fails if the stream cannot be split between them."""
+    # arrange
+    dataset = StreamingDataset(ReusableStreamProvider(ShardStream(0, 1, 12)), n_batches=12)
+    loader = DataLoader(dataset, batch_size=1, collate_fn=collate_fn, num_workers=1)
+
+    # act & assert
+    with pytest.raises(RuntimeError):
+        list(loader)
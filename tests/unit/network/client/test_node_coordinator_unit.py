@@ -0,0 +1,51 @@
+import pytest
+
+from src.network.client.node_coordinator import NodeCoordinator
+
+
+@pytest.fixture
+def addresses():
+    """Fixture to provide node addresses."""
+    return ["10.0.0.1", "10.0.0.2:50052", "10.0.0.3"]
+
+
+@pytest.mark.unit
+def test_each_node_is_initially_assigned_one_shard(addresses):
+    """Tests that shard i is initially assigned to node i, and the catalog is split into one shard per node."""
+    # arrange
+    coordinator = NodeCoordinator(addresses)
+
+    # act
+    nodes = [coordinator.get_node(i) for i in range(coordinator.n_shards())]
+
+    # assert
+    assert nodes == addresses
+    assert coordinator.get_shard(1).count == len(addresses)
+
+
+@pytest.mark.unit
+def test_report_failure_reassigns_shards_to_alive_nodes(addresses):
+    """Tests that the shards of a failed node are reassigned to the nodes still alive."""
+    # arrange
+    coordinator = NodeCoordinator(addresses)
+
+    # act
+    coordinator.report_failure(addresses[1])
+
+    # assert
+    assert coordinator.get_node(1) in (addresses[0], addresses[2])
+    assert coordinator.get_node(0) == addresses[0]
+    assert coordinator.get_alive_nodes() == [addresses[0], addresses[2]]
+
+
+@pytest.mark.unit
+def test_get_node_raises_when_all_nodes_failed(addresses):
+    """Tests that get_node() raises a ConnectionError when every node has failed."""
+    # arrange
+    coordinator = NodeCoordinator(addresses)
+    for address in addresses:
+        coordinator.report_failure(address)
+
+    # act & assert
+    with pytest.raises(ConnectionError):
+        coordinator.get_node(0)
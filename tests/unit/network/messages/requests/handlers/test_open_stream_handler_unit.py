@@ -0,0 +1,69 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.data.dataclasses.catalog_shard import CatalogShard
+from src.data.dataset.dataset_split import DatasetSplit
+from src.network.messages.requests.handlers.open_stream_handler import OpenStreamHandler
+from src.network.messages.requests.open_stream_request import OpenStreamRequest
+from src.network.messages.responses.response_status import ResponseStatus
+
+
+@pytest.fixture
+def stream_factory():
+    """Fixture to provide a ManagedStreamFactory instance."""
+    return Mock()
+
+
+@pytest.fixture
+def stream_factories(stream_factory):
+    """Fixture to provide a DatasetStreamFactories instance."""
+    factories = Mock()
+    factories.for_split.return_value = stream_factory
+    return factories
+
+
+@pytest.mark.unit
+def test_handle_gives_ranks_disjoint_shards(stream_factories, stream_factory):
+    """Tests that handle() assigns each rank a disjoint shard of the catalog."""
+    # arrange
+    handler = OpenStreamHandler(Mock(), stream_factories)
+    keys = [f"video_{i}" for i in range(200)]
+
+    # act
+    shards = []
+    for rank in range(4):
+        response = handler.handle(OpenStreamRequest(split=DatasetSplit.TRAIN, rank=rank, world_size=4))
+        assert response.status == ResponseStatus.SUCCESS
+        shards.append(stream_factory.create_stream.call_args.kwargs["shard"])
+
+    # assert
+    for key in keys:
+        assert sum(shard.contains(key) for shard in shards) == 1
+
+
+@pytest.mark.unit
+def test_handle_splits_requested_shard_between_ranks(stream_factories, stream_factory):
+    """Tests that handle() splits an explicitly requested shard between the ranks."""
+    # arrange
+    handler = OpenStreamHandler(Mock(), stream_factories)
+    shard = CatalogShard(index=1, count=3)
+
+    # act
+    handler.handle(OpenStreamRequest(split=DatasetSplit.TRAIN, shard=shard, rank=1, world_size=2))
+
+    # assert
+    stream_factory.create_stream.assert_called_once_with(encoding=None, shard=shard.split(1, 2))
+
+
+@pytest.mark.unit
+def test_handle_passes_shard_unchanged_without_distribution(stream_factories, stream_factory):
+    """Tests that handle() passes the requested shard unchanged for a single rank."""
+    # arrange
+    handler = OpenStreamHandler(Mock(), stream_factories)
+
+    # act
+    handler.handle(OpenStreamRequest(split=DatasetSplit.TRAIN))
+
+    # assert
+    stream_factory.create_stream.assert_called_once_with(encoding=None, shard=None)
@@ -0,0 +1,73 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.data.dataset.dataset_split import DatasetSplit
+from src.network.server.session.session import Session
+from src.network.server.session.session_registry import SessionRegistry
+
+
+@pytest.fixture
+def stream():
+    """Fixture to provide a mock managed stream."""
+    return MagicMock()
+
+
+@pytest.fixture
+def session(stream):
+    """Fixture to provide a session with a train stream."""
+    return Session(
+        client_address="127.0.0.1",
+        created_at=time.time(),
+        streams={DatasetSplit.TRAIN: stream, DatasetSplit.VAL: None, DatasetSplit.TEST: None}
+    )
+
+
+@pytest.mark.unit
+def test_reattach_returns_detached_session_without_cleanup(session, stream):
+    """Tests that reattach() returns a detached session within the grace period, keeping its streams alive."""
+    # arrange
+    registry = SessionRegistry(grace_period=0.1)
+    registry.detach(session)
+
+    # act
+    reattached = registry.reattach(session.get_token())
+    time.sleep(0.2)
+
+    # assert
+    assert reattached is session
+    assert registry.n_detached() == 0
+    stream.stop.assert_not_called()
+
+
+@pytest.mark.unit
+def test_detached_session_is_cleaned_up_after_grace_period(session, stream):
+    """Tests that a detached session is cleaned up once the grace period passes, and can no longer be reattached."""
+    # arrange
+    registry = SessionRegistry(grace_period=0.05)
+    registry.detach(session)
+
+    # act
+    time.sleep(0.2)
+    reattached = registry.reattach(session.get_token())
+
+    # assert
+    assert reattached is None
+    stream.stop.assert_called_once()
+
+
+@pytest.mark.unit
+def test_adopt_moves_streams_and_token(session, stream):
+    """Tests that adopting a session takes over its streams and resumption token."""
+    # arrange
+    new_session = Session(client_address="127.0.0.1", created_at=time.time(), streams={split: None for split in DatasetSplit})
+
+    # act
+    new_session.adopt(session)
+    session.cleanup()
+
+    # assert
+    assert new_session.get_stream(DatasetSplit.TRAIN) is stream
+    assert new_session.get_token() == session.get_token()
+    stream.stop.assert_not_called()
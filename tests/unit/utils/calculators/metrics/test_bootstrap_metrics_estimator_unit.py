@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from src.models.evaluation_metrics import EvaluationMetrics
+from src.utils.calculators.metrics.bootstrap_metrics_estimator import BootstrapMetricsEstimator
+
+
+def generate_frame(rng: np.random.Generator):
+    """Generates predictions and ground truths for a synthetic frame, with jittered and spurious predictions."""
+    n_gts = rng.integers(0, 4)
+    xy = rng.uniform(0, 500, (n_gts, 2))
+    gts = np.hstack([xy, xy + 50, rng.integers(0, 3, (n_gts, 1))])
+
+    jittered = gts[:, :4] + rng.normal(0, 6, (n_gts, 4))
+    spurious = np.hstack([rng.uniform(0, 500, (1, 2)), rng.uniform(500, 600, (1, 2))])
+    boxes = np.vstack([jittered, spurious])
+    classes = np.vstack([gts[:, 4:], rng.integers(0, 3, (1, 1))])
+    preds = np.hstack([boxes, classes, rng.random((len(boxes), 1))])
+
+    return preds, gts
+
+
+@pytest.fixture
+def frames():
+    """Fixture to provide video ids, predictions and ground truths for 20 videos of 10 frames each."""
+    rng = np.random.default_rng(0)
+    generated = [generate_frame(rng) for _ in range(200)]
+    video_ids = [f"video_{i // 10}" for i in range(200)]
+    return video_ids, [p for p, _ in generated], [g for _, g in generated]
+
+
+@pytest.mark.unit
+def test_point_estimates_match_evaluation_metrics(frames):
+    """Tests that the point estimates equal the macro F1 and mAP computed on all frames."""
+    # arrange
+    video_ids, preds, gts = frames
+    estimator = BootstrapMetricsEstimator(num_classes=3, n_resamples=50, seed=0)
+    metrics = EvaluationMetrics(classes=["a", "b", "c"])
+
+    # act
+    for i in range(0, len(preds), 8):
+        estimator.update(video_ids[i:i + 8], preds[i:i + 8], gts[i:i + 8])
+        metrics.update(preds[i:i + 8], gts[i:i + 8])
+    estimate = estimator.estimate()
+
+    # assert
+    expected = metrics.compute()
+    assert estimator.get_n_videos() == 20
+    assert estimate["macro_f1"][0] == pytest.approx(expected["macro_f1"])
+    assert estimate["mAP"][0] == pytest.approx(expected["mAP"])
+    for point, low, high in estimate.values():
+        assert low <= high
+        assert low - 0.05 <= point <= high + 0.05
+
+
+@pytest.mark.unit
+def test_intervals_narrow_with_more_videos(frames):
+    """Tests that the confidence intervals are narrower when more videos have been evaluated."""
+    # arrange
+    video_ids, preds, gts = frames
+    few = BootstrapMetricsEstimator(num_classes=3, n_resamples=200, seed=0)
+    many = BootstrapMetricsEstimator(num_classes=3, n_resamples=200, seed=0)
+
+    # act
+    few.update(video_ids[:40], preds[:40], gts[:40])
+    many.update(video_ids, preds, gts)
+
+    # assert
+    for metric in ["macro_f1", "mAP"]:
+        _, few_low, few_high = few.estimate()[metric]
+        _, many_low, many_high = many.estimate()[metric]
+        assert many_high - many_low < few_high - few_low
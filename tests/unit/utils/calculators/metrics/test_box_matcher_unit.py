@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from scipy.optimize import linear_sum_assignment
+
+from src.utils.calculators.metrics.box_matcher import BoxMatcher
+from src.utils.calculators.metrics.iou_calculator import IoUCalculator
+
+
+def random_boxes(rng: np.random.Generator, n: int) -> np.ndarray:
+    """Generates random boxes clustered in a small area, so that many of them overlap."""
+    xy = rng.uniform(0, 300, (n, 2))
+    return np.hstack([xy, xy + rng.uniform(20, 120, (n, 2))])
+
+
+def reference_match(pred_boxes: np.ndarray, gt_boxes: np.ndarray, iou_thresh: float) -> np.ndarray:
+    """Matches the predictions of a single frame with the Hungarian algorithm."""
+    matches = np.full(len(pred_boxes), -1)
+    if len(pred_boxes) > 0 and len(gt_boxes) > 0:
+        ious = IoUCalculator.calculate(pred_boxes, gt_boxes)
+        for pi, gi in zip(*linear_sum_assignment(1.0 - ious)):
+            if ious[pi, gi] >= iou_thresh:
+                matches[pi] = gi
+    return matches
+
+
+@pytest.mark.unit
+def test_match_equals_per_frame_hungarian_matching():
+    """Tests that batched matching gives the same matches as running the Hungarian algorithm on every frame."""
+    # arrange
+    rng = np.random.default_rng(0)
+    frames = [(random_boxes(rng, rng.integers(0, 6)), random_boxes(rng, rng.integers(0, 6))) for _ in range(300)]
+    pred_offsets = np.cumsum([0] + [len(p) for p, _ in frames])
+    gt_offsets = np.cumsum([0] + [len(g) for _, g in frames])
+
+    # act
+    matches = BoxMatcher.match(
+        pred_boxes=np.concatenate([p for p, _ in frames]),
+        pred_offsets=pred_offsets,
+        gt_boxes=np.concatenate([g for _, g in frames]),
+        gt_offsets=gt_offsets,
+        iou_thresh=0.3
+    )
+
+    # assert
+    for i, (preds, gts) in enumerate(frames):
+        expected = reference_match(preds, gts, 0.3)
+        expected = np.where(expected >= 0, expected + gt_offsets[i], -1)
+        np.testing.assert_array_equal(matches[pred_offsets[i]:pred_offsets[i + 1]], expected)
+
+
+@pytest.mark.unit
+def test_match_keeps_overlaps_above_threshold_only():
+    """Tests that non-ambiguous predictions are matched only if their iou reaches the threshold."""
+    # arrange
+    pred_boxes = np.array([[0, 0, 10, 10], [100, 100, 110, 104], [0, 0, 10, 10]], dtype=np.float64)
+    gt_boxes = np.array([[0, 0, 10, 10], [100, 100, 110, 110], [50, 50, 60, 60]], dtype=np.float64)
+
+    # act
+    matches = BoxMatcher.match(
+        pred_boxes=pred_boxes,
+        pred_offsets=np.array([0, 2, 3]),
+        gt_boxes=gt_boxes,
+        gt_offsets=np.array([0, 2, 3]),
+        iou_thresh=0.5
+    )
+
+    # assert
+    np.testing.assert_array_equal(matches, [0, -1, -1])
+
+
+@pytest.mark.unit
+def test_match_with_no_ground_truths_leaves_predictions_unmatched():
+    """Tests that predictions are unmatched when there are no ground truths."""
+    # act
+    matches = BoxMatcher.match(
+        pred_boxes=np.array([[0, 0, 10, 10]], dtype=np.float64),
+        pred_offsets=np.array([0, 1]),
+        gt_boxes=np.zeros((0, 4)),
+        gt_offsets=np.array([0, 0]),
+        iou_thresh=0.5
+    )
+
+    # assert
+    np.testing.assert_array_equal(matches, [-1])
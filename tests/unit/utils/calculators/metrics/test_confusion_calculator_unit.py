@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from src.utils.calculators.metrics.confusion_calculator import ConfusionCalculator
@@ -39,4 +40,22 @@ def test_compute_matrix_successfully(predictions, targets):
     assert matrix[4][1] == 1
     assert matrix[4][4] == 1
 
-    print(f"\n{matrix}")
\ No newline at end of file
+    print(f"\n{matrix}")
+
+@pytest.mark.unit
+def test_compute_matrix_from_matches_counts_unmatched_as_background():
+    """Tests that unmatched predictions and ground truths are counted against the background class."""
+    # arrange
+    pred_classes = np.array([0, 1, 1])
+    gt_classes = np.array([0, 0, 1])
+    matches = np.array([0, 1, -1])
+
+    # act
+    matrix = ConfusionCalculator.calculate_from_matches(pred_classes, gt_classes, matches, num_classes=3)
+
+    # assert
+    np.testing.assert_array_equal(matrix, [
+        [1, 1, 0],
+        [0, 0, 1],
+        [0, 1, 0]
+    ])
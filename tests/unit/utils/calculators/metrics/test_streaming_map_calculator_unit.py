@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from src.utils.calculators.metrics.map_calculator import MAPCalculator
+from src.utils.calculators.metrics.streaming_map_calculator import StreamingMAPCalculator, COCO_IOU_THRESHOLDS
+
+
+def generate_image(rng: np.random.Generator, n_classes: int):
+    """Generates predictions and ground truths for a random image."""
+    n_gts = rng.integers(0, 5)
+    xy = rng.uniform(0, 800, (n_gts, 2))
+    gts = np.hstack([xy, xy + rng.uniform(40, 200, (n_gts, 2)), rng.integers(0, n_classes, (n_gts, 1))])
+
+    matched = np.repeat(gts, rng.integers(0, 3, n_gts), axis=0)
+    matched[:, :4] += rng.normal(0, 12, (len(matched), 4))
+
+    n_spurious = rng.integers(0, 3)
+    xy = rng.uniform(0, 800, (n_spurious, 2))
+    spurious = np.hstack([xy, xy + rng.uniform(40, 200, (n_spurious, 2)), rng.integers(0, n_classes, (n_spurious, 1))])
+
+    boxes = np.vstack([matched, spurious])
+    return np.hstack([boxes, rng.random((len(boxes), 1))]), gts
+
+
+@pytest.fixture
+def images():
+    """Fixture to provide predictions and ground truths for a set of random images."""
+    rng = np.random.default_rng(0)
+    return [generate_image(rng, 3) for _ in range(150)]
+
+
+@pytest.mark.unit
+def test_perfect_predictions_give_map_of_one():
+    """Tests that predictions equal to the ground truths give an AP of 1 at every threshold."""
+    # arrange
+    calculator = StreamingMAPCalculator(num_classes=2)
+    gts = np.array([[10, 10, 50, 50, 0], [60, 60, 90, 120, 1]], dtype=np.float32)
+    preds = np.array([[10, 10, 50, 50, 0, 0.9], [60, 60, 90, 120, 1, 0.8]], dtype=np.float32)
+
+    # act
+    calculator.update(preds, gts)
+    result = calculator.compute()
+
+    # assert
+    assert result["mAP"] == pytest.approx(1.0)
+    assert all(t["mAP"] == pytest.approx(1.0) for t in result["per_threshold"].values())
+
+
+@pytest.mark.unit
+def test_ground_truth_is_matched_by_most_confident_hit_per_threshold():
+    """Tests that each ground truth is matched by the most confident prediction overlapping it above each threshold."""
+    # arrange
+    calculator = StreamingMAPCalculator(num_classes=1, iou_thresholds=[0.5, 0.75])
+    gts = np.array([[0, 0, 100, 100, 0]], dtype=np.float32)
+    preds = np.array([
+        [0, 0, 100, 70, 0, 0.95],
+        [0, 0, 100, 100, 0, 0.9]
+    ], dtype=np.float32)
+
+    # act
+    calculator.update(preds, gts)
+    result = calculator.compute()
+
+    # assert
+    assert result["per_threshold"][0.5]["mAP"] == pytest.approx(1.0)
+    assert result["per_threshold"][0.75]["mAP"] == pytest.approx(0.5)
+    assert result["mAP"] == pytest.approx(0.75)
+
+
+@pytest.mark.unit
+def test_batched_updates_match_single_image_updates(images):
+    """Tests that updating with batches gives the same APs as updating one image at a time."""
+    # arrange
+    single = StreamingMAPCalculator(num_classes=3)
+    batched = StreamingMAPCalculator(num_classes=3)
+
+    # act
+    for preds, gts in images:
+        single.update(preds, gts)
+    for i in range(0, len(images), 16):
+        batch = images[i:i + 16]
+        batched.update_batch([preds for preds, _ in batch], [gts for _, gts in batch])
+
+    # assert
+    np.testing.assert_allclose(batched.compute_ap_matrix(), single.compute_ap_matrix())
+
+
+@pytest.mark.unit
+def test_matches_mean_average_precision_package(images):
+    """Tests that the APs match the mean_average_precision package when using its pixel convention."""
+    # arrange
+    calculator = StreamingMAPCalculator(num_classes=3, pixel_offset=1.0)
+    reference = MAPCalculator(num_classes=3)
+
+    # act
+    for preds, gts in images:
+        calculator.update(preds, gts)
+        reference.update(preds, gts)
+    expected = reference.metric.value(iou_thresholds=list(COCO_IOU_THRESHOLDS))
+
+    # assert
+    expected_aps = [[expected[t][c]["ap"] for c in range(3)] for t in COCO_IOU_THRESHOLDS]
+    np.testing.assert_allclose(calculator.compute_ap_matrix(), expected_aps, atol=1e-6)
+
+
+@pytest.mark.unit
+def test_reset_clears_accumulated_data():
+    """Tests that resetting the calculator clears all predictions and ground truths."""
+    # arrange
+    calculator = StreamingMAPCalculator(num_classes=1)
+    calculator.update(np.array([[0, 0, 10, 10, 0, 1.0]]), np.array([[0, 0, 10, 10, 0]]))
+
+    # act
+    calculator.reset()
+    result = calculator.compute()
+
+    # assert
+    assert result["mAP"] == 0.0
+    assert all(v == 0.0 for v in result["per_class_ap"].values())
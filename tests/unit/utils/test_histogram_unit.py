@@ -0,0 +1,43 @@
+import math
+
+import pytest
+
+from src.utils.histogram import Histogram
+
+
+@pytest.mark.unit
+def test_values_are_counted_into_buckets():
+    """Tests that recorded values are counted into the buckets of their inclusive upper bounds."""
+    # arrange
+    histogram = Histogram([1, 2, 4])
+
+    # act
+    for value in [0.5, 1, 1.5, 3, 4, 10]:
+        histogram.record(value)
+
+    # assert
+    assert histogram.get_counts() == [2, 1, 2, 1]
+    assert histogram.count() == 6
+    assert histogram.mean() == pytest.approx(20 / 6)
+
+
+@pytest.mark.unit
+def test_percentile_returns_bucket_upper_bound():
+    """Tests that percentile() returns the upper bound of the bucket the percentile falls in."""
+    # arrange
+    histogram = Histogram([1, 2, 4])
+    for value in [1] * 90 + [3] * 9 + [100]:
+        histogram.record(value)
+
+    # act & assert
+    assert histogram.percentile(50) == 1
+    assert histogram.percentile(99) == 4
+    assert histogram.percentile(100) == math.inf
+
+
+@pytest.mark.unit
+def test_unsorted_bounds_raises():
+    """Tests that creating a histogram with bounds that are not strictly increasing raises."""
+    # act & assert
+    with pytest.raises(ValueError):
+        Histogram([1, 1, 2])
@@ -0,0 +1,24 @@
+import pytest
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.data.dataclasses.bbox import BBox
+from src.models.prediction import Prediction
+from src.utils.visualization.samplers.class_quota_sampler import ClassQuotaSampler
+from tests.utils.dummy_annotation_label import DummyAnnotationLabel
+
+
+@pytest.mark.unit
+def test_samples_frames_until_class_quotas_are_full():
+    """Tests that frames are sampled only while some class in them is below its quota."""
+    # arrange
+    sampler = ClassQuotaSampler(max_per_class=2)
+    coding = [AnnotatedBBox(cls=DummyAnnotationLabel.CODING, bbox=BBox(x=0, y=0, width=10, height=10))]
+    debugging = [Prediction(x1=0, y1=0, x2=10, y2=10, conf=0.9, cls=DummyAnnotationLabel.DEBUGGING.value)]
+
+    # act
+    coding_sampled = [sampler.sample([], coding, has_errors=False) for _ in range(3)]
+    debugging_sampled = sampler.sample(debugging, coding, has_errors=False)
+
+    # assert
+    assert coding_sampled == [True, True, False]
+    assert debugging_sampled
@@ -0,0 +1,22 @@
+import pytest
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.data.dataclasses.bbox import BBox
+from src.utils.visualization.samplers.every_nth_frame_sampler import EveryNthFrameSampler
+from tests.utils.dummy_annotation_label import DummyAnnotationLabel
+
+
+@pytest.mark.unit
+def test_samples_every_nth_non_empty_frame():
+    """Tests that every nth frame with ground truths or predictions is sampled, skipping empty frames."""
+    # arrange
+    sampler = EveryNthFrameSampler(n=3)
+    gts = [AnnotatedBBox(cls=DummyAnnotationLabel.CODING, bbox=BBox(x=0, y=0, width=10, height=10))]
+
+    # act
+    empty_sampled = sampler.sample([], [], has_errors=True)
+    sampled = [sampler.sample([], gts, has_errors=False) for _ in range(7)]
+
+    # assert
+    assert not empty_sampled
+    assert sampled == [True, False, False, True, False, False, True]
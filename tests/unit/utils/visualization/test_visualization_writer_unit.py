@@ -0,0 +1,72 @@
+import os
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.data.dataclasses.annotated_bbox import AnnotatedBBox
+from src.data.dataclasses.bbox import BBox
+from src.models.prediction import Prediction
+from src.utils.visualization.visualization_writer import VisualizationWriter
+from tests.utils.dummy_annotation_label import DummyAnnotationLabel
+
+
+@pytest.fixture
+def image():
+    """Fixture to provide a blank image."""
+    return np.zeros((64, 64, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def predictions():
+    """Fixture to provide a list of predictions."""
+    return [Prediction(x1=5, y1=5, x2=30, y2=30, conf=0.9, cls=0)]
+
+
+@pytest.fixture
+def gts():
+    """Fixture to provide a list of ground truths."""
+    return [AnnotatedBBox(cls=DummyAnnotationLabel.DEBUGGING, bbox=BBox(x=10, y=10, width=20, height=20))]
+
+
+@pytest.mark.unit
+def test_submitted_images_are_written(tmp_path, image, predictions, gts):
+    """Tests that submitted images are drawn and written to disk, creating missing directories."""
+    # arrange
+    writer = VisualizationWriter(class_names=["CODING", "DEBUGGING"], n_workers=2)
+    writer.run()
+    paths = [os.path.join(tmp_path, "nested", f"frame_{i}.jpg") for i in range(5)]
+
+    # act
+    for path in paths:
+        writer.submit(image, predictions, gts, path)
+    writer.close()
+
+    # assert
+    assert writer.get_n_written() == 5
+    assert all(os.path.isfile(path) for path in paths)
+    assert not image.any()
+
+
+@pytest.mark.unit
+def test_submit_drops_images_when_too_many_are_pending(tmp_path, image, predictions, gts):
+    """Tests that submitting does not block but drops images when the pending limit is reached."""
+    # arrange
+    release = threading.Event()
+    writer = VisualizationWriter(class_names=["CODING", "DEBUGGING"], n_workers=1, max_pending=1)
+
+    with patch("src.utils.visualization.visualization_writer.EvaluatorVisualizer.save_image",
+               side_effect=lambda **kwargs: release.wait()):
+        writer.run()
+
+        # act
+        results = [writer.submit(image, predictions, gts, os.path.join(tmp_path, f"frame_{i}.jpg")) for i in range(10)]
+        release.set()
+        writer.close()
+
+    # assert
+    assert results[0]
+    assert not all(results)
+    assert writer.get_n_dropped() == results.count(False)
+    assert writer.get_n_written() == results.count(True)